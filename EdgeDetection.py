@@ -2,56 +2,133 @@ import numpy as np
 import cv2
 
 
-def Sobel_Filter(image):
+# Gradient kernels (before flipping) and the border each one needs
+SOBEL_KERNELS = (np.array([[-1, 0, 1],
+                           [-2, 0, 2],
+                           [-1, 0, 1]], dtype=np.float32),
+                 np.array([[-1, -2, -1],
+                           [ 0,  0,  0],
+                           [ 1,  2,  1]], dtype=np.float32))
+
+PREWITT_KERNELS = (np.array([[-1, 0, 1],
+                             [-1, 0, 1],
+                             [-1, 0, 1]], dtype=np.float32),
+                   np.array([[-1, -1, -1],
+                             [ 0,  0,  0],
+                             [ 1,  1,  1]], dtype=np.float32))
+
+ROBERTS_KERNELS = (np.array([[1, 0],
+                             [0, -1]], dtype=np.float32),
+                   np.array([[0, 1],
+                             [-1, 0]], dtype=np.float32))
+
+GRADIENT_PADDING = 1
+
+
+
+def _separate_kernel(kernel):
+    """
+    Split a rank-1 kernel into a column and a row vector.
+
+    Parameters:
+    kernel (numpy.ndarray): 2-D kernel.
+
+    Returns:
+    tuple or None: (column, row) with np.outer(column, row) == kernel, or None
+    if the kernel is not separable.
+    """
+    nonzero = np.argwhere(kernel != 0)
+    if len(nonzero) == 0:
+        return None
+    pivot_row, pivot_col = nonzero[0]
+    row = kernel[pivot_row, :]
+    column = kernel[:, pivot_col] / kernel[pivot_row, pivot_col]
+    if not np.array_equal(np.outer(column, row), kernel):
+        return None
+    return column.astype(kernel.dtype), row
+
+
+def _correlate(image_padded, kernel, height, width):
+    """
+    Slide a kernel over a padded image in whole-array passes.
+
+    Each kernel tap adds one shifted view of the padded image, so the result
+    equals summing np.multiply(region, kernel) at every pixel. Separable
+    kernels run as a row pass followed by a column pass.
+
+    Parameters:
+    image_padded (numpy.ndarray): Padded float32 image.
+    kernel (numpy.ndarray): Kernel, already flipped.
+    height (int): Output height.
+    width (int): Output width.
+
+    Returns:
+    numpy.ndarray: Filtered float32 image of shape (height, width).
+    """
+    kernel_h, kernel_w = kernel.shape
+    factors = _separate_kernel(kernel)
+
+    if factors is not None:
+        column, row = factors
+        rows_filtered = np.zeros((height + kernel_h - 1, width), dtype=np.float32)
+        for b in range(kernel_w):
+            if row[b] != 0:
+                rows_filtered += row[b] * image_padded[:height + kernel_h - 1, b:b + width]
+        output = np.zeros((height, width), dtype=np.float32)
+        for a in range(kernel_h):
+            if column[a] != 0:
+                output += column[a] * rows_filtered[a:a + height, :]
+        return output
+
+    output = np.zeros((height, width), dtype=np.float32)
+    for a in range(kernel_h):
+        for b in range(kernel_w):
+            if kernel[a, b] != 0:
+                output += kernel[a, b] * image_padded[a:a + height, b:b + width]
+    return output
+
+
+def _apply_gradient_kernels(image, kernel_x, kernel_y, padding):
+    """
+    Apply an X/Y pair of gradient kernels to a grayscale image.
+
+    Parameters:
+    image (numpy.ndarray): Input image (grayscale).
+    kernel_x (numpy.ndarray): Flipped kernel for the X gradient.
+    kernel_y (numpy.ndarray): Flipped kernel for the Y gradient.
+    padding (int): Border added on every side (BORDER_DEFAULT).
+
+    Returns:
+    tuple: X and Y gradient magnitudes as uint8 images.
+    """
     height, width = image.shape
-    kernel_size = 3
-    padding = 1
 
     # Convert image to float32
     image = image.astype(np.float32)
 
-    # Initialize output arrays
-    x_filtered = np.zeros((height, width), dtype=np.float32)
-    y_filtered = np.zeros((height, width), dtype=np.float32)
-
     # Apply padding (use BORDER_DEFAULT for better match with OpenCV)
     image_padded = cv2.copyMakeBorder(image, padding, padding, padding, padding, borderType=cv2.BORDER_DEFAULT)
 
-    # Sobel Kernels
-    kernel_x = np.array([[-1, 0, 1], 
-                          [-2, 0, 2], 
-                          [-1, 0, 1]], dtype=np.float32)
-
-    kernel_y = np.array([[-1, -2, -1], 
-                          [ 0,  0,  0], 
-                          [ 1,  2,  1]], dtype=np.float32)
+    x_filtered = _correlate(image_padded, kernel_x, height, width)
+    y_filtered = _correlate(image_padded, kernel_y, height, width)
 
-    # Flip the kernels
-    kernel_x = np.flip(kernel_x) 
-    kernel_y = np.flip(kernel_y) 
+    # Convert to uint8 (for visualization)
+    return cv2.convertScaleAbs(x_filtered), cv2.convertScaleAbs(y_filtered)
 
 
-    # Apply convolution manually
-    for i in range(height):
-        for j in range(width):
-            region = image_padded[i:i+kernel_size, j:j+kernel_size]
-            x_filtered[i, j] = np.multiply(region, kernel_x).sum()
-            y_filtered[i, j] = np.multiply(region, kernel_y).sum()
+def Sobel_Filter(image):
+    padding = GRADIENT_PADDING
 
-    # Convert to uint8 (for visualization)
-    x_filtered_uint8 = cv2.convertScaleAbs(x_filtered)
-    y_filtered_uint8 = cv2.convertScaleAbs(y_filtered)
+    # Sobel Kernels
+    kernel_x, kernel_y = SOBEL_KERNELS
 
-    # # OpenCV's Sobel for comparison
-    # opencv_x = cv2.Sobel(image, cv2.CV_64F, 1, 0, ksize=3)
-    # opencv_y = cv2.Sobel(image, cv2.CV_64F, 0, 1, ksize=3)
+    # Flip the kernels
+    kernel_x = np.flip(kernel_x) 
+    kernel_y = np.flip(kernel_y) 
 
-    # opencv_x = cv2.convertScaleAbs(opencv_x)
-    # opencv_y = cv2.convertScaleAbs(opencv_y)
 
-    # # Check if the results match
-    # print("Does x_filtered match OpenCV? ", np.allclose(opencv_x, x_filtered_uint8, atol=1))
-    # print("Does y_filtered match OpenCV? ", np.allclose(opencv_y, y_filtered_uint8, atol=1))
+    # Apply both kernels in whole-array passes
+    x_filtered_uint8, y_filtered_uint8 = _apply_gradient_kernels(image, kernel_x, kernel_y, padding)
 
     return x_filtered_uint8, y_filtered_uint8
 
@@ -61,105 +138,32 @@ def Sobel_Filter(image):
 
 
 def Prewitt_Filter(image):
-    height, width = image.shape
-    kernel_size = 3
-    padding = 1
-
-    # Convert image to float32
-    image = image.astype(np.float32)
-
-    # Initialize output arrays
-    x_filtered = np.zeros((height, width), dtype=np.float32)
-    y_filtered = np.zeros((height, width), dtype=np.float32)
-
-    # Apply padding (use BORDER_DEFAULT for better match with OpenCV)
-    image_padded = cv2.copyMakeBorder(image, padding, padding, padding, padding, borderType=cv2.BORDER_DEFAULT)
+    padding = GRADIENT_PADDING
 
     # Prewitt Kernels
-    kernel_x = np.array([[-1, 0, 1], 
-                          [-1, 0, 1], 
-                          [-1, 0, 1]], dtype=np.float32)
-
-    kernel_y = np.array([[-1, -1, -1], 
-                          [ 0,  0,  0], 
-                          [ 1,  1,  1]], dtype=np.float32)
+    kernel_x, kernel_y = PREWITT_KERNELS
 
         # Flip the kernels
     kernel_x = np.flip(kernel_x) 
     kernel_y = np.flip(kernel_y) 
 
-    # Apply convolution manually
-    for i in range(height):
-        for j in range(width):
-            region = image_padded[i:i+kernel_size, j:j+kernel_size]
-            x_filtered[i, j] = np.multiply(region, kernel_x).sum()
-            y_filtered[i, j] = np.multiply(region, kernel_y).sum()
-
-    # Convert to uint8 (for visualization)
-    x_filtered_uint8 = cv2.convertScaleAbs(x_filtered)
-    y_filtered_uint8 = cv2.convertScaleAbs(y_filtered)
-
-    # # OpenCV's Prewitt for comparison
-    # opencv_x = cv2.filter2D(image, ddepth=-1, kernel=kernel_x)
-    # opencv_y = cv2.filter2D(image, ddepth=-1, kernel=kernel_y)
-
-    # opencv_x = cv2.convertScaleAbs(opencv_x)
-    # opencv_y = cv2.convertScaleAbs(opencv_y)
-
-    # # Check if the results match
-    # print("Does x_filtered match OpenCV? ", np.allclose(opencv_x, x_filtered_uint8, atol=1))
-    # print("Does y_filtered match OpenCV? ", np.allclose(opencv_y, y_filtered_uint8, atol=1))
-
+    # Apply both kernels in whole-array passes
+    x_filtered_uint8, y_filtered_uint8 = _apply_gradient_kernels(image, kernel_x, kernel_y, padding)
 
     return x_filtered_uint8 , y_filtered_uint8 
     
 
 def Robert_Filter(image):   
-    height, width = image.shape
-    kernel_size = 2
-    padding = 1
+    padding = GRADIENT_PADDING
 
-    # Convert image to float32
-    image = image.astype(np.float32)
-
-    # Initialize output arrays
-    x_filtered = np.zeros((height, width), dtype=np.float32)
-    y_filtered = np.zeros((height, width), dtype=np.float32)
-
-    # Apply padding 
-    image_padded = cv2.copyMakeBorder(image, padding, padding, padding, padding, borderType=cv2.BORDER_DEFAULT)
-
-    kernel_x = np.array([[1, 0],
-                        [0, -1]] , dtype=np.float32)
-    kernel_y = np.array([[0, 1],
-                        [-1, 0]] , dtype=np.float32)
+    kernel_x, kernel_y = ROBERTS_KERNELS
 
     # Flip the kernels
     kernel_x = np.flip(kernel_x) 
     kernel_y = np.flip(kernel_y) 
 
-    # Apply convolution manually
-    for i in range(height):
-        for j in range(width):
-            region = image_padded[i:i+kernel_size, j:j+kernel_size]
-            x_filtered[i, j] = np.multiply(region, kernel_x).sum()
-            y_filtered[i, j] = np.multiply(region, kernel_y).sum()
-
-    # Convert to uint8 (for visualization)
-    x_filtered_uint8 = cv2.convertScaleAbs(x_filtered)
-    y_filtered_uint8 = cv2.convertScaleAbs(y_filtered)
-
-    #     # OpenCV's Robert_Filter for comparison
-    # opencv_x = cv2.filter2D(image, ddepth=-1, kernel=kernel_x)
-    # opencv_y = cv2.filter2D(image, ddepth=-1, kernel=kernel_y)
-
-    # opencv_x = cv2.convertScaleAbs(opencv_x)
-    # opencv_y = cv2.convertScaleAbs(opencv_y)
-
-    # # Check if the results match
-    # print("Does x_filtered match OpenCV? ", np.allclose(opencv_x, x_filtered_uint8, atol=1))
-    # print("Does y_filtered match OpenCV? ", np.allclose(opencv_y, y_filtered_uint8, atol=1))
-
+    # Apply both kernels in whole-array passes
+    x_filtered_uint8, y_filtered_uint8 = _apply_gradient_kernels(image, kernel_x, kernel_y, padding)
 
     return x_filtered_uint8 , y_filtered_uint8 
     
@@ -1,22 +1,29 @@
 import cv2
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import numpy as np
-import matplotlib
-matplotlib.use('Qt5Agg')
 
-import matplotlib.pyplot as plt
-
-def calculate_histogram(image, mode):
+def calculate_histogram(image, mode, mask=None, roi=None, stride=1):
     """
     Calculate the histogram of an image manually without using OpenCV's calcHist.
 
+    All channels are counted in one np.bincount pass by offsetting the
+    values of channel i by 256 * i.
+
     Args:
         image: The input image. It can be either a grayscale or RGB image.
         mode (str): The mode of the image. It can be 'rgb' or 'gray'.
+        mask (numpy.ndarray): Optional boolean (H, W) mask; only pixels where
+            it is True are counted.
+        roi (tuple): Optional (x, y, width, height) region to count.
+        stride (int): Count every stride-th pixel along both axes. Counts
+            are scaled by stride ** 2 so they approximate the full histogram.
 
     Returns:
-        list: A list containing the histogram(s) of the image.
-              - For 'rgb' mode, it returns a list with three histograms (R, G, B).
-              - For 'gray' mode, it returns a list with a single histogram.
+        numpy.ndarray: A (channels, 256) int64 array of histogram(s).
+              - For 'rgb' mode, it has three rows (R, G, B).
+              - For 'gray' mode, it has a single row.
 
     Raises:
         ValueError: If the mode is neither 'rgb' nor 'gray'.
@@ -24,137 +31,324 @@ def calculate_histogram(image, mode):
     if mode not in ('rgb', 'gray'):
         raise ValueError("Invalid mode. Use 'rgb' or 'gray'.")
 
-    # Initialize the histogram with 256 bins (0-255)
-    histogram = [0] * 256
-
-    if mode == 'rgb':
-        # Split the image into its R, G, B channels
-        r_channel = image[:, :, 0]
-        g_channel = image[:, :, 1]
-        b_channel = image[:, :, 2]
-
-        # Calculate histogram for each channel
-        histograms = []
-        for channel in [r_channel, g_channel, b_channel]:
-            hist = [0] * 256
-            for row in channel:
-                for pixel in row:
-                    hist[pixel] += 1
-            histograms.append(hist)
-        return histograms
-    else:  # mode == 'gray'
-        # Iterate through each pixel in the grayscale image
-        for row in image:
-            for pixel in row:
-                histogram[pixel] += 1
-        return [histogram]
-
-
-def plot_histograms_as_array(hist, mode, title="Histogram"):
+    if roi is not None:
+        x, y, width, height = roi
+        image = image[y:y + height, x:x + width]
+        if mask is not None:
+            mask = mask[y:y + height, x:x + width]
+
+    if stride > 1:
+        image = image[::stride, ::stride]
+        if mask is not None:
+            mask = mask[::stride, ::stride]
+
+    num_channels = 3 if mode == 'rgb' else 1
+    pixels = image[..., :3] if mode == 'rgb' else image
+    if mask is not None:
+        pixels = pixels[mask.astype(bool)]
+    pixels = pixels.reshape(-1, num_channels).astype(np.intp)
+
+    # Offset channel i into bins [256 * i, 256 * i + 255]
+    offsets = np.arange(num_channels) * 256
+    counts = np.bincount((pixels + offsets).ravel(), minlength=256 * num_channels)
+    histograms = counts.reshape(num_channels, 256)
+
+    if stride > 1:
+        histograms = histograms * stride * stride
+    return histograms
+
+
+class ImageStatistics:
+    """
+    Histogram-derived statistics of one uint8 image.
+
+    Only the histogram needs a pass over the pixels. The CDF, min, max,
+    mean, variance, percentiles and Otsu threshold are derived from the
+    256 bins, and each is computed once, on first use. For RGB images the
+    scalar statistics describe all channels together.
+
+    Use image_statistics() to share one instance between every caller that
+    works on the same image. The image must not be modified in place
+    afterwards.
+
+    Args:
+        image (numpy.ndarray): Grayscale (H, W) or RGB (H, W, 3) uint8 image.
+
+    Raises:
+        ValueError: From min, max, percentile and triangle_threshold, if
+            the image has no pixels.
+    """
+
+    def __init__(self, image):
+        self.mode = 'rgb' if image.ndim == 3 else 'gray'
+        # Weak reference so the cache never keeps an image alive
+        self._image_ref = weakref.ref(image)
+
+    @cached_property
+    def histogram(self):
+        """(channels, 256) int64 histogram(s), as from calculate_histogram."""
+        return calculate_histogram(self._image_ref(), self.mode)
+
+    @cached_property
+    def cdf(self):
+        """(channels, 256) cumulative counts of each channel."""
+        return np.cumsum(self.histogram, axis=1)
+
+    @cached_property
+    def combined_histogram(self):
+        """(256,) counts summed over all channels."""
+        return self.histogram.sum(axis=0)
+
+    @cached_property
+    def combined_cdf(self):
+        """(256,) cumulative counts summed over all channels."""
+        return np.cumsum(self.combined_histogram)
+
+    @cached_property
+    def pixel_count(self):
+        return int(self.combined_cdf[-1])
+
+    @cached_property
+    def occupied_bins(self):
+        """Values that occur in the image, in increasing order."""
+        occupied = np.flatnonzero(self.combined_histogram)
+        if len(occupied) == 0:
+            raise ValueError("The image has no pixels.")
+        return occupied
+
+    @cached_property
+    def min(self):
+        return int(self.occupied_bins[0])
+
+    @cached_property
+    def max(self):
+        return int(self.occupied_bins[-1])
+
+    @cached_property
+    def mean(self):
+        return float(np.dot(self.combined_histogram, np.arange(256)) / self.pixel_count)
+
+    @cached_property
+    def variance(self):
+        squares = np.dot(self.combined_histogram, np.arange(256) ** 2) / self.pixel_count
+        return float(squares - self.mean ** 2)
+
+    def percentile(self, q):
+        """
+        Return the smallest value with at least q percent of the pixels at
+        or below it (np.percentile with method='inverted_cdf').
+        """
+        rank = q / 100 * self.pixel_count
+        return int(np.searchsorted(self.combined_cdf, rank, side='left')) if rank > 0 else self.min
+
+    @cached_property
+    def otsu_threshold(self):
+        """
+        Otsu's threshold: the value t that maximises the between-class
+        variance of [0, t] and [t + 1, 255].
+        """
+        p = self.combined_histogram / self.pixel_count
+        omega = np.cumsum(p)
+        mu = np.cumsum(p * np.arange(256))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            between = (mu[-1] * omega - mu) ** 2 / (omega * (1 - omega))
+        return int(np.argmax(np.nan_to_num(between, nan=0.0, posinf=0.0)))
+
+    @cached_property
+    def triangle_threshold(self):
+        """
+        Triangle threshold (Zack et al.), matching OpenCV's THRESH_TRIANGLE:
+        the value t for classes [0, t] and [t + 1, 255] that lies farthest
+        below the line from the histogram peak to the end of its longer tail.
+        """
+        hist = self.combined_histogram
+        left_bound = max(self.min - 1, 0)
+        right_bound = min(self.max + 1, 255)
+        max_ind = int(np.argmax(hist))
+
+        flipped = max_ind - left_bound < right_bound - max_ind
+        if flipped:
+            hist = hist[::-1]
+            left_bound, max_ind = 255 - right_bound, 255 - max_ind
+
+        thresh = left_bound
+        candidates = np.arange(left_bound + 1, max_ind + 1)
+        if len(candidates):
+            distances = hist[max_ind] * candidates + (left_bound - max_ind) * hist[candidates]
+            best = int(np.argmax(distances))
+            if distances[best] > 0:
+                thresh = int(candidates[best])
+        thresh -= 1
+        return 255 - thresh if flipped else thresh
+
+
+_statistics_cache = {}
+
+
+def image_statistics(image):
+    """
+    Return the shared ImageStatistics of an image, keyed by the identity of
+    the array. The entry is dropped when the image is garbage collected.
+
+    Args:
+        image (numpy.ndarray): Grayscale or RGB uint8 image.
+
+    Returns:
+        ImageStatistics: Statistics of the image.
+    """
+    key = id(image)
+    entry = _statistics_cache.get(key)
+    if entry is not None and entry[0]() is image:
+        return entry[1]
+
+    stats = ImageStatistics(image)
+    ref = weakref.ref(image, lambda _, key=key: _statistics_cache.pop(key, None))
+    _statistics_cache[key] = (ref, stats)
+    return stats
+
+
+# Default plot size (width, height), the 5x10 inch figure at 100 dpi
+PLOT_SIZE = (500, 1000)
+
+# RGB values of the plot colours
+PLOT_COLORS = {
+    'blue': (0, 0, 255),
+    'green': (0, 128, 0),
+    'red': (255, 0, 0),
+    'black': (0, 0, 0),
+}
+PLOT_BACKGROUND = (255, 255, 255)
+PLOT_FACECOLOR = (245, 245, 245)  # '#F5F5F5'
+PLOT_SPINE_COLOR = (0, 0, 0)
+
+
+def _plot_canvas(num_panels, size, title):
+    """
+    Create a blank plot image with a title and stacked axes panels.
+
+    Args:
+        num_panels (int): Number of panels stacked vertically.
+        size (tuple): (width, height) of the image in pixels.
+        title (str): Title drawn at the top.
+
+    Returns:
+        tuple: The uint8 RGB canvas and a list of (x0, y0, x1, y1) panel
+        rectangles, exclusive of x1 and y1.
+    """
+    width, height = size
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = np.array(PLOT_BACKGROUND, dtype=np.uint8)
+
+    # Title, scaled with the image width
+    font_scale = max(width / 1000, 0.3)
+    thickness = max(int(round(font_scale * 2)), 1)
+    (text_w, text_h), baseline = cv2.getTextSize(title, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+    title_h = text_h + baseline + 2 * max(height // 100, 2)
+    cv2.putText(canvas, title, ((width - text_w) // 2, title_h - baseline - max(height // 100, 2)),
+                cv2.FONT_HERSHEY_SIMPLEX, font_scale, PLOT_SPINE_COLOR, thickness, cv2.LINE_AA)
+
+    margin_x = max(width // 20, 2)
+    margin_y = max(height // 50, 2)
+    panel_h = (height - title_h - margin_y) // num_panels
+    panels = []
+    for i in range(num_panels):
+        y0 = title_h + i * panel_h + margin_y
+        y1 = title_h + (i + 1) * panel_h
+        x0, x1 = margin_x, width - margin_x
+        if y1 - y0 < 2 or x1 - x0 < 2:
+            continue
+        canvas[y0:y1, x0:x1] = np.array(PLOT_FACECOLOR, dtype=np.uint8)
+        # Left and bottom spines only
+        canvas[y0:y1, x0] = PLOT_SPINE_COLOR
+        canvas[y1 - 1, x0:x1] = PLOT_SPINE_COLOR
+        panels.append((x0 + 1, y0, x1, y1 - 1))
+    return canvas, panels
+
+
+def plot_histograms_as_array(hist, mode, title="Histogram", size=PLOT_SIZE):
+    """
+    Draw histogram bars straight into an RGB image.
+
+    Args:
+        hist: The histogram(s) of the image, one row of 256 counts per channel.
+        mode (str): The mode of the image. It can be 'rgb' or 'gray'.
+        title (str): The title for the plot.
+        size (tuple): (width, height) of the output image.
+
+    Returns:
+        img: The plot as a uint8 RGB image array of the given size.
+    """
     if mode == "rgb":
         colors = ['blue', 'green', 'red']
-        # labels = ['Blue Channel', 'Green Channel', 'Red Channel']
     else:
         colors = ['black']
-        # labels = ['Grayscale Channel']
-
-    fig, axs = plt.subplots(len(hist), 1, figsize=(5, 10))
 
-    if len(hist) == 1:
-        axs = [axs]  # Handle case for grayscale where axs is not a list.
+    canvas, panels = _plot_canvas(len(colors), size, title)
 
-    for i, color in enumerate(colors):
-        axs[i].bar(np.arange(256), hist[i], color=color, width=1)
-        # axs[i].set_title(f'{labels[i]}', fontsize=10, color=color)
+    for (x0, y0, x1, y1), channel_hist, color in zip(panels, hist, colors):
+        panel_w, panel_h = x1 - x0, y1 - y0
+        channel_hist = np.asarray(channel_hist, dtype=np.float64)
 
-        axs[i].set_xlim([0, 255])
-        axs[i].set_facecolor('#F5F5F5')
-        axs[i].spines['top'].set_visible(False)
-        axs[i].spines['right'].set_visible(False)
+        # Tallest bin under each pixel column, so narrow peaks stay visible
+        starts = (np.arange(panel_w) * 256) // panel_w
+        column_values = np.maximum.reduceat(channel_hist, starts)
 
-    plt.suptitle(title, fontsize=12)
-    plt.tight_layout()
-
-    fig.canvas.draw()
-    img = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-    img = img.reshape(fig.canvas.get_width_height()[::-1] + (4,))  # RGBA
-
-    img = cv2.cvtColor(img, cv2.COLOR_RGBA2RGB)  # Convert to RGB (optional if you want to match before)
+        # 5% headroom above the tallest bar
+        top = channel_hist.max() * 1.05
+        if top > 0:
+            bar_heights = np.round(column_values / top * panel_h).astype(int)
+        else:
+            bar_heights = np.zeros(panel_w, dtype=int)
+        bars = np.arange(panel_h)[:, None] >= panel_h - bar_heights[None, :]
+        panel = canvas[y0:y1, x0:x1]
+        panel[:] = np.where(bars[:, :, None], np.array(PLOT_COLORS[color], dtype=np.uint8), panel)
 
-    plt.close(fig)
-    return img
+    return canvas
 
-def plot_cdf_as_array(hist, mode, title="Cumulative Distribution Function (CDF)"):
+def plot_cdf_as_array(hist, mode, title="Cumulative Distribution Function (CDF)", size=PLOT_SIZE, cdf=None):
     """
-    Calculate and plot the Cumulative Distribution Function (CDF) of an image histogram manually.
+    Calculate the Cumulative Distribution Function (CDF) of an image histogram
+    and draw it straight into an RGB image.
     
     Args:
-        hist: The histogram of the image. For 'rgb' mode, it's a list of three histograms (R, G, B).
+        hist: The histogram of the image. For 'rgb' mode, it's three histograms (R, G, B).
              For 'gray' mode, it's a single histogram.
         mode (str): The mode of the image. It can be 'rgb' or 'gray'.
         title (str): The title for the plot.
+        size (tuple): (width, height) of the output image.
+        cdf: Optional cumulative counts matching hist (e.g. ImageStatistics.cdf),
+             used instead of summing the histogram again.
 
     Returns:
-        img: The plot of the CDF as an image array.
+        img: The plot of the CDF as a uint8 RGB image array of the given size.
     """
     if mode not in ('rgb', 'gray'):
         raise ValueError("Invalid mode. Use 'rgb' or 'gray'.")
 
     if mode == "rgb":
         colors = ['blue', 'green', 'red']
-        num_channels = 3
     else:
         colors = ['black']
-        num_channels = 1
 
-    # Create a figure with subplots for each channel
-    fig, axs = plt.subplots(num_channels, 1, figsize=(5, 10))
-    if num_channels == 1:
-        axs = [axs]  # Handle grayscale case
-
-    for i in range(num_channels):
-        if num_channels == 1:
-            channel_hist = hist[0]
-        else:
-            channel_hist = hist[i]
+    canvas, panels = _plot_canvas(len(colors), size, title)
+    line_thickness = max(size[0] // 250, 1)
 
-        # Initialize CDF
-        cdf = [0] * 256
-        running_total = 0
+    if cdf is None:
+        cdf = np.cumsum(np.asarray(hist), axis=1)
 
-        # Calculate running sum manually
-        for intensity in range(256):
-            running_total += channel_hist[intensity]
-            cdf[intensity] = running_total
-
-        # Normalize CDF
-        total_pixels = running_total
+    for (x0, y0, x1, y1), channel_cdf, color in zip(panels, cdf, colors):
+        channel_cdf = np.asarray(channel_cdf, dtype=np.float64)
+        total_pixels = channel_cdf[-1]
         if total_pixels != 0:
-            cdf = [value / total_pixels for value in cdf]
-        else:
-            # Handle case where there are no pixels (shouldn't happen with valid histogram)
-            cdf = [0.0 for _ in range(256)]
-
-        # Plot the CDF
-        axs[i].plot(cdf, color=colors[i], linewidth=1.5)
-        axs[i].set_xlim([0, 255])
-        axs[i].set_ylim([0, 1])
-        axs[i].set_facecolor('#F5F5F5')
-        axs[i].spines['top'].set_visible(False)
-        axs[i].spines['right'].set_visible(False)
-
-    plt.suptitle(title, fontsize=12)
-    plt.tight_layout()
-
-    # Convert plot to image array
-    fig.canvas.draw()
-    img = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-    img = img.reshape(fig.canvas.get_width_height()[::-1] + (4,))  # RGBA
+            channel_cdf = channel_cdf / total_pixels
 
-    img = cv2.cvtColor(img, cv2.COLOR_RGBA2RGB)  # Convert to RGB
+        # Polyline in canvas coordinates, y = 1 at the top of the panel
+        xs = x0 + np.arange(256) * (x1 - x0 - 1) / 255
+        ys = y1 - 1 - channel_cdf * (y1 - y0 - 1)
+        points = np.round(np.stack([xs, ys], axis=1)).astype(np.int32)
+        cv2.polylines(canvas, [points], False, PLOT_COLORS[color], line_thickness, cv2.LINE_AA)
 
-    plt.close(fig)
-    return img
+    return canvas
 
 def process_image(file_path, mode="rgb"):
     """
@@ -184,13 +378,9 @@ def process_image(file_path, mode="rgb"):
     # Calculate histogram
     hist = calculate_histogram(image, mode)
 
-    # Generate images (histogram & CDF)
-    hist_bars_img = plot_histograms_as_array(hist, mode, title=f"{mode.upper()} Histogram")
-    cdf_img = plot_cdf_as_array(hist, mode, title=f"{mode.upper()} CDF")
-
-    # Resize both to match original image size
-    hist_bars_img = cv2.resize(hist_bars_img, (width, height))
-    cdf_img = cv2.resize(cdf_img, (width, height))
+    # Generate images (histogram & CDF) at the original image size
+    hist_bars_img = plot_histograms_as_array(hist, mode, title=f"{mode.upper()} Histogram", size=(width, height))
+    cdf_img = plot_cdf_as_array(hist, mode, title=f"{mode.upper()} CDF", size=(width, height))
 
     return hist_bars_img, cdf_img, hist
 
@@ -211,60 +401,138 @@ def process_image(image, mode="rgb"):
 
     height, width = image.shape[:2]
 
-    # Calculate histogram
-    hist = calculate_histogram(image, mode)
-
-    # Generate images (histogram & CDF)
-    hist_bars_img = plot_histograms_as_array(hist, mode, title=f"{mode.upper()} Histogram")
-    cdf_img = plot_cdf_as_array(hist, mode, title=f"{mode.upper()} CDF")
+    # Histogram and CDF from the statistics shared with the other tools
+    stats = image_statistics(image)
+    if stats.mode == mode:
+        hist, cdf = stats.histogram, stats.cdf
+    else:
+        hist = calculate_histogram(image, mode)
+        cdf = None
 
-    # Resize both to match original image size
-    hist_bars_img = cv2.resize(hist_bars_img, (width, height))
-    cdf_img = cv2.resize(cdf_img, (width, height))
+    # Generate images (histogram & CDF) at the original image size
+    hist_bars_img = plot_histograms_as_array(hist, mode, title=f"{mode.upper()} Histogram", size=(width, height))
+    cdf_img = plot_cdf_as_array(hist, mode, title=f"{mode.upper()} CDF", size=(width, height), cdf=cdf)
 
     return hist_bars_img, cdf_img
 
 
 
-def equalize_image(image):
+def _clahe_tile_luts(tile_row, tiles_x, clip_limit):
+    """
+    Build the clipped-histogram equalization LUTs of one row of tiles.
+
+    Args:
+        tile_row (numpy.ndarray): (tile_h, tiles_x * tile_w) uint8 strip.
+        tiles_x (int): Number of tiles across the strip.
+        clip_limit (float): Contrast limit, relative to a flat histogram.
+
+    Returns:
+        numpy.ndarray: (tiles_x, 256) uint8 LUTs.
+    """
+    tile_h = tile_row.shape[0]
+    tile_w = tile_row.shape[1] // tiles_x
+    area = tile_h * tile_w
+
+    # One bincount for the whole strip, tile t offset into bins 256 * t
+    tile_index = np.arange(tile_row.shape[1]) // tile_w
+    offsets = tile_row.astype(np.intp) + tile_index * 256
+    hists = np.bincount(offsets.ravel(), minlength=tiles_x * 256).reshape(tiles_x, 256)
+
+    # Clip every bin at the limit and spread the excess over all bins
+    limit = max(int(clip_limit * area / 256), 1)
+    excess = np.maximum(hists - limit, 0).sum(axis=1)
+    hists = np.minimum(hists, limit) + (excess // 256)[:, None]
+    for t, residual in enumerate(excess % 256):
+        if residual:
+            step = max(256 // residual, 1)
+            hists[t, np.arange(0, 256, step)[:residual]] += 1
+
+    cdf = np.cumsum(hists, axis=1)
+    return np.clip(np.round(cdf * 255.0 / area), 0, 255).astype(np.uint8)
+
+
+def _clahe(image, clip_limit, tile_grid_size, workers):
+    """
+    Contrast-limited adaptive histogram equalization of a grayscale image.
+
+    The image is split into a grid of tiles, every tile gets its own
+    clipped-histogram LUT (rows of tiles are processed in parallel), and
+    each pixel blends the LUTs of its four nearest tile centres
+    bilinearly.
+    """
+    rows, cols = image.shape
+    tiles_y, tiles_x = tile_grid_size
+
+    # Pad so the tiles divide the image evenly
+    padded = cv2.copyMakeBorder(image, 0, (-rows) % tiles_y, 0, (-cols) % tiles_x, cv2.BORDER_REFLECT_101)
+    tile_h = padded.shape[0] // tiles_y
+    tile_w = padded.shape[1] // tiles_x
+
+    strips = [padded[i * tile_h:(i + 1) * tile_h] for i in range(tiles_y)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        luts = np.stack(list(executor.map(lambda strip: _clahe_tile_luts(strip, tiles_x, clip_limit), strips)))
+
+    def neighbours(size, tile_size, tiles):
+        position = np.arange(size) / tile_size - 0.5
+        first = np.floor(position).astype(int)
+        weight = position - first
+        return np.clip(first, 0, tiles - 1), np.clip(first + 1, 0, tiles - 1), weight
+
+    top, bottom, wy = neighbours(rows, tile_h, tiles_y)
+    left, right, wx = neighbours(cols, tile_w, tiles_x)
+    top, bottom, wy = top[:, None], bottom[:, None], wy[:, None]
+
+    blended = ((1 - wy) * ((1 - wx) * luts[top, left, image] + wx * luts[top, right, image])
+               + wy * ((1 - wx) * luts[bottom, left, image] + wx * luts[bottom, right, image]))
+    return np.round(blended).astype(np.uint8)
+
+
+def equalize_image(image, method="global", clip_limit=2.0, tile_grid_size=(8, 8), workers=None):
     """
     Equalize the image 
     Args:
         image (numpy.ndarray): Image to equalize.
+        method (str): 'global' maps every pixel through one LUT built from the
+            image CDF; 'clahe' equalizes tiles separately with a contrast
+            limit and blends the tile LUTs bilinearly.
+        clip_limit (float): 'clahe' only. Histogram bins are clipped at
+            clip_limit times the flat-histogram height.
+        tile_grid_size (tuple): 'clahe' only. Number of (rows, cols) tiles.
+        workers (int): 'clahe' only. Threads used for the tile LUTs.
 
     Returns:
         numpy.ndarray: Equalized image.
-    """
-    
-    # Step 1: Calculate the histogram of the image
-    hist = np.zeros(256, dtype=int)
-    for pixel in image.flatten():
-        hist[pixel] += 1
 
+    Raises:
+        ValueError: If the method is neither 'global' nor 'clahe'.
+    """
+    if method not in ('global', 'clahe'):
+        raise ValueError("Invalid method. Use 'global' or 'clahe'.")
 
+    if method == 'clahe':
+        return _clahe(image, clip_limit, tile_grid_size, workers)
 
-    # Step 2: Compute the cumulative distribution function (CDF)
-    cdf = np.zeros(256, dtype=int)
-    cdf[0] = hist[0]
-    for i in range(1, 256):
-        cdf[i] = cdf[i - 1] + hist[i]
+    # Step 1 and 2: Histogram and cumulative distribution function (CDF),
+    # shared with the other tools working on this image
+    cdf = image_statistics(image).cdf[0]
 
-    # Step 3: Normalize the CDF
+    # Step 3: Normalize the CDF into a 256-entry LUT
     cdf_min = cdf.min()
     cdf_max = cdf.max()
     cdf_normalized = ((cdf - cdf_min) * 255 / (cdf_max - cdf_min)).astype(np.uint8)
 
-    # Step 4: Map the original pixel values to the equalized values using the normalized CDF
-    equalized_image = np.zeros_like(image, dtype=np.uint8)
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            equalized_image[i, j] = cdf_normalized[image[i, j]]
-
-    return equalized_image
+    # Step 4: Map the original pixel values to the equalized values through the LUT
+    return cdf_normalized[image]
 
 def normalize_image(image):
-    min_val = np.min(image)
-    max_val = np.max(image)
+    if image.dtype == np.uint8:
+        # Read the range from the shared histogram statistics
+        stats = image_statistics(image)
+        min_val = stats.min
+        max_val = stats.max
+    else:
+        min_val = np.min(image)
+        max_val = np.max(image)
     normalized_image = ((image - min_val) /
                         (max_val - min_val)) * 255
 
@@ -274,52 +542,175 @@ def normalize_image(image):
 
 
 
-def manual_global_threshold(image):
-    global_thresh_value = 128
-    max_value = 255
+GLOBAL_THRESHOLD_METHODS = ('fixed', 'otsu', 'triangle', 'mean', 'percentile')
 
-    # Initialize the output image with zeros (all black)
-    thresh_image = np.zeros_like(image)
 
-    # Get the dimensions of the image
+def global_threshold_value(image, method="fixed", thresh=128, percentile=50):
+    """
+    Pick a global threshold; pixels at or above it belong to the bright class.
+
+    Every automatic method works on the shared 256-bin histogram, so it
+    costs O(256) once the histogram exists. 'otsu' and 'triangle' return
+    one more than the threshold cv2.threshold reports for THRESH_OTSU and
+    THRESH_TRIANGLE, since OpenCV puts the pixels strictly above its value
+    in the bright class; both split the image the same way.
+
+    Args:
+        image (numpy.ndarray): Grayscale uint8 image.
+        method (str): 'fixed' (thresh), 'otsu', 'triangle', 'mean' (the
+            mean intensity) or 'percentile' (the given percentile).
+        thresh (int): Threshold used by the 'fixed' method.
+        percentile (float): Percentile used by the 'percentile' method.
+
+    Returns:
+        int: The threshold.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in GLOBAL_THRESHOLD_METHODS:
+        raise ValueError("Invalid method. Use 'fixed', 'otsu', 'triangle', 'mean' or 'percentile'.")
+
+    if method == 'fixed':
+        return thresh
+
+    stats = image_statistics(image)
+    if method == 'otsu':
+        # The lower classes of Otsu and triangle are [0, t], so the upper
+        # class starts at t + 1
+        return stats.otsu_threshold + 1
+    if method == 'triangle':
+        return stats.triangle_threshold + 1
+    if method == 'mean':
+        return int(np.ceil(stats.mean))
+    return stats.percentile(percentile)
+
+
+
+def manual_global_threshold(image, thresh=128, method="fixed", percentile=50, max_value=255, out=None):
+    """
+    Set pixels at or above a global threshold to max_value and the rest to 0.
+
+    The image is mapped through a 256-entry LUT in one pass.
+
+    Args:
+        image (numpy.ndarray): Grayscale uint8 image.
+        thresh (int): Threshold used by the 'fixed' method.
+        method (str): How to pick the threshold, see global_threshold_value.
+        percentile (float): Percentile used by the 'percentile' method.
+        max_value (int): Value of the pixels at or above the threshold.
+        out (numpy.ndarray): Optional uint8 array with the image shape to
+            write the result into.
+
+    Returns:
+        numpy.ndarray: Binary image with values 0 and max_value.
+    """
+    global_thresh_value = global_threshold_value(image, method, thresh, percentile)
+
+    lut = np.where(np.arange(256) >= global_thresh_value, max_value, 0).astype(np.uint8)
+    return np.take(lut, image, out=out)
+
+
+def multilevel_threshold(image, thresholds, out=None):
+    """
+    Label each pixel with the number of thresholds it is at or above.
+
+    With thresholds t1 < t2 < ... < tn, pixels below t1 get label 0, pixels
+    in [t1, t2) get label 1 and pixels at or above tn get label n. The image
+    is mapped through a 256-entry LUT in one pass.
+
+    Args:
+        image (numpy.ndarray): Grayscale uint8 image.
+        thresholds (sequence): Threshold values, in any order.
+        out (numpy.ndarray): Optional uint8 array with the image shape to
+            write the labels into.
+
+    Returns:
+        numpy.ndarray: uint8 label image.
+    """
+    lut = np.searchsorted(np.sort(thresholds), np.arange(256), side='right').astype(np.uint8)
+    return np.take(lut, image, out=out)
+
+def _local_mean_and_std(image, block_size):
+    """
+    Compute the mean and standard deviation of every block_size x block_size
+    neighbourhood using summed-area tables, so each pixel costs O(1)
+    whatever the block size.
+
+    Args:
+        image (numpy.ndarray): Grayscale image.
+        block_size (int): Odd side length of the neighbourhood.
+
+    Returns:
+        tuple: (mean, std) float64 arrays with the shape of the image.
+    """
+    # Pad the image to handle the border pixels
+    pad_size = block_size // 2
+    padded_image = cv2.copyMakeBorder(
+        image, pad_size, pad_size, pad_size, pad_size, cv2.BORDER_REPLICATE)
+
+    # Sum and squared-sum tables with a leading row and column of zeros
+    sum_table, sq_sum_table = cv2.integral2(
+        padded_image, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+
     rows, cols = image.shape[:2]
 
-    # Loop over each pixel in the image
-    for i in range(rows):
-        for j in range(cols):
-            # Apply the threshold
-            if image[i, j] >= global_thresh_value:
-                thresh_image[i, j] = max_value
-            else:
-                thresh_image[i, j] = 0
+    def block_sums(table):
+        return (table[block_size:block_size + rows, block_size:block_size + cols]
+                - table[:rows, block_size:block_size + cols]
+                - table[block_size:block_size + rows, :cols]
+                + table[:rows, :cols])
+
+    area = block_size * block_size
+    mean = block_sums(sum_table) / area
+    variance = block_sums(sq_sum_table) / area - mean ** 2
+    std = np.sqrt(np.maximum(variance, 0))
+    return mean, std
 
-    return thresh_image
 
-def manual_local_threshold(image):
-    block_size = 11
-    c = 2
+def manual_local_threshold(image, block_size=11, c=2, method="mean", k=None, r=128):
+    """
+    Threshold each pixel against statistics of its local neighbourhood.
+
+    Args:
+        image (numpy.ndarray): Grayscale image.
+        block_size (int): Side length of the neighbourhood. Even values are
+            rounded up to the next odd size.
+        c (float): Constant subtracted from the local threshold.
+        method (str): 'mean' (threshold = local mean), 'niblack'
+            (mean + k * std) or 'sauvola' (mean * (1 + k * (std / r - 1))).
+        k (float): Weight of the local standard deviation. Defaults to -0.2
+            for 'niblack' and 0.5 for 'sauvola'.
+        r (float): Dynamic range of the standard deviation for 'sauvola'.
+
+    Returns:
+        numpy.ndarray: Binary image with values 0 and 255.
+
+    Raises:
+        ValueError: If the method is not 'mean', 'niblack' or 'sauvola'.
+    """
+    if method not in ('mean', 'niblack', 'sauvola'):
+        raise ValueError("Invalid method. Use 'mean', 'niblack' or 'sauvola'.")
+
     max_value = 255
-    # Create an image to store the thresholded result
-    thresh_image = np.zeros_like(image)
 
     # Ensure block_size is odd
     if block_size % 2 == 0:
         block_size += 1
 
-    # Pad the image to handle the border pixels
-    pad_size = block_size // 2
-    padded_image = cv2.copyMakeBorder(
-        image, pad_size, pad_size, pad_size, pad_size, cv2.BORDER_REPLICATE)
+    mean, std = _local_mean_and_std(image, block_size)
 
-    # Iterate over each pixel in the image
-    for y in range(image.shape[0]):
-            for x in range(image.shape[1]):
-                block = padded_image[y:y+block_size, x:x+block_size]
-                mean = np.mean(block)
-                if image[y, x] > mean - c:
-                    thresh_image[y, x] = max_value
-                else:
-                    thresh_image[y, x] = 0
+    if method == 'mean':
+        local_thresh = mean
+    elif method == 'niblack':
+        k = -0.2 if k is None else k
+        local_thresh = mean + k * std
+    else:  # method == 'sauvola'
+        k = 0.5 if k is None else k
+        local_thresh = mean * (1 + k * (std / r - 1))
 
-    return thresh_image
+    # Create an image to store the thresholded result
+    thresh_image = np.zeros_like(image)
+    thresh_image[image > local_thresh - c] = max_value
 
+    return thresh_image
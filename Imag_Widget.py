@@ -1,59 +1,304 @@
 from PyQt5.QtGui import QPainter, QPixmap, QImage, QPainterPath  # Import QPainterPath here
-from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtCore import QRectF, Qt, QTimer
 from PyQt5.QtWidgets import QWidget, QFileDialog
-from PIL import Image, ImageQt, ImageEnhance
-from numpy.fft import ifft2, ifftshift
 import numpy as np
-from scipy.fft import fft2, fftshift
 
 import cv2
 from PyQt5.QtCore import pyqtSignal
+from PyQt5 import sip
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# reduced-resolution decode modes, from the largest reduction down
+REDUCED_MODES = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4), (2, cv2.IMREAD_REDUCED_COLOR_2))
+
+# number of prefetched decodes kept around
+PREFETCH_SIZE = 4
+
+_decoder = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-decode")
+_prefetched = OrderedDict()
+_prefetch_lock = threading.Lock()
+
+
+def _reduction_factor(image_path, size):
+    """
+    Returns the largest reduced decode factor (1, 2, 4 or 8) that keeps a JPEG
+    at least size = (width, height). Only the file header is read. Other
+    formats have no cheap reduced decode and always return 1.
+    """
+    # PIL is only needed here, so it is not imported at startup
+    from PIL import Image
+    try:
+        with Image.open(image_path) as header:
+            if header.format != 'JPEG':
+                return 1
+            width, height = header.size
+    except OSError:
+        return 1
+    for factor, _ in REDUCED_MODES:
+        if width // factor >= size[0] and height // factor >= size[1]:
+            return factor
+    return 1
+
+
+def _decode(image_path, factor=1):
+    """
+    Decodes image_path as RGB, factor times smaller when factor > 1. Returns
+    None if the file cannot be read.
+    """
+    if factor == 1:
+        image = cv2.imread(image_path)
+    else:
+        image = cv2.imread(image_path, dict(REDUCED_MODES)[factor])
+    if image is None:
+        return None
+    return cv2.cvtColor(image, code=cv2.COLOR_BGR2RGB)
+
+
+def decode_async(image_path, factor=1):
+    """
+    Returns a future of _decode(image_path, factor), reusing a prefetched one.
+    """
+    try:
+        key = (image_path, factor, os.path.getmtime(image_path))
+    except OSError:
+        return _decoder.submit(_decode, image_path, factor)
+    with _prefetch_lock:
+        future = _prefetched.pop(key, None)
+        if future is None:
+            future = _decoder.submit(_decode, image_path, factor)
+        # keep the most recently requested decodes, so a prefetched image or
+        # one shown just before is not decoded again
+        _prefetched[key] = future
+        while len(_prefetched) > PREFETCH_SIZE:
+            _prefetched.popitem(last=False)
+    return future
+
+
+def neighbor_images(image_path, count=1):
+    """
+    Returns up to count image files before and after image_path in its directory.
+    """
+    directory, name = os.path.split(os.path.abspath(image_path))
+    try:
+        names = sorted(entry for entry in os.listdir(directory) if entry.lower().endswith(IMAGE_EXTENSIONS))
+    except OSError:
+        return []
+    if name not in names:
+        return []
+    index = names.index(name)
+    neighbors = names[index + 1:index + 1 + count] + names[max(index - count, 0):index]
+    return [os.path.join(directory, neighbor) for neighbor in neighbors]
+
+
 class ImageWidget(QWidget):
     image_uploaded = pyqtSignal(bool)
+    # (load generation, decoded image or None, True if at full resolution)
+    image_decoded = pyqtSignal(int, object, bool)
+
+    # how long (ms) the widget size must stay unchanged before a smooth rescale
+    RESIZE_SETTLE_MS = 150
+
     def __init__(self, image_path=None, parent=None):
         super(ImageWidget, self).__init__(parent)
         self.pixmap = None  
         self.image=None
         self.gray_img=None
+        # full-resolution source and its mip pyramid of (image, gray) levels
+        self.full_image=None
+        self.full_gray=None
+        self._pyramid=[]
+
+        # asynchronous loading: only the decodes of the latest load are shown
+        self._load_generation = 0
+        self._shown_generation = None
+        self._full_future = None
+        self.image_decoded.connect(self._on_image_decoded)
+
+        # cached clip path for the rounded corners, rebuilt on resize
+        self._clip_path = None
+        self._clip_size = None
+
+        # while resizing, paint with fast scaling and rescale smoothly once it settles
+        self._resizing = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._resize_settled)
 
         self.setMouseTracking(True)
 
         if image_path:
             self.load_image(image_path)
-    
+
+    @property
+    def pixmap(self):
+        return self._pixmap
+
+    @pixmap.setter
+    def pixmap(self, pixmap):
+        # a new pixmap invalidates the cached scaled copy
+        self._pixmap = pixmap
+        self._scaled_pixmap = None
+        self._scaled_size = None
+        self._scaled_smooth = False
+
+    def resizeEvent(self, event):
+        self._resizing = True
+        self._resize_timer.start()
+        super(ImageWidget, self).resizeEvent(event)
+
+    def _resize_settled(self):
+        self._resizing = False
+        self.update()
+
     # automatically run to paint the img
     def paintEvent(self, event):
         if self.pixmap:
             painter = QPainter(self)
+            size = self.size()
+
             # make img border raduis 
-            rect = QRectF(self.rect())
-            path = QPainterPath() 
-            path.addRoundedRect(rect, 20, 20) 
-            painter.setClipPath(path)
+            if self._clip_path is None or self._clip_size != size:
+                self._clip_path = QPainterPath()
+                self._clip_path.addRoundedRect(QRectF(self.rect()), 20, 20)
+                self._clip_size = size
+            painter.setClipPath(self._clip_path)
            
-            # resize the img 
-            scaled_pixmap = self.pixmap.scaled(
-                # set its geomerty from the main
-                self.size(),
-                Qt.KeepAspectRatioByExpanding,
-                Qt.SmoothTransformation
-            )
+            # resize the img only when the pixmap or the widget size changed,
+            # or to replace a fast-scaled copy once resizing has settled
+            smooth = not self._resizing
+            if self._scaled_pixmap is None or self._scaled_size != size or (smooth and not self._scaled_smooth):
+                self._scaled_pixmap = self.pixmap.scaled(
+                    # set its geomerty from the main
+                    size,
+                    Qt.KeepAspectRatioByExpanding,
+                    Qt.SmoothTransformation if smooth else Qt.FastTransformation
+                )
+                self._scaled_size = size
+                self._scaled_smooth = smooth
             
-            painter.drawPixmap(self.rect(), scaled_pixmap)
+            painter.drawPixmap(self.rect(), self._scaled_pixmap)
 
     
     def load_image(self, image_path):  
             # read image for processing and convert to grayscale
-            self.image = cv2.imread(image_path )
-            self.image = cv2.cvtColor(self.image , code=cv2.COLOR_BGR2RGB)
-            # sure the resized_img is the size of widget 
-            self.image = cv2.resize(self.image, (self.width(), self.height()), interpolation=cv2.INTER_AREA)
-            
-            self.gray_img=cv2.cvtColor(self.image , cv2.COLOR_RGB2GRAY)
+            self._load_generation += 1
+            self._full_future = None
+            image = _decode(image_path)
+            self.set_source(image)
             self.pixmap=self.convert_np_pixmap(self.gray_img)
 
             # repaint
             self.update() 
+
+    def load_image_async(self, image_path):
+        """
+        Decodes image_path on a worker thread and emits image_uploaded once it
+        is displayed.
+
+        A JPEG much larger than the widget is first decoded at a reduced
+        resolution (cv2.IMREAD_REDUCED_COLOR_*), which is enough for the
+        display-size proxies; the full-resolution decode follows in the
+        background and get_full_GrayImg/get_full_RGBImg wait for it.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        factor = _reduction_factor(image_path, (self.width(), self.height()))
+
+        if factor > 1:
+            preview = decode_async(image_path, factor)
+            preview.add_done_callback(lambda future: self.image_decoded.emit(generation, future.result(), False))
+        self._full_future = decode_async(image_path)
+        self._full_future.add_done_callback(lambda future: self.image_decoded.emit(generation, future.result(), True))
+
+    def prefetch_neighbors(self, image_path, count=1):
+        """Starts decoding the images next to image_path in its directory."""
+        size = (self.width(), self.height())
+        for neighbor in neighbor_images(image_path, count):
+            factor = _reduction_factor(neighbor, size)
+            if factor > 1:
+                decode_async(neighbor, factor)
+            else:
+                decode_async(neighbor)
+
+    def _on_image_decoded(self, generation, image, full):
+        if generation != self._load_generation or image is None:
+            return
+        if self._shown_generation == generation:
+            # the reduced preview is on screen, only swap in the full-resolution source
+            if full and self._full_future is not None:
+                self._set_full_source(image)
+            return
+        self._shown_generation = generation
+        if full:
+            self._full_future = None
+        self.set_source(image)
+        self.pixmap=self.convert_np_pixmap(self.gray_img)
+        self.update()
+        self.image_uploaded.emit(True)
+
+    def _set_full_source(self, image):
+        # put the full-resolution images on top of the preview pyramid, keeping the proxies
+        self._full_future = None
+        self.full_image = image
+        self.full_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        self._pyramid.insert(0, (self.full_image, self.full_gray))
+
+    def _wait_full(self):
+        # block on the pending full-resolution decode of the displayed preview
+        future = self._full_future
+        if future is not None and self._shown_generation == self._load_generation:
+            image = future.result()
+            if image is not None and self._full_future is future:
+                self._set_full_source(image)
+
+    def set_source(self, image):
+        """
+        Keeps a full-resolution image and derives the display-size proxies.
+
+        self.image and self.gray_img are proxies the size of the widget, which
+        interactive operations run on; the full-resolution RGB (or grayscale)
+        and grayscale images stay available for full-quality renders.
+        """
+        self.full_image = image
+        if image.ndim == 3:
+            self.full_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        else:
+            self.full_gray = image
+        self._pyramid = [(self.full_image, self.full_gray)]
+
+        # sure the resized_img is the size of widget 
+        self.image, self.gray_img = self.get_proxy((self.width(), self.height()))
+
+    def get_proxy(self, size):
+        """
+        Returns (image, gray) resized to size = (width, height).
+
+        Halved levels of a mip pyramid are built on demand, and the proxy is
+        resized with INTER_AREA from the smallest level still at least as large
+        as the requested size.
+        """
+        width, height = size
+        level_image, level_gray = self._pyramid[-1]
+        while level_gray.shape[1] // 2 >= width and level_gray.shape[0] // 2 >= height:
+            half = (level_gray.shape[1] // 2, level_gray.shape[0] // 2)
+            level_image = cv2.resize(level_image, half, interpolation=cv2.INTER_AREA)
+            level_gray = cv2.resize(level_gray, half, interpolation=cv2.INTER_AREA)
+            self._pyramid.append((level_image, level_gray))
+
+        for level_image, level_gray in reversed(self._pyramid):
+            if level_gray.shape[1] >= width and level_gray.shape[0] >= height:
+                break
+        if level_gray.shape[:2] == (height, width):
+            return level_image, level_gray
+        return (cv2.resize(level_image, (width, height), interpolation=cv2.INTER_AREA),
+                cv2.resize(level_gray, (width, height), interpolation=cv2.INTER_AREA))
         
     
     def get_curr_GrayImg(self):
@@ -61,19 +306,34 @@ class ImageWidget(QWidget):
 
     def get_curr_RGBImg(self):
         return self.image
+
+    def get_full_GrayImg(self):
+        self._wait_full()
+        return self.full_gray
+
+    def get_full_RGBImg(self):
+        self._wait_full()
+        return self.full_image
     
 
     def Set_Image(self , image):
-        self.image=image
-        # sure the resized_img is the size of widget 
-        self.image = cv2.resize(self.image, (self.width(), self.height()), interpolation=cv2.INTER_AREA)
-        if (image.shape ==3 ) : self.gray_img=cv2.cvtColor(self.image , cv2.COLOR_RGB2GRAY)
-        else : self.gray_img = image
-        self.pixmap=self.convert_np_pixmap(self.gray_img)
+        # a computed image replaces any load still in flight
+        self._load_generation += 1
+        self._full_future = None
+        # keep the image at full resolution, display the widget-size proxy
+        self.set_source(image)
+        self.pixmap=self.convert_np_pixmap(self.image)
 
         # repaint
         self.update() 
 
+    def save_image(self, file_path):
+        """Writes the full-resolution image to file_path."""
+        image = self.get_full_RGBImg()
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        return cv2.imwrite(file_path, image)
+
 
     def display_RGBImg(self):
         self.pixmap=self.convert_np_pixmap(self.image)
@@ -84,8 +344,13 @@ class ImageWidget(QWidget):
         self.update()
 
     def Remove_Image(self):
+        self._load_generation += 1
+        self._full_future = None
         self.image=None
         self.gray_img=None
+        self.full_image=None
+        self.full_gray=None
+        self._pyramid=[]
         self.pixmap=None
 
         self.update()
@@ -107,70 +372,108 @@ class ImageWidget(QWidget):
         """This method is automatically called on double-click."""
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Image", "", "Image Files (*.png *.jpg *.bmp *.jpeg *.gif);;All Files (*)")
         if file_path:
-            self.load_image(file_path) 
-            self.image_uploaded.emit(True)
+            # image_uploaded is emitted once the decode is displayed
+            self.load_image_async(file_path)
+            self.prefetch_neighbors(file_path)
     
 
 
 
-    def convert_np_pixmap(self, np_arr):
+    def convert_np_qimage(self, np_arr):
         """
-        Converts a NumPy array (H, W, 3) representing an RGB image to QPixmap.
+        Wraps a uint8 NumPy array (H, W) grayscale or (H, W, 3) RGB in a QImage
+        without copying the pixels.
+
+        Rows may be padded or come from a strided view; only the pixels inside
+        a row must be contiguous, otherwise one contiguous copy is made. The
+        array is kept alive as long as the QImage exists.
         """
+        if np_arr.dtype != np.uint8:
+            np_arr = np_arr.astype(np.uint8)
 
-        
-        # Convert the NumPy array to bytes
-        byte_data = np_arr.tobytes()
-        
-        
-        # Ensure input is an RGB image
-        if len(np_arr.shape) == 3:
-            height, width, channels = np_arr.shape
-            # Create QImage from the byte data
-            qimage = QImage(byte_data, width, height, width * channels, QImage.Format_RGB888)
+        height, width = np_arr.shape[:2]
+        channels = np_arr.shape[2] if np_arr.ndim == 3 else 1
+        pixel_strides = (channels, 1)[:np_arr.ndim - 1]
+        if np_arr.strides[0] < width * channels or tuple(np_arr.strides[1:]) != pixel_strides:
+            np_arr = np.ascontiguousarray(np_arr)
 
-        elif len(np_arr.shape) == 2:
-            height, width = np_arr.shape
-            # Create QImage from the byte data (using width, height, bytesPerLine, and format)
-            qimage = QImage(byte_data, width, height, width, QImage.Format_Grayscale8)
+        image_format = QImage.Format_RGB888 if channels == 3 else QImage.Format_Grayscale8
+        qimage = QImage(sip.voidptr(np_arr.ctypes.data), width, height, np_arr.strides[0], image_format)
+        # QImage does not own the buffer, so hold a reference to the array
+        qimage._np_buffer = np_arr
+        return qimage
 
-        
-        # Convert QImage to QPixmap for displaying in PyQt
-        pixmap = QPixmap.fromImage(qimage)
-        return pixmap
+    def convert_np_pixmap(self, np_arr):
+        """
+        Converts a NumPy array (H, W, 3) RGB or (H, W) grayscale image to QPixmap.
+
+        The array is wrapped without a copy; QPixmap.fromImage makes the only copy.
+        """
+        return QPixmap.fromImage(self.convert_np_qimage(np_arr))
     
 
-    def convert_pixmap_np(self, pixmap): 
+    def convert_pixmap_np(self, pixmap, mode=None):
         """
-        Converts a QPixmap to a NumPy array (H, W, 3) representing an RGB image.
+        Converts a QPixmap to a NumPy array (H, W, 3) RGB or (H, W) grayscale image.
+
+        The array is a view on the pixels of the QImage from pixmap.toImage() and
+        keeps that image alive. 32-bit images are viewed in place with their byte
+        order reversed to RGB, and in 'gray' mode too if their pixels are gray
+        (R = G = B); other formats, and colour pixels in 'gray' mode, are
+        converted first (to luminance, QImage.Format_Grayscale8).
+
+        Args:
+            pixmap (QPixmap): Pixmap to convert.
+            mode (str): 'rgb' or 'gray'. Defaults to 'gray' if the image only
+                holds gray pixels (QImage.isGrayscale).
         """
-        # Convert QPixmap to QImage
         image = pixmap.toImage()
-        if (image.shape ==3):
-            # Ensure the QImage is in the correct RGB format
+        grayscale = image.isGrayscale()
+        if mode is None:
+            mode = 'gray' if grayscale else 'rgb'
+
+        width = image.width()
+        height = image.height()
+        bytes_per_line = image.bytesPerLine()
+
+        if image.format() in (QImage.Format_RGB32, QImage.Format_ARGB32, QImage.Format_ARGB32_Premultiplied) \
+                and sys.byteorder == 'little':
+            # Pixels are stored as B, G, R, A bytes
+            if mode == 'rgb':
+                return _qimage_view(image, (height, width, 3), (bytes_per_line, 4, -1), offset=2)
+            if grayscale:
+                # any one channel is the gray level
+                return _qimage_view(image, (height, width), (bytes_per_line, 4), offset=2)
+
+        if mode == 'gray':
+            if image.format() != QImage.Format_Grayscale8:
+                image = image.convertToFormat(QImage.Format_Grayscale8)
+            return _qimage_view(image, (height, width), (image.bytesPerLine(), 1))
+
+        if image.format() != QImage.Format_RGB888:
             image = image.convertToFormat(QImage.Format_RGB888)
-            # Access raw pixel data from QImage
-            width = image.width()
-            height = image.height()
-            # Extract pixel data from QImage as a NumPy array
-            ptr = image.bits()
-            ptr.setsize(image.byteCount())
-
-            # Convert the byte data into a NumPy array with the appropriate shape (height, width, 3) for RGB
-            np_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, width, 3))
-        else :
-                    # Ensure the QImage is in the correct format for manipulation
-            image = image.convertToFormat(QImage.Format_Grayscale8)  # Convert to grayscale format
-            
-            # Access raw pixel data from the QImage
-            width = image.width()
-            height = image.height()
-            
-            # Create a NumPy array from the QImage pixel data
-            ptr = image.bits()
-            ptr.setsize(image.byteCount())
-            
-            # Convert the byte data into a NumPy array with the appropriate shape (height, width) for grayscale
-            np_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, width))
-
-        return np_array
\ No newline at end of file
+        return _qimage_view(image, (height, width, 3), (image.bytesPerLine(), 3, 1))
+
+
+class _QImageBuffer:
+    """
+    Exposes the pixels of a QImage through the NumPy array interface. Arrays
+    built from it keep the buffer, and so the QImage, alive.
+    """
+
+    def __init__(self, qimage, shape, strides, offset):
+        self.qimage = qimage
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': shape,
+            'strides': strides,
+            'typestr': '|u1',
+            'data': (int(qimage.bits()) + offset, False),
+        }
+
+
+def _qimage_view(qimage, shape, strides, offset=0):
+    """
+    Returns a uint8 array view on the pixels of a QImage.
+    """
+    return np.asarray(_QImageBuffer(qimage, shape, strides, offset))
@@ -1,21 +1,46 @@
+import os
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget , QRadioButton, QButtonGroup
-from PyQt5 import uic 
+from PyQt5.QtWidgets import QApplication, QMainWindow, QButtonGroup, QShortcut
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import Qt, QTimer
 from Imag_Widget import ImageWidget
-from PyQt5.QtWidgets import QWidget, QFileDialog
-from PIL import Image, ImageQt, ImageEnhance
-from numpy.fft import ifft2, ifftshift
+from PyQt5.QtWidgets import QFileDialog
 import numpy as np
-from scipy.fft import fft2, fftshift
-from frequncy_domain import *
 from PyQt5.QtWidgets import QVBoxLayout
 from Noise_and_filter import *
 from EdgeDetection import *
 from frequncy_domain import *
 from EnhanceImg_Display import *
-
-# Load the UI file
-Ui_MainWindow, QtBaseClass = uic.loadUiType("Main_Window_UI_2color.ui")
+from job_scheduler import JobScheduler
+from result_cache import ResultCache, content_key
+from pipeline import build_image_graph
+from operations import get_operation, get_backend, set_backend, available_backends
+
+# Load the UI from the module compiled by build_ui.py, which skips parsing
+# the XML at startup. The module records the hash of the .ui file it was
+# built from; if the .ui file changed since, it is parsed instead, loudly
+import Main_Window_UI_2color
+from build_ui import UI_FILE, is_current
+if is_current(getattr(Main_Window_UI_2color, "UI_SOURCE_HASH", None)):
+    Ui_MainWindow = Main_Window_UI_2color.Ui_MainWindow
+else:
+    print("Main_Window_UI_2color.py is stale, loading the .ui file; run build_ui.py", file=sys.stderr)
+    from PyQt5 import uic
+    Ui_MainWindow, QtBaseClass = uic.loadUiType(UI_FILE)
+
+# live preview: wait this long (ms) after a slider move before previewing,
+# and this long without a move before refining to the full proxy
+PREVIEW_DEBOUNCE_MS = 30
+PREVIEW_SETTLE_MS = 300
+# latency budget (ms) of a preview per operation, None for no coarse pass
+# (the frequency filter banks already answer every radius quickly)
+PREVIEW_BUDGET_MS = {
+    "Apply_Noise_and_Filter": 60,
+    "Apply_Frequency_Filter": None,
+    "Apply_hyprid_filter": None,
+}
+# smallest preview proxy, as a fraction of the display proxy side
+PREVIEW_MIN_SCALE = 0.125
 
 # Main Window
 class MainWindow(QMainWindow , Ui_MainWindow ):
@@ -35,8 +60,31 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         self.Mode_group.addButton(self.RadioButton_Mixer)
         self.Remove_checked_Radios()
 
-        self.noisy_img=None
         self.org_img=None
+        # every operation is a node of this graph, which memoizes intermediate results
+        self.graph=build_image_graph()
+        # handlers read display-size proxies unless a full-resolution render is running
+        self.full_resolution=False
+        # operations run on a worker pool, only the latest job per output is painted
+        self.jobs=JobScheduler(parent=self)
+        # results by (input content, operation, parameters), so revisiting a mode is instant
+        self.results=ResultCache()
+        # content keys of the images read from each widget since its last upload
+        self.input_keys={}
+
+        # live slider preview: a coarse result while dragging, refined once the value settles
+        self.live_preview=True
+        self.preview_size=None
+        self._preview_handler=None
+        self._preview_refine=False
+        self._preview_timer=QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self.Run_Preview)
+        self._refine_timer=QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(PREVIEW_SETTLE_MS)
+        self._refine_timer.timeout.connect(self.Refine_Preview)
 
 
         
@@ -52,7 +100,7 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         layout.addWidget(self.org_ImgWidget)
         self.Widget_Org_Image.setLayout(layout)
 
-        self.org_ImgWidget.image_uploaded.connect(self.on_new_image_uploaded)
+        self.org_ImgWidget.image_uploaded.connect(lambda: self.Image_Uploaded(self.org_ImgWidget))
        
        
         layout_2 = QVBoxLayout(self.Widget_Output_1)
@@ -60,7 +108,7 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         layout_2.addWidget(self.Output_Widget_1)
         self.Widget_Output_1.setLayout(layout_2)
       
-        self.Output_Widget_1.image_uploaded.connect(self.on_new_image_uploaded)
+        self.Output_Widget_1.image_uploaded.connect(lambda: self.Image_Uploaded(self.Output_Widget_1))
       
         layout_3 = QVBoxLayout(self.Widget_Output_2)
         self.Output_Widget_2 = ImageWidget(None, self.Widget_Output_2)
@@ -71,12 +119,14 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         self.Combox_Edges.currentIndexChanged.connect(self.Apply_Edge_Filter)
         self.Combox_Noise.currentIndexChanged.connect(self.Apply_Noise_and_Filter)
         self.Combox_Filter.currentIndexChanged.connect(self.Apply_Noise_and_Filter)   
-        self.slider_param_1.sliderReleased.connect(self.Apply_Noise_and_Filter)
-        self.slider_param_2.sliderReleased.connect(self.Apply_Noise_and_Filter)
-        self.slider_param_3.sliderReleased.connect(self.Apply_Noise_and_Filter)
-        self.slider_freq_domain.sliderReleased.connect(self.Apply_Frequency_Filter)
-        self.slider_freq_img1.sliderReleased.connect(self.Apply_hyprid_filter)
-        self.slider_freq_img2.sliderReleased.connect(self.Apply_hyprid_filter)
+        for slider, handler in ((self.slider_param_1, self.Apply_Noise_and_Filter),
+                                (self.slider_param_2, self.Apply_Noise_and_Filter),
+                                (self.slider_param_3, self.Apply_Noise_and_Filter),
+                                (self.slider_freq_domain, self.Apply_Frequency_Filter),
+                                (self.slider_freq_img1, self.Apply_hyprid_filter),
+                                (self.slider_freq_img2, self.Apply_hyprid_filter)):
+            slider.valueChanged.connect(lambda value, handler=handler: self.Preview_Slider(handler))
+            slider.sliderReleased.connect(lambda handler=handler: self.Release_Slider(handler))
 
 
 
@@ -89,8 +139,34 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         self.RadioButton_Domain_Filter.clicked.connect(self.Apply_Frequency_Filter)
         self.RadioButton_Mixer.clicked.connect(self.Apply_hyprid_filter)
 
+        QShortcut(QKeySequence("Ctrl+R"), self, self.Render_Full_Resolution)
+        QShortcut(QKeySequence("Ctrl+S"), self, self.Export_Outputs)
+        QShortcut(QKeySequence("Ctrl+B"), self, self.Next_Backend)
+
+
 
 
+    def Image_Uploaded(self, widget):
+        # results of the replaced image can not be asked for again
+        for key in self.input_keys.pop(widget, ()):
+            self.results.invalidate(key)
+        self.on_new_image_uploaded()
+
+    def Publish_Cached(self, targets, key, on_done=None):
+        """Paint the cached result of key on targets, returning False on a miss."""
+        result=self.results.get(key)
+        if result is None:
+            return False
+        self.jobs.publish(targets, result, on_done)
+        return True
+
+    def Submit_And_Cache(self, targets, key, run, on_done=None, **job_options):
+        """Submit run as a job and cache its result under key."""
+        def run_and_store(token):
+            result=run(token)
+            self.results.put(key, result)
+            return result
+        self.jobs.submit(targets, run_and_store, on_done, **job_options)
 
     def on_new_image_uploaded(self):
         selected_button = self.Mode_group.checkedButton()
@@ -112,61 +188,41 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         
 
 
+    def Run_Graph(self, targets, outputs, sources, params, **job_options):
+        """Paint graph outputs on targets, from the result cache or a job evaluating only the stale nodes."""
+        key=self.graph.key(outputs, sources, params)
+        if not self.Publish_Cached(targets, key):
+            run=lambda token: self.graph.evaluate(outputs, sources, params, token)
+            self.Submit_And_Cache(targets, key, run, **job_options)
+
     def Apply_Edge_Filter(self):
-        self.Set_Output_Labels("Gradient X" , "Gradient Y")
-        
         curr_filter=self.Combox_Edges.currentText()
-        curr_grayImg=self.org_ImgWidget.get_curr_GrayImg()
+        self.Set_Output_Labels(*get_operation("edges", curr_filter).labels)
+        curr_grayImg=self.Get_Input_GrayImg(self.org_ImgWidget)
         if curr_grayImg is not None:
-            if curr_filter=="Sobel":
-                img_1 , img_2=Sobel_Filter(curr_grayImg)
-            elif curr_filter=="Roberts":
-                img_1 , img_2=Robert_Filter(curr_grayImg)
-            elif curr_filter=="Prewitt":
-                img_1 , img_2=Prewitt_Filter(curr_grayImg)
-            elif curr_filter=="Canny":
-                self.Set_Output_Labels("Gradient " , "Output_2")
-                img_1 , img_2=Canny_Filter(curr_grayImg)
-
-            self.Output_Widget_1.Set_Image(img_1)
-            self.Output_Widget_2.Set_Image(img_2)
+            self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), "edges", {"gray": curr_grayImg},
+                           {"edges": {"kind": curr_filter, "backend": get_backend()}})
     
-    def Apply_Noise(self):
+    def Noise_Params(self):
+        """Return the noise and filter node parameters of the sliders and combo boxes."""
         self.Set_noise_label()
-        curr_noise=self.Combox_Noise.currentText()
-        curr_grayImg=self.org_ImgWidget.get_curr_GrayImg()
-        if curr_grayImg is not None:
-            param_1=self.slider_param_1.value()
-            param_2=self.slider_param_2.value()
-            if curr_noise == "Gaussian":
-                noisy_image = apply_gaussian_noise(curr_grayImg,param_1,param_2)
-            elif curr_noise == "Uniform":
-                noisy_image = apply_uniform_noise(curr_grayImg,param_1,param_2)
-            elif curr_noise == "Salt and Pepper":
-                noisy_image = apply_salt_and_pepper_noise(curr_grayImg,param_1/100,param_2/100)
-            
-            self.noisy_img=noisy_image
-            self.Output_Widget_1.Set_Image(noisy_image)
-            
-    
-    def Apply_Filter(self):
         self.handel_carnel_size()
-        ksize=self.slider_param_3.value()
-        curr_filter=self.Combox_Filter.currentText()
-        curr_grayImg=self.noisy_img
-        if self.noisy_img is not None:
-            if curr_filter == "Gaussian":
-                filterd_img = apply_gaussian_filter(curr_grayImg,ksize)
-            elif curr_filter == "Median":
-                filterd_img = apply_median_filter(curr_grayImg,ksize)
-            elif curr_filter == "Average":
-                filterd_img = apply_averaging_filter(curr_grayImg,ksize)
-            self.Output_Widget_2.Set_Image(filterd_img)
-    
+        curr_noise=self.Combox_Noise.currentText()
+        param_1, param_2=(param.from_slider(slider.value()) for param, slider in
+                          zip(get_operation("noise", curr_noise).params, (self.slider_param_1, self.slider_param_2)))
+        return {"noise": {"kind": curr_noise, "param_1": param_1, "param_2": param_2},
+                "filter": {"kind": self.Combox_Filter.currentText(), "ksize": self.slider_param_3.value(),
+                           "backend": get_backend()}}
+
     def Apply_Noise_and_Filter(self):
-        self.Set_Output_Labels("Noisy Image " , "Filtered Image")
-        self.Apply_Noise()
-        self.Apply_Filter()
+        self.Set_Output_Labels(*get_operation("noise", self.Combox_Noise.currentText()).labels,
+                               *get_operation("filter", self.Combox_Filter.currentText()).labels)
+        curr_grayImg=self.Get_Input_GrayImg(self.org_ImgWidget)
+        if curr_grayImg is not None:
+            # only the filter node reruns when just the kernel changed, the noise draw is kept
+            self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), ("noise", "filter"), {"gray": curr_grayImg},
+                           self.Noise_Params(), name=self.Job_Name(self.Apply_Noise_and_Filter),
+                           pixels=curr_grayImg.size)
 
     
     
@@ -175,44 +231,155 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
     
     def Apply_Frequency_Filter(self):
         self.Set_Output_Labels("Low Pass Filter " , "High Pass Filter")
-        curr_grayImg=self.org_ImgWidget.get_curr_GrayImg()
+        curr_grayImg=self.Get_Input_GrayImg(self.org_ImgWidget)
         if curr_grayImg is not None:
             radius=self.slider_freq_domain.value()
-            print(radius)
-            low_pass_filterd_img = low_pass_filter(curr_grayImg,radius)
-            
-            high_pass_filterd_img = high_pass_filter(curr_grayImg,radius)
-            self.Output_Widget_1.Set_Image(low_pass_filterd_img)
-            self.Output_Widget_2.Set_Image(high_pass_filterd_img)
+            if self.full_resolution:
+                # one-off render, not worth a radius sweep
+                self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), "frequency_direct", {"gray": curr_grayImg},
+                               {"frequency_direct": {"radius": radius}})
+            else:
+                self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), "frequency", {"gray": curr_grayImg},
+                               {"frequency_bank": {"radii": self.Slider_Radii(self.slider_freq_domain)},
+                                "frequency": {"radius": radius}})
 
     def Apply_hyprid_filter(self):  
-        curr_grayImg=self.org_ImgWidget.get_curr_GrayImg()
-        curr_grayImg_2=self.Output_Widget_1.get_curr_GrayImg()
+        curr_grayImg=self.Get_Input_GrayImg(self.org_ImgWidget)
+        # the second image is whatever Output_Widget_1 shows, uploaded or computed
+        curr_grayImg_2=self.Get_Input_GrayImg(self.Output_Widget_1)
         self.Set_Output_Labels("Image_2" , "Hybrid Image")
         if curr_grayImg is not None and curr_grayImg_2 is not None:
             radius1=self.slider_freq_img1.value()
             radius2=self.slider_freq_img2.value()
-            hyprid_img = hybrid(curr_grayImg,curr_grayImg_2,radius1,radius2)
-            self.Output_Widget_2.Set_Image(hyprid_img)  
-
-
-
-
+            sources={"gray": curr_grayImg, "image_2": curr_grayImg_2}
+            if self.full_resolution:
+                self.Run_Graph((self.Output_Widget_2,), ("hybrid_direct",), sources,
+                               {"hybrid_direct": {"radius1": radius1, "radius2": radius2}})
+            else:
+                self.Run_Graph((self.Output_Widget_2,), ("hybrid",), sources,
+                               {"hybrid_low_bank": {"radii": self.Slider_Radii(self.slider_freq_img1)},
+                                "hybrid_high_bank": {"radii": self.Slider_Radii(self.slider_freq_img2)},
+                                "hybrid": {"radius1": radius1, "radius2": radius2}})
+
+    def Slider_Radii(self, slider):
+        # filter banks sweep the whole range of their slider
+        return tuple(range(slider.minimum(), slider.maximum() + 1))
+
+
+
+
+    def Get_Input_GrayImg(self, widget):
+        if self.full_resolution:
+            image=widget.get_full_GrayImg()
+        elif self.preview_size is not None and widget.get_curr_GrayImg() is not None:
+            image=widget.get_proxy(self.preview_size)[1]
+        else:
+            image=widget.get_curr_GrayImg()
+        return self.Track_Input(widget, image)
+
+    def Get_Input_RGBImg(self, widget):
+        if self.full_resolution:
+            image=widget.get_full_RGBImg()
+        elif self.preview_size is not None and widget.get_curr_RGBImg() is not None:
+            image=widget.get_proxy(self.preview_size)[0]
+        else:
+            image=widget.get_curr_RGBImg()
+        return self.Track_Input(widget, image)
+
+    def Track_Input(self, widget, image):
+        # remember the content read from widget, to drop its cached results on the next upload
+        if image is not None:
+            self.input_keys.setdefault(widget, set()).add(content_key(image))
+        return image
+
+    def Preview_Slider(self, handler):
+        """Debounce a slider move: preview handler shortly, refine once the slider rests."""
+        if not self.live_preview:
+            return
+        self._preview_handler=handler
+        self._preview_timer.start()
+        self._refine_timer.start()
+
+    def Release_Slider(self, handler):
+        # without live preview, operations only follow released sliders
+        if not self.live_preview:
+            handler()
+
+    def Job_Name(self, handler):
+        """Return the name the run time of handler's jobs is recorded and estimated under."""
+        name=handler.__name__
+        if handler == self.Apply_Noise_and_Filter:
+            # the cost depends on the filter and on the backend running it
+            name+=":"+self.Combox_Filter.currentText()+":"+get_backend()
+        return name
+
+    def Preview_Scale(self, handler):
+        """Return the proxy scale that keeps handler within its preview budget."""
+        budget=PREVIEW_BUDGET_MS.get(handler.__name__)
+        curr_grayImg=self.org_ImgWidget.get_curr_GrayImg()
+        if budget is None or curr_grayImg is None:
+            return 1
+        expected=self.jobs.estimate(self.Job_Name(handler), curr_grayImg.size)
+        if expected is None or expected*1000 <= budget:
+            return 1
+        # the cost grows with the pixel count, so shrink both sides by the square root
+        return max(np.sqrt(budget/(expected*1000)), PREVIEW_MIN_SCALE)
+
+    def Run_Preview(self):
+        handler=self._preview_handler
+        if handler is None:
+            return
+        scale=self.Preview_Scale(handler)
+        if scale < 1:
+            height, width=self.org_ImgWidget.get_curr_GrayImg().shape
+            self.preview_size=(max(int(width*scale), 1), max(int(height*scale), 1))
+            self._preview_refine=True
+        try:
+            handler()
+        finally:
+            self.preview_size=None
+
+    def Refine_Preview(self):
+        """Re-run the last previewed operation on the display proxy once its slider settled."""
+        if self._preview_refine:
+            self._preview_refine=False
+            self._preview_handler()
+
+    def Render_Full_Resolution(self):
+        """Re-run the selected mode on the full-resolution inputs and wait for it (Ctrl+R)."""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self.full_resolution=True
+        try:
+            self.on_new_image_uploaded()
+        finally:
+            self.full_resolution=False
+        try:
+            self.jobs.wait()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+    def Export_Outputs(self):
+        """Render the selected mode at full resolution and save both outputs (Ctrl+S)."""
+        if self.Output_Widget_1.get_full_GrayImg() is None:
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Export Outputs")
+        if directory:
+            self.Render_Full_Resolution()
+            for index, widget in enumerate((self.Output_Widget_1, self.Output_Widget_2), start=1):
+                if widget.get_full_GrayImg() is not None:
+                    widget.save_image(os.path.join(directory, f"output_{index}.png"))
 
     def Draw_Histogram(self):
         self.Set_Output_Labels("Histogram" , " CDF ")
-        curr_img=self.org_ImgWidget.get_curr_GrayImg()
+        curr_img=self.Get_Input_GrayImg(self.org_ImgWidget)
         if curr_img is not None:
             if self.checkBox_rgbImg.isChecked():
-                curr_img_rgb =self.org_ImgWidget.get_curr_RGBImg()
+                curr_img_rgb =self.Get_Input_RGBImg(self.org_ImgWidget)
                 self.org_ImgWidget.display_RGBImg()
-                hist_bars_img, cdf_img=process_image(curr_img_rgb , mode="rgb")
+                self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), "rgb_histogram", {"rgb": curr_img_rgb}, {})
             else:
                 self.org_ImgWidget.display_GrayImg()
-                hist_bars_img, cdf_img=process_image(curr_img, mode="gray")
-            
-            self.Output_Widget_1.Set_Image(hist_bars_img)
-            self.Output_Widget_2.Set_Image(cdf_img)
+                self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), "histogram", {"gray": curr_img}, {})
 
     
     def Draw_Histogram_rgb(self):
@@ -226,21 +393,15 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
 
     def Normalize_and_Equalize(self):
         self.Set_Output_Labels("Normalized Image" , " Equalized Image ")
-        curr_img=self.org_ImgWidget.get_curr_GrayImg()
+        curr_img=self.Get_Input_GrayImg(self.org_ImgWidget)
         if curr_img is not None:
-            norm_Img=normalize_image(curr_img )
-            equal_Img=equalize_image(curr_img)
-            self.Output_Widget_1.Set_Image(norm_Img)
-            self.Output_Widget_2.Set_Image(equal_Img)
+            self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), ("normalized", "equalized"), {"gray": curr_img}, {})
     
     def Apply_Thersholding(self):
         self.Set_Output_Labels("Global Thershold" , " Local Thershold ")
-        curr_img=self.org_ImgWidget.get_curr_GrayImg()
+        curr_img=self.Get_Input_GrayImg(self.org_ImgWidget)
         if curr_img is not None:
-            global_ther_Img=manual_global_threshold(curr_img )
-            local_ther_Img=manual_local_threshold(curr_img)
-            self.Output_Widget_1.Set_Image(global_ther_Img)
-            self.Output_Widget_2.Set_Image(local_ther_Img)
+            self.Run_Graph((self.Output_Widget_1, self.Output_Widget_2), ("global_threshold", "local_threshold"), {"gray": curr_img}, {})
 
 
 
@@ -261,29 +422,24 @@ class MainWindow(QMainWindow , Ui_MainWindow ):
         if label_2:
             self.Label_output_2.setText(label_2)
     def Set_noise_label(self):
-        curr_label=self.Combox_Noise.currentText()
+        curr_noise=get_operation("noise", self.Combox_Noise.currentText())
         fixed_width = 150
 
-        self.label_param_1.setFixedWidth(fixed_width)
-        self.label_param_2.setFixedWidth(fixed_width)
-        if curr_label=="Salt and Pepper":
-            self.label_param_1.setText("Salt Probability :   ")
-            self.label_param_2.setText("Pepper Probability : ")
-            self.slider_limit(self.slider_param_1)
-            self.slider_limit(self.slider_param_2)
-
-        elif curr_label=="Gaussian":   
-            self.label_param_1.setText("Mean :               ")
-            self.label_param_2.setText("Variance :           ")
-            self.slider_limit(self.slider_param_1)
-            self.slider_limit(self.slider_param_2,min=1)
-
-        elif curr_label =="Uniform":                         
-            self.label_param_1.setText("Min Value :          ")
-            self.label_param_2.setText("Max Value :          ")
-            self.slider_limit(self.slider_param_1)
-            self.slider_limit(self.slider_param_2)
-
+        # the labels and slider ranges are the parameters the noise declares
+        for label, slider, param in zip((self.label_param_1, self.label_param_2),
+                                        (self.slider_param_1, self.slider_param_2), curr_noise.params):
+            label.setFixedWidth(fixed_width)
+            label.setText(f"{param.label} :".ljust(21))
+            self.slider_limit(slider, min=param.minimum, max=param.maximum)
+
+
+    def Next_Backend(self):
+        """Switch the operations to the next installed backend and rerun the current mode."""
+        backends=available_backends()
+        index=backends.index(get_backend()) if get_backend() in backends else -1
+        set_backend(backends[(index+1)%len(backends)])
+        self.statusbar.showMessage(f"Backend: {get_backend()}", 3000)
+        self.on_new_image_uploaded()
 
     def slider_limit(self,slider,min=0,max=100,step=1):
         slider.setMinimum(min)
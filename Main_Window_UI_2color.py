@@ -0,0 +1,858 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'Main_Window_UI_2color.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1361, 979)
+        MainWindow.setStyleSheet("background:rgba(158,177,175,255);")
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName("gridLayout")
+        self.groupBox_3 = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_3.setMaximumSize(QtCore.QSize(1877, 900))
+        self.groupBox_3.setStyleSheet("background:rgba(158,177,175,255);\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"  border-radius: 20px;")
+        self.groupBox_3.setTitle("")
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.groupBox_3)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        self.label_13 = QtWidgets.QLabel(self.groupBox_3)
+        font = QtGui.QFont()
+        self.label_13.setFont(font)
+        self.label_13.setStyleSheet("Font-size:20px;\n"
+"color:Black;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;\n"
+"")
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_16.addWidget(self.label_13)
+        self.Label_output_1 = QtWidgets.QLabel(self.groupBox_3)
+        font = QtGui.QFont()
+        self.Label_output_1.setFont(font)
+        self.Label_output_1.setStyleSheet("Font-size:20px;\n"
+"color:Black;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;\n"
+"")
+        self.Label_output_1.setObjectName("Label_output_1")
+        self.horizontalLayout_16.addWidget(self.Label_output_1)
+        self.Label_output_2 = QtWidgets.QLabel(self.groupBox_3)
+        font = QtGui.QFont()
+        font.setPointSize(1)
+        self.Label_output_2.setFont(font)
+        self.Label_output_2.setStyleSheet("Font-size:20px;\n"
+"color:Black;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;\n"
+"")
+        self.Label_output_2.setObjectName("Label_output_2")
+        self.horizontalLayout_16.addWidget(self.Label_output_2)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_16)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.Widget_Org_Image = QtWidgets.QWidget(self.groupBox_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Widget_Org_Image.sizePolicy().hasHeightForWidth())
+        self.Widget_Org_Image.setSizePolicy(sizePolicy)
+        self.Widget_Org_Image.setMinimumSize(QtCore.QSize(100, 100))
+        self.Widget_Org_Image.setStyleSheet("background-color:white;\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"border-radius:20px;")
+        self.Widget_Org_Image.setObjectName("Widget_Org_Image")
+        self.horizontalLayout_5.addWidget(self.Widget_Org_Image)
+        self.Widget_Output_1 = QtWidgets.QWidget(self.groupBox_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Widget_Output_1.sizePolicy().hasHeightForWidth())
+        self.Widget_Output_1.setSizePolicy(sizePolicy)
+        self.Widget_Output_1.setMinimumSize(QtCore.QSize(100, 100))
+        self.Widget_Output_1.setStyleSheet("background-color:white;\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"border-radius:20px;")
+        self.Widget_Output_1.setObjectName("Widget_Output_1")
+        self.horizontalLayout_5.addWidget(self.Widget_Output_1)
+        self.Widget_Output_2 = QtWidgets.QWidget(self.groupBox_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Widget_Output_2.sizePolicy().hasHeightForWidth())
+        self.Widget_Output_2.setSizePolicy(sizePolicy)
+        self.Widget_Output_2.setMinimumSize(QtCore.QSize(100, 100))
+        self.Widget_Output_2.setStyleSheet("background-color:white;\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"border-radius:20px;")
+        self.Widget_Output_2.setObjectName("Widget_Output_2")
+        self.horizontalLayout_5.addWidget(self.Widget_Output_2)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_5)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.widget_11 = QtWidgets.QWidget(self.groupBox_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_11.sizePolicy().hasHeightForWidth())
+        self.widget_11.setSizePolicy(sizePolicy)
+        self.widget_11.setStyleSheet("\n"
+"background:rgba(158,177,175,255);\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"  border-radius: 20px;")
+        self.widget_11.setObjectName("widget_11")
+        self.horizontalLayout_50 = QtWidgets.QHBoxLayout(self.widget_11)
+        self.horizontalLayout_50.setObjectName("horizontalLayout_50")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.RadioButton_NoiseandFilter = QtWidgets.QRadioButton(self.widget_11)
+        font = QtGui.QFont()
+        font.setPointSize(1)
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_NoiseandFilter.setFont(font)
+        self.RadioButton_NoiseandFilter.setStyleSheet("Font-size:22px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+" border-top: 3px solid rgba(68,82,83,255);\n"
+" border-bottom: 3px solid rgba(68,82,83,255);\n"
+"border-left:None;\n"
+"border-right:None;\n"
+"")
+        self.RadioButton_NoiseandFilter.setChecked(False)
+        self.RadioButton_NoiseandFilter.setObjectName("RadioButton_NoiseandFilter")
+        self.verticalLayout_13.addWidget(self.RadioButton_NoiseandFilter)
+        self.horizontalLayout_51 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_51.setObjectName("horizontalLayout_51")
+        self.label_param_4 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_param_4.setFont(font)
+        self.label_param_4.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;")
+        self.label_param_4.setObjectName("label_param_4")
+        self.horizontalLayout_51.addWidget(self.label_param_4)
+        self.Combox_Noise = QtWidgets.QComboBox(self.widget_11)
+        self.Combox_Noise.setStyleSheet("Font-size:15px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:3px solid black;\n"
+"padding:2px;\n"
+"border-radius:7px;\n"
+" border: 3px solid rgba(68,82,83,255);")
+        self.Combox_Noise.setObjectName("Combox_Noise")
+        self.Combox_Noise.addItem("")
+        self.Combox_Noise.addItem("")
+        self.Combox_Noise.addItem("")
+        self.horizontalLayout_51.addWidget(self.Combox_Noise)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_51.addItem(spacerItem)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_51.addItem(spacerItem1)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_51)
+        self.horizontalLayout_52 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_52.setObjectName("horizontalLayout_52")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_52.addItem(spacerItem2)
+        self.label_param_1 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_param_1.setFont(font)
+        self.label_param_1.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;")
+        self.label_param_1.setObjectName("label_param_1")
+        self.horizontalLayout_52.addWidget(self.label_param_1)
+        self.slider_param_1 = QtWidgets.QSlider(self.widget_11)
+        self.slider_param_1.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_param_1.setMaximum(100)
+        self.slider_param_1.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_param_1.setObjectName("slider_param_1")
+        self.horizontalLayout_52.addWidget(self.slider_param_1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_52.addItem(spacerItem3)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_52.addItem(spacerItem4)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_52)
+        self.horizontalLayout_53 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_53.setObjectName("horizontalLayout_53")
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_53.addItem(spacerItem5)
+        self.label_param_2 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_param_2.setFont(font)
+        self.label_param_2.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;")
+        self.label_param_2.setObjectName("label_param_2")
+        self.horizontalLayout_53.addWidget(self.label_param_2)
+        self.slider_param_2 = QtWidgets.QSlider(self.widget_11)
+        self.slider_param_2.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_param_2.setMaximum(100)
+        self.slider_param_2.setTracking(True)
+        self.slider_param_2.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_param_2.setObjectName("slider_param_2")
+        self.horizontalLayout_53.addWidget(self.slider_param_2)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_53.addItem(spacerItem6)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_53.addItem(spacerItem7)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_53)
+        self.line_15 = QtWidgets.QFrame(self.widget_11)
+        font = QtGui.QFont()
+        font.setPointSize(5)
+        self.line_15.setFont(font)
+        self.line_15.setStyleSheet("border: 1px solid black;")
+        self.line_15.setLineWidth(0)
+        self.line_15.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_15.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_15.setObjectName("line_15")
+        self.verticalLayout_13.addWidget(self.line_15)
+        self.line_16 = QtWidgets.QFrame(self.widget_11)
+        self.line_16.setStyleSheet("border: 0.5px solid black;")
+        self.line_16.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_16.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_16.setObjectName("line_16")
+        self.verticalLayout_13.addWidget(self.line_16)
+        self.horizontalLayout_54 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_54.setObjectName("horizontalLayout_54")
+        self.label_34 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_34.setFont(font)
+        self.label_34.setStyleSheet("Font-size:20px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;\n"
+"")
+        self.label_34.setObjectName("label_34")
+        self.horizontalLayout_54.addWidget(self.label_34)
+        self.Combox_Filter = QtWidgets.QComboBox(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.Combox_Filter.setFont(font)
+        self.Combox_Filter.setStyleSheet("Font-size:15px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:3px solid black;\n"
+"padding:2px;\n"
+"border-radius:7px;\n"
+" border: 3px solid rgba(68,82,83,255);")
+        self.Combox_Filter.setObjectName("Combox_Filter")
+        self.Combox_Filter.addItem("")
+        self.Combox_Filter.addItem("")
+        self.Combox_Filter.addItem("")
+        self.horizontalLayout_54.addWidget(self.Combox_Filter)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_54.addItem(spacerItem8)
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_54.addItem(spacerItem9)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_54)
+        self.horizontalLayout_56 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_56.setObjectName("horizontalLayout_56")
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_56.addItem(spacerItem10)
+        self.label_param_3 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_param_3.setFont(font)
+        self.label_param_3.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;")
+        self.label_param_3.setObjectName("label_param_3")
+        self.horizontalLayout_56.addWidget(self.label_param_3)
+        self.slider_param_3 = QtWidgets.QSlider(self.widget_11)
+        self.slider_param_3.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_param_3.setMinimum(1)
+        self.slider_param_3.setMaximum(31)
+        self.slider_param_3.setSingleStep(2)
+        self.slider_param_3.setPageStep(2)
+        self.slider_param_3.setProperty("value", 3)
+        self.slider_param_3.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_param_3.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_param_3.setObjectName("slider_param_3")
+        self.horizontalLayout_56.addWidget(self.slider_param_3)
+        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_56.addItem(spacerItem11)
+        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_56.addItem(spacerItem12)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_56)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_13.addItem(spacerItem13)
+        spacerItem14 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_13.addItem(spacerItem14)
+        self.RadioButton_Mixer = QtWidgets.QRadioButton(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_Mixer.setFont(font)
+        self.RadioButton_Mixer.setStyleSheet("Font-size:22px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+" border-top: 3px solid rgba(68,82,83,255);\n"
+" border-bottom: 3px solid rgba(68,82,83,255);\n"
+"border-left:None;\n"
+"border-right:None;\n"
+"")
+        self.RadioButton_Mixer.setChecked(False)
+        self.RadioButton_Mixer.setObjectName("RadioButton_Mixer")
+        self.verticalLayout_13.addWidget(self.RadioButton_Mixer)
+        spacerItem15 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_13.addItem(spacerItem15)
+        self.horizontalLayout_23 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_23.setObjectName("horizontalLayout_23")
+        self.label_freq_img1 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_freq_img1.setFont(font)
+        self.label_freq_img1.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;\n"
+"")
+        self.label_freq_img1.setObjectName("label_freq_img1")
+        self.horizontalLayout_23.addWidget(self.label_freq_img1)
+        self.slider_freq_img1 = QtWidgets.QSlider(self.widget_11)
+        self.slider_freq_img1.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_freq_img1.setMaximum(100)
+        self.slider_freq_img1.setProperty("value", 20)
+        self.slider_freq_img1.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_freq_img1.setObjectName("slider_freq_img1")
+        self.horizontalLayout_23.addWidget(self.slider_freq_img1)
+        spacerItem16 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_23.addItem(spacerItem16)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_23)
+        spacerItem17 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_13.addItem(spacerItem17)
+        self.horizontalLayout_24 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_24.setObjectName("horizontalLayout_24")
+        self.label_freq_img2 = QtWidgets.QLabel(self.widget_11)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_freq_img2.setFont(font)
+        self.label_freq_img2.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;\n"
+"")
+        self.label_freq_img2.setObjectName("label_freq_img2")
+        self.horizontalLayout_24.addWidget(self.label_freq_img2)
+        self.slider_freq_img2 = QtWidgets.QSlider(self.widget_11)
+        self.slider_freq_img2.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_freq_img2.setMaximum(100)
+        self.slider_freq_img2.setProperty("value", 20)
+        self.slider_freq_img2.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_freq_img2.setObjectName("slider_freq_img2")
+        self.horizontalLayout_24.addWidget(self.slider_freq_img2)
+        spacerItem18 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_24.addItem(spacerItem18)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_24)
+        spacerItem19 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_13.addItem(spacerItem19)
+        self.horizontalLayout_50.addLayout(self.verticalLayout_13)
+        self.horizontalLayout_8.addWidget(self.widget_11)
+        self.widget_10 = QtWidgets.QWidget(self.groupBox_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_10.sizePolicy().hasHeightForWidth())
+        self.widget_10.setSizePolicy(sizePolicy)
+        self.widget_10.setStyleSheet("\n"
+"background:rgba(158,177,175,255);\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"  border-radius: 20px;")
+        self.widget_10.setObjectName("widget_10")
+        self.horizontalLayout_19 = QtWidgets.QHBoxLayout(self.widget_10)
+        self.horizontalLayout_19.setObjectName("horizontalLayout_19")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.label_freq_img1_2 = QtWidgets.QLabel(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_freq_img1_2.setFont(font)
+        self.label_freq_img1_2.setStyleSheet("Font-size:22px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+" border-top: 3px solid rgba(68,82,83,255);\n"
+" border-bottom: 3px solid rgba(68,82,83,255);\n"
+"border-left:None;\n"
+"border-right:None;\n"
+"")
+        self.label_freq_img1_2.setObjectName("label_freq_img1_2")
+        self.verticalLayout_8.addWidget(self.label_freq_img1_2)
+        spacerItem20 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem20)
+        self.horizontalLayout_20 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_20.setObjectName("horizontalLayout_20")
+        self.RadioButton_Histogram = QtWidgets.QRadioButton(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_Histogram.setFont(font)
+        self.RadioButton_Histogram.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;")
+        self.RadioButton_Histogram.setChecked(False)
+        self.RadioButton_Histogram.setObjectName("RadioButton_Histogram")
+        self.horizontalLayout_20.addWidget(self.RadioButton_Histogram)
+        self.checkBox_rgbImg = QtWidgets.QCheckBox(self.widget_10)
+        font = QtGui.QFont()
+        self.checkBox_rgbImg.setFont(font)
+        self.checkBox_rgbImg.setStyleSheet("Font-size:17px;\n"
+"color:white;\n"
+"\n"
+"padding:2px;\n"
+"border-radius:10px;\n"
+"\n"
+"\n"
+"background:rgba(158,177,175,255);\n"
+"  border: 3px solid rgba(68,82,83,255);\n"
+"\n"
+"")
+        self.checkBox_rgbImg.setObjectName("checkBox_rgbImg")
+        self.horizontalLayout_20.addWidget(self.checkBox_rgbImg)
+        spacerItem21 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_20.addItem(spacerItem21)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_20)
+        spacerItem22 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem22)
+        self.horizontalLayout_55 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_55.setObjectName("horizontalLayout_55")
+        self.RadioButton_DetectEdges = QtWidgets.QRadioButton(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_DetectEdges.setFont(font)
+        self.RadioButton_DetectEdges.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;")
+        self.RadioButton_DetectEdges.setChecked(False)
+        self.RadioButton_DetectEdges.setObjectName("RadioButton_DetectEdges")
+        self.horizontalLayout_55.addWidget(self.RadioButton_DetectEdges)
+        self.Combox_Edges = QtWidgets.QComboBox(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.Combox_Edges.setFont(font)
+        self.Combox_Edges.setStyleSheet("Font-size:15px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:3px solid black;\n"
+"padding:2px;\n"
+"border-radius:7px;\n"
+" border: 3px solid rgba(68,82,83,255);")
+        self.Combox_Edges.setObjectName("Combox_Edges")
+        self.Combox_Edges.addItem("")
+        self.Combox_Edges.addItem("")
+        self.Combox_Edges.addItem("")
+        self.Combox_Edges.addItem("")
+        self.horizontalLayout_55.addWidget(self.Combox_Edges)
+        spacerItem23 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_55.addItem(spacerItem23)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_55)
+        spacerItem24 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem24)
+        self.RadioButton_Normalizer = QtWidgets.QRadioButton(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_Normalizer.setFont(font)
+        self.RadioButton_Normalizer.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"border:None;")
+        self.RadioButton_Normalizer.setChecked(False)
+        self.RadioButton_Normalizer.setObjectName("RadioButton_Normalizer")
+        self.verticalLayout_8.addWidget(self.RadioButton_Normalizer)
+        spacerItem25 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem25)
+        self.RadioButton_Threshold = QtWidgets.QRadioButton(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.RadioButton_Threshold.setFont(font)
+        self.RadioButton_Threshold.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;")
+        self.RadioButton_Threshold.setChecked(False)
+        self.RadioButton_Threshold.setObjectName("RadioButton_Threshold")
+        self.verticalLayout_8.addWidget(self.RadioButton_Threshold)
+        spacerItem26 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem26)
+        self.RadioButton_Domain_Filter = QtWidgets.QRadioButton(self.widget_10)
+        self.RadioButton_Domain_Filter.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;\n"
+"")
+        self.RadioButton_Domain_Filter.setObjectName("RadioButton_Domain_Filter")
+        self.verticalLayout_8.addWidget(self.RadioButton_Domain_Filter)
+        spacerItem27 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem27)
+        self.horizontalLayout_21 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_21.setObjectName("horizontalLayout_21")
+        spacerItem28 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_21.addItem(spacerItem28)
+        self.label_freq_domain = QtWidgets.QLabel(self.widget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_freq_domain.setFont(font)
+        self.label_freq_domain.setStyleSheet("Font-size:17px;\n"
+"font-weight:bold;\n"
+"background:rgba(158,177,175,255);\n"
+"color:white;\n"
+"\n"
+"border:None;\n"
+"")
+        self.label_freq_domain.setObjectName("label_freq_domain")
+        self.horizontalLayout_21.addWidget(self.label_freq_domain)
+        self.slider_freq_domain = QtWidgets.QSlider(self.widget_10)
+        self.slider_freq_domain.setStyleSheet("\n"
+"QSlider {\n"
+"    background: transparent; /* Make the entire slider background transparent */\n"
+"    border:None;\n"
+"}\n"
+"\n"
+"\n"
+"QSlider::groove:horizontal {\n"
+"    height: 8px;\n"
+"    background: :rgba(158,177,175,255); /* Lighter shade of the dark color */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::handle:horizontal {\n"
+"    background:  white; /* Mid-tone between the dark and lighter colors */\n"
+"    border: 2px solid #595e67; /* Matches groove */\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: #595e67; /* Matches handle */\n"
+"    border-radius: 4px;\n"
+"}\n"
+"\n"
+"QSlider::add-page:horizontal {\n"
+"   \n"
+"    border:2px solid #595e67;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"")
+        self.slider_freq_domain.setMaximum(100)
+        self.slider_freq_domain.setProperty("value", 20)
+        self.slider_freq_domain.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_freq_domain.setObjectName("slider_freq_domain")
+        self.horizontalLayout_21.addWidget(self.slider_freq_domain)
+        spacerItem29 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.horizontalLayout_21.addItem(spacerItem29)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_21)
+        self.line_5 = QtWidgets.QFrame(self.widget_10)
+        font = QtGui.QFont()
+        font.setPointSize(5)
+        self.line_5.setFont(font)
+        self.line_5.setStyleSheet("border: 1px solid black;")
+        self.line_5.setLineWidth(0)
+        self.line_5.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.verticalLayout_8.addWidget(self.line_5)
+        spacerItem30 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem30)
+        self.horizontalLayout_22 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_22.setObjectName("horizontalLayout_22")
+        self.verticalLayout_8.addLayout(self.horizontalLayout_22)
+        spacerItem31 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem31)
+        self.line_6 = QtWidgets.QFrame(self.widget_10)
+        self.line_6.setStyleSheet("border: 0.5px solid black;")
+        self.line_6.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_6.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_6.setObjectName("line_6")
+        self.verticalLayout_8.addWidget(self.line_6)
+        self.horizontalLayout_19.addLayout(self.verticalLayout_8)
+        self.horizontalLayout_8.addWidget(self.widget_10)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_8)
+        self.verticalLayout_5.setStretch(0, 1)
+        self.verticalLayout_5.setStretch(1, 7)
+        self.verticalLayout_5.setStretch(2, 7)
+        self.horizontalLayout_15.addLayout(self.verticalLayout_5)
+        self.gridLayout_7.addLayout(self.horizontalLayout_15, 0, 0, 1, 1)
+        self.gridLayout.addWidget(self.groupBox_3, 0, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1361, 26))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label_13.setText(_translate("MainWindow", "Original Image"))
+        self.Label_output_1.setText(_translate("MainWindow", "Output 1"))
+        self.Label_output_2.setText(_translate("MainWindow", "Output 2"))
+        self.RadioButton_NoiseandFilter.setText(_translate("MainWindow", "                                  Noise and Filter "))
+        self.label_param_4.setText(_translate("MainWindow", "Noise"))
+        self.Combox_Noise.setItemText(0, _translate("MainWindow", "Uniform"))
+        self.Combox_Noise.setItemText(1, _translate("MainWindow", "Gaussian"))
+        self.Combox_Noise.setItemText(2, _translate("MainWindow", "Salt and Pepper"))
+        self.label_param_1.setText(_translate("MainWindow", "Label 1              "))
+        self.label_param_2.setText(_translate("MainWindow", "Label 2              "))
+        self.label_34.setText(_translate("MainWindow", "Filter"))
+        self.Combox_Filter.setCurrentText(_translate("MainWindow", "Average"))
+        self.Combox_Filter.setItemText(0, _translate("MainWindow", "Average"))
+        self.Combox_Filter.setItemText(1, _translate("MainWindow", "Gaussian"))
+        self.Combox_Filter.setItemText(2, _translate("MainWindow", "Median"))
+        self.label_param_3.setText(_translate("MainWindow", "Kernel Size :     "))
+        self.RadioButton_Mixer.setText(_translate("MainWindow", "                                           Mixer"))
+        self.label_freq_img1.setText(_translate("MainWindow", "Radius fo LP:                           "))
+        self.label_freq_img2.setText(_translate("MainWindow", "Radius fo HP:                           "))
+        self.label_freq_img1_2.setText(_translate("MainWindow", "                                     Other Modes"))
+        self.RadioButton_Histogram.setText(_translate("MainWindow", "Histogram and Distribution "))
+        self.checkBox_rgbImg.setText(_translate("MainWindow", "RGB Image"))
+        self.RadioButton_DetectEdges.setText(_translate("MainWindow", "Detect Edge                           "))
+        self.Combox_Edges.setCurrentText(_translate("MainWindow", "Sobel"))
+        self.Combox_Edges.setItemText(0, _translate("MainWindow", "Sobel"))
+        self.Combox_Edges.setItemText(1, _translate("MainWindow", "Roberts"))
+        self.Combox_Edges.setItemText(2, _translate("MainWindow", "Prewitt"))
+        self.Combox_Edges.setItemText(3, _translate("MainWindow", "Canny"))
+        self.RadioButton_Normalizer.setText(_translate("MainWindow", "Norimalizer and Equalizer"))
+        self.RadioButton_Threshold.setText(_translate("MainWindow", "Local and Global thersholding"))
+        self.RadioButton_Domain_Filter.setText(_translate("MainWindow", "Frequancy Domain Filters"))
+        self.label_freq_domain.setText(_translate("MainWindow", "Radius :               "))
+
+
+# Hash of the .ui file this module was generated from, see build_ui.py
+UI_SOURCE_HASH = "98698468e1dd84f1f162a39beb67058d"
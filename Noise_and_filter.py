@@ -1,5 +1,7 @@
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from fft_backend import get_fft_backend
 
 def apply_gaussian_noise(image, mean=0, var=10):
     """
@@ -62,24 +64,198 @@ def apply_salt_and_pepper_noise(image, salt_prob=0.05, pepper_prob=0.05):
     noisy[tuple(coords)] = 0
     return noisy
 
-def convolve2d(image, kernel):
+# Cost of one FFT element per log2(size) step, relative to one whole-array
+# multiply-add of the shift-and-add paths (measured with single-threaded
+# numpy.fft; multithreaded backends only make the FFT path cheaper).
+FFT_COST_FACTOR = 0.7
+
+# Image blocks of the overlap-add FFT path span at least this many pixels
+# and at least FFT_BLOCK_KERNELS kernel lengths.
+FFT_MIN_BLOCK = 256
+FFT_BLOCK_KERNELS = 8
+
+CONVOLVE_METHODS = ('direct', 'separable', 'fft')
+
+
+def _separate_kernel(kernel, rtol=1e-10):
+    """
+    Split a rank-1 kernel into column and row vectors.
+
+    Parameters:
+    kernel (numpy.ndarray): 2-D kernel.
+    rtol (float): Largest ratio of the second to the first singular value
+        still treated as rank 1.
+
+    Returns:
+    tuple or None: (column, row) with np.outer(column, row) equal to the
+    kernel up to rounding, or None if the kernel is not separable.
+    """
+    u, s, vt = np.linalg.svd(kernel.astype(np.float64))
+    if s[0] == 0 or (len(s) > 1 and s[1] > rtol * s[0]):
+        return None
+    scale = np.sqrt(s[0])
+    return u[:, 0] * scale, vt[0] * scale
+
+
+def _fft_blocks(image_shape, kernel_shape):
+    """
+    Choose the overlap-add block size and FFT size for the FFT path.
+
+    Returns:
+    tuple: ((block_h, block_w), (fft_h, fft_w)).
+    """
+    backend = get_fft_backend()
+    block = []
+    fft_shape = []
+    for size, k in zip(image_shape, kernel_shape):
+        block_size = min(size, max(FFT_MIN_BLOCK, FFT_BLOCK_KERNELS * k))
+        block.append(block_size)
+        fft_shape.append(backend.next_fast_len(block_size + k - 1))
+    return tuple(block), tuple(fft_shape)
+
+
+def _convolution_costs(image_shape, kernel_shape, separable):
+    """
+    Estimate the work of every convolution method for the given shapes.
+
+    Returns:
+    dict: Method name to estimated cost, in multiply-adds.
+    """
+    rows, cols = image_shape
+    kernel_h, kernel_w = kernel_shape
+    pixels = rows * cols
+
+    costs = {'direct': kernel_h * kernel_w * pixels}
+    if separable:
+        costs['separable'] = (kernel_h + kernel_w) * pixels
+
+    (block_h, block_w), (fft_h, fft_w) = _fft_blocks(image_shape, kernel_shape)
+    blocks = -(-rows // block_h) * -(-cols // block_w)
+    fft_size = fft_h * fft_w
+    # One forward and one inverse real transform per block
+    costs['fft'] = FFT_COST_FACTOR * blocks * fft_size * float(np.log2(max(fft_size, 2)))
+    return costs
+
+
+def _direct_convolve(image_padded, kernel, rows, cols):
+    """
+    Correlate a padded image with an (already flipped) kernel by adding one
+    shifted view of the image per kernel tap.
+    """
+    output = np.zeros((rows, cols), dtype=np.float64)
+    for a in range(kernel.shape[0]):
+        for b in range(kernel.shape[1]):
+            if kernel[a, b] != 0:
+                output += kernel[a, b] * image_padded[a:a + rows, b:b + cols]
+    return output
+
+
+def _separable_convolve(image_padded, column, row, rows, cols):
+    """
+    Correlate a padded image with the (already flipped) kernel
+    np.outer(column, row) as a row pass followed by a column pass.
+    """
+    padded_rows = rows + len(column) - 1
+    row_filtered = np.zeros((padded_rows, cols), dtype=np.float64)
+    for b in range(len(row)):
+        if row[b] != 0:
+            row_filtered += row[b] * image_padded[:padded_rows, b:b + cols]
+    output = np.zeros((rows, cols), dtype=np.float64)
+    for a in range(len(column)):
+        if column[a] != 0:
+            output += column[a] * row_filtered[a:a + rows]
+    return output
+
+
+def _fft_convolve(image, kernel):
+    """
+    Full linear convolution of an image with a kernel using overlap-add:
+    the image is cut into blocks, each block is convolved through real FFTs
+    and the overlapping results are summed.
+
+    Returns:
+    numpy.ndarray: Float64 array of shape (rows + kh - 1, cols + kw - 1).
+    """
+    rows, cols = image.shape
+    kernel_h, kernel_w = kernel.shape
+    (block_h, block_w), fft_shape = _fft_blocks(image.shape, kernel.shape)
+
+    backend = get_fft_backend()
+    kernel_fft = backend.rfft2(kernel.astype(np.float64), s=fft_shape)
+    full = np.zeros((rows + kernel_h - 1, cols + kernel_w - 1), dtype=np.float64)
+    for y in range(0, rows, block_h):
+        for x in range(0, cols, block_w):
+            block = image[y:y + block_h, x:x + block_w].astype(np.float64)
+            out_h = block.shape[0] + kernel_h - 1
+            out_w = block.shape[1] + kernel_w - 1
+            block_fft = backend.rfft2(block, s=fft_shape)
+            convolved = backend.irfft2(block_fft * kernel_fft, s=fft_shape)
+            full[y:y + out_h, x:x + out_w] += convolved[:out_h, :out_w]
+    return full
+
+
+def convolve2d(image, kernel, method='auto', return_method=False):
     """
     Apply a convolution operation to an image using a given kernel.
-    
+
+    Pixels outside the image count as zero, as with np.pad(mode='constant').
+    Three methods are available:
+
+    - 'direct' adds one shifted copy of the image per kernel tap.
+    - 'separable' runs a row pass and a column pass for rank-1 kernels.
+    - 'fft' multiplies real FFTs of overlap-add blocks of the image.
+
+    'auto' picks the method with the lowest estimated cost for the image
+    and kernel sizes. All methods compute in float64 and agree to within
+    about 1e-9 * sum(abs(kernel)) * max(abs(image)) before the result is cast
+    back to the image dtype. For integer images the cast truncates, so a
+    value that lands exactly on an integer can differ by one level between
+    methods.
+
     Parameters:
     image (numpy.ndarray): Input image.
     kernel (numpy.ndarray): Convolution kernel.
-    
+    method (str): 'auto', 'direct', 'separable' or 'fft'.
+    return_method (bool): Also return the name of the method used.
+
     Returns:
     numpy.ndarray: Convolved image.
+    str: The method used, only if return_method is True.
+
+    Raises:
+    ValueError: If the method is unknown, or 'separable' is requested for a
+    kernel that is not rank 1.
     """
-    kernel = np.flipud(np.fliplr(kernel))  # Flip the kernel
-    output = np.zeros_like(image)
-    image_padded = np.pad(image, ((kernel.shape[0] // 2, kernel.shape[0] // 2), (kernel.shape[1] // 2, kernel.shape[1] // 2)), mode='constant')
-    
-    for x in range(image.shape[1]):
-        for y in range(image.shape[0]):
-            output[y, x] = (kernel * image_padded[y: y + kernel.shape[0], x: x + kernel.shape[1]]).sum() 
+    if method != 'auto' and method not in CONVOLVE_METHODS:
+        raise ValueError("Invalid method. Use 'auto', 'direct', 'separable' or 'fft'.")
+
+    rows, cols = image.shape
+    kernel = np.asarray(kernel)
+    factors = _separate_kernel(kernel) if method in ('auto', 'separable') else None
+    if method == 'separable' and factors is None:
+        raise ValueError("The kernel is not separable.")
+
+    if method == 'auto':
+        costs = _convolution_costs(image.shape, kernel.shape, factors is not None)
+        method = min(costs, key=costs.get)
+
+    if method == 'fft':
+        full = _fft_convolve(image, kernel)
+        top = kernel.shape[0] - 1 - kernel.shape[0] // 2
+        left = kernel.shape[1] - 1 - kernel.shape[1] // 2
+        output = full[top:top + rows, left:left + cols]
+    else:
+        flipped = np.flipud(np.fliplr(kernel))  # Flip the kernel
+        image_padded = np.pad(image, ((kernel.shape[0] // 2, kernel.shape[0] // 2), (kernel.shape[1] // 2, kernel.shape[1] // 2)), mode='constant')
+        if method == 'separable':
+            column, row = factors
+            output = _separable_convolve(image_padded, column[::-1], row[::-1], rows, cols)
+        else:
+            output = _direct_convolve(image_padded, flipped, rows, cols)
+
+    output = output.astype(image.dtype)
+    if return_method:
+        return output, method
     return output
 
 def apply_gaussian_filter(image, ksize=5, sigma=1):
@@ -96,39 +272,163 @@ def apply_gaussian_filter(image, ksize=5, sigma=1):
     """
     ax = np.linspace(-(ksize - 1) / 2., (ksize - 1) / 2., ksize)
     gauss = np.exp(-0.5 * np.square(ax) / np.square(sigma))
-    kernel = np.outer(gauss, gauss)
-    kernel /= np.sum(kernel)
-    return convolve2d(image, kernel)
+    # The 2-D kernel is np.outer(gauss, gauss), so filter rows then columns
+    gauss /= np.sum(gauss)
+    pad = ksize // 2
+    image_padded = np.pad(image, pad, mode='constant')
+    rows, cols = image.shape
+    return _separable_convolve(image_padded, gauss, gauss, rows, cols).astype(image.dtype)
 
-def apply_median_filter(image, ksize=5):
+def _histogram_rank(running, running_coarse, ksize, rank):
+    """
+    Pick the value of the given rank (0-based) in every window of one row.
+
+    The coarse 16-bin window histograms locate the 16-value range holding the
+    rank, and only those 16 fine bins are read back from the fine running
+    sums.
+
+    Parameters:
+    running (numpy.ndarray): Running sum of fine column histograms.
+    running_coarse (numpy.ndarray): Running sum of coarse column histograms.
+    ksize (int): Kernel size.
+    rank (int): Rank of the value to select.
+
+    Returns:
+    numpy.ndarray: Selected value for every window in the row.
+    """
+    cols = running.shape[0] - ksize
+    col_index = np.arange(cols)
+
+    coarse = running_coarse[ksize:] - running_coarse[:cols]
+    coarse_cumulative = np.cumsum(coarse, axis=1)
+    coarse_bin = (coarse_cumulative > rank).argmax(axis=1)
+    below = coarse_cumulative[col_index, coarse_bin] - coarse[col_index, coarse_bin]
+
+    fine_bins = coarse_bin[:, None] * 16 + np.arange(16)
+    fine = running[col_index[:, None] + ksize, fine_bins] - running[col_index[:, None], fine_bins]
+    fine_cumulative = np.cumsum(fine, axis=1) + below[:, None]
+    return coarse_bin * 16 + (fine_cumulative > rank).argmax(axis=1)
+
+
+def _median_band(image_padded, ksize, rows, cols):
+    """
+    Median-filter one band of rows with sliding 256-bin histograms.
+
+    A histogram is kept for the ksize-tall strip of every padded column.
+    Moving down one row adds the entering pixel and removes the leaving one
+    from each column histogram, and each window histogram is the sum of
+    ksize neighbouring column histograms, read from a running sum across
+    columns. The cost per pixel therefore does not depend on ksize.
+
+    Parameters:
+    image_padded (numpy.ndarray): Padded uint8 rows covering the band.
+    ksize (int): Kernel size.
+    rows (int): Number of output rows in the band.
+    cols (int): Number of output columns.
+
+    Returns:
+    numpy.ndarray: (rows, cols) uint8 filtered band.
+    """
+    output = np.zeros((rows, cols), dtype=np.uint8)
+    area = ksize * ksize
+    low_rank, high_rank = (area - 1) // 2, area // 2
+
+    padded_cols = image_padded.shape[1]
+    col_index = np.arange(padded_cols)
+    column_hist = np.zeros((padded_cols, 256), dtype=np.int32)
+    column_coarse = np.zeros((padded_cols, 16), dtype=np.int32)
+    for y in range(ksize):
+        column_hist[col_index, image_padded[y]] += 1
+        column_coarse[col_index, image_padded[y] >> 4] += 1
+
+    running = np.zeros((padded_cols + 1, 256), dtype=np.int32)
+    running_coarse = np.zeros((padded_cols + 1, 16), dtype=np.int32)
+    for y in range(rows):
+        if y > 0:
+            leaving, entering = image_padded[y - 1], image_padded[y + ksize - 1]
+            column_hist[col_index, leaving] -= 1
+            column_hist[col_index, entering] += 1
+            column_coarse[col_index, leaving >> 4] -= 1
+            column_coarse[col_index, entering >> 4] += 1
+
+        np.cumsum(column_hist, axis=0, out=running[1:])
+        np.cumsum(column_coarse, axis=0, out=running_coarse[1:])
+
+        low = _histogram_rank(running, running_coarse, ksize, low_rank)
+        if high_rank == low_rank:
+            output[y] = low
+        else:
+            # Even kernels average the two middle values, like np.median
+            high = _histogram_rank(running, running_coarse, ksize, high_rank)
+            output[y] = (low + high) // 2
+    return output
+
+
+def apply_median_filter(image, ksize=5, workers=1):
     """
     Apply Median filter to an image.
     
     Parameters:
-    image (numpy.ndarray): Input image.
+    image (numpy.ndarray): Input image (uint8).
     ksize (int): Kernel size.
+    workers (int): Number of row bands filtered in parallel threads.
     
     Returns:
     numpy.ndarray: Image with Median filter applied.
     """
-    output = np.zeros_like(image)
+    rows, cols = image.shape
     image_padded = np.pad(image, ksize // 2, mode='constant')
-    
-    for x in range(image.shape[1]):
-        for y in range(image.shape[0]):
-            output[y, x] = np.median(image_padded[y: y + ksize, x: x + ksize])  
-    return output
+    # Even kernels only need ksize - 1 padded rows and columns
+    image_padded = image_padded[:rows + ksize - 1, :cols + ksize - 1]
+
+    workers = max(1, min(workers, rows))
+    bounds = np.linspace(0, rows, workers + 1).astype(int)
+    bands = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def filter_band(band):
+        start, stop = band
+        return _median_band(image_padded[start:stop + ksize - 1], ksize, stop - start, cols)
+
+    if len(bands) == 1:
+        return filter_band(bands[0])
+
+    with ThreadPoolExecutor(max_workers=len(bands)) as executor:
+        return np.vstack(list(executor.map(filter_band, bands)))
 
 def apply_averaging_filter(image, ksize=5):
     """
     Apply Averaging filter to an image.
-    
+
+    Each output pixel is the mean of its ksize x ksize window (zeros outside
+    the image), truncated to the image dtype. For integer images the window
+    sums are exact, so the result is the floor of the exact mean. The
+    original float32 kernel loop accumulated rounding error and, where the
+    mean is a whole number, sometimes gave one level less; those pixels
+    (about 1% of a natural image) now come out one level higher.
+
     Parameters:
     image (numpy.ndarray): Input image.
     ksize (int): Kernel size.
-    
+
     Returns:
     numpy.ndarray: Image with Averaging filter applied.
     """
-    kernel = np.ones((ksize, ksize), np.float32) / (ksize * ksize)
-    return convolve2d(image, kernel)
+    rows, cols = image.shape
+    pad = ksize // 2
+    integer = np.issubdtype(image.dtype, np.integer)
+    accumulator = np.int64 if integer else np.float64
+    image_padded = np.pad(image.astype(accumulator), pad, mode='constant')
+
+    # Running sums: each window sum is the difference of two prefix sums,
+    # so the cost per pixel does not depend on ksize
+    prefix = np.zeros((image_padded.shape[0] + 1, image_padded.shape[1]), dtype=accumulator)
+    np.cumsum(image_padded, axis=0, out=prefix[1:])
+    column_sums = prefix[ksize:ksize + rows] - prefix[:rows]
+
+    prefix = np.zeros((rows, column_sums.shape[1] + 1), dtype=accumulator)
+    np.cumsum(column_sums, axis=1, out=prefix[:, 1:])
+    box_sums = prefix[:, ksize:ksize + cols] - prefix[:, :cols]
+
+    if integer:
+        return (box_sums // (ksize * ksize)).astype(image.dtype)
+    return (box_sums / (ksize * ksize)).astype(image.dtype)
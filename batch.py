@@ -0,0 +1,346 @@
+"""
+Headless batch processing: apply an operation, or a chain of them, to every
+image of some directories, files or glob patterns, on a process pool.
+
+    python batch.py Images -o out --ops noise,filter --noise Gaussian --filter Median --ksize 7
+    python batch.py "Images/*.jpg" -o out --ops edges --edges Canny --jobs 4
+
+Each operation of the chain takes the first output of the previous one;
+histogram, whose outputs are plots, can only end a chain.
+The outputs of the last operation are written as <name>_<chain>[_<n>].png,
+where inputs sharing a file name are told apart by their path, e.g.
+day1_img_jpg_<chain>.png. Files whose outputs already exist for the same
+settings are skipped, so an interrupted run resumes where it stopped; every
+chain keeps its own settings, so chains written to one directory do not
+reset each other. Noise is drawn afresh for every run unless --seed is
+given, which makes it depend only on the seed and the output name. This module does not import PyQt5 or matplotlib.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import cv2
+import numpy as np
+
+from operations import BACKENDS, get_operation, operation_names
+from pipeline import Pipeline, build_image_graph
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# Settings of the outputs of a chain in an output directory, to tell whether they can be reused
+SETTINGS_FILE = '.batch_settings.{chain}.json'
+
+# Operation name -> node of build_image_graph; the one-off frequency variants
+# are used because a batch never revisits a radius
+OPERATIONS = {
+    'noise': 'noise',
+    'filter': 'filter',
+    'edges': 'edges',
+    'histogram': 'histogram',
+    'normalize': 'normalized',
+    'equalize': 'equalized',
+    'global_threshold': 'global_threshold',
+    'local_threshold': 'local_threshold',
+    'frequency': 'frequency_direct',
+    'hybrid': 'hybrid_direct',
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Apply image operations to many images without the GUI.")
+    parser.add_argument('inputs', nargs='+', help="Image files, directories or glob patterns.")
+    parser.add_argument('-o', '--output', required=True, help="Output directory.")
+    parser.add_argument('--ops', required=True,
+                        help="Comma-separated chain of operations: " + ", ".join(OPERATIONS) + ".")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument('--overwrite', action='store_true', help="Recompute files whose outputs exist.")
+
+    # the GUI sliders and combo boxes
+    parser.add_argument('--noise', default="Gaussian", choices=operation_names("noise"))
+    parser.add_argument('--param-1', type=int, default=0,
+                        help="Mean, min value or salt probability (percent), as slider 1.")
+    parser.add_argument('--param-2', type=int, default=10,
+                        help="Variance, max value or pepper probability (percent), as slider 2.")
+    parser.add_argument('--filter', default="Gaussian", choices=operation_names("filter"))
+    parser.add_argument('--ksize', type=int, default=5, help="Filter kernel size, made odd as in the GUI.")
+    parser.add_argument('--edges', default="Sobel", choices=operation_names("edges"))
+    parser.add_argument('--radius', type=int, default=20, help="Frequency filter radius.")
+    parser.add_argument('--radius1', type=int, default=20, help="Hybrid low-pass radius.")
+    parser.add_argument('--radius2', type=int, default=20, help="Hybrid high-pass radius.")
+    parser.add_argument('--image-2', help="Second image of the hybrid operation.")
+    parser.add_argument('--rgb', action='store_true', help="Histogram of the RGB channels.")
+    parser.add_argument('--seed', type=int, help="Seed of the noise, for reproducible outputs.")
+    parser.add_argument('--backend', default="numpy", choices=BACKENDS,
+                        help="Implementation of the filters and edge detectors; missing ones fall back.")
+    return parser
+
+
+def node_params(args):
+    """
+    Map the command-line options to parameters per operation, the way
+    MainWindow maps its sliders.
+    """
+    noise_params = get_operation("noise", args.noise).params
+    param_1, param_2 = (param.from_slider(value) for param, value in zip(noise_params, (args.param_1, args.param_2)))
+    ksize = args.ksize if args.ksize % 2 else args.ksize + 1
+    return {
+        'noise': {'kind': args.noise, 'param_1': param_1, 'param_2': param_2},
+        'filter': {'kind': args.filter, 'ksize': ksize, 'backend': args.backend},
+        'edges': {'kind': args.edges, 'backend': args.backend},
+        'frequency': {'radius': args.radius},
+        'hybrid': {'radius1': args.radius1, 'radius2': args.radius2},
+    }
+
+
+def build_chain(ops, params=None, rgb=False):
+    """
+    Build a pipeline applying the operations ops one after the other,
+    reusing the step functions and parameters declared by build_image_graph.
+
+    Args:
+        ops (list): Operation names, see OPERATIONS. One may repeat.
+        params (dict): Parameter overrides per operation name.
+        rgb (bool): Run a leading histogram on the RGB channels.
+
+    Returns:
+        Pipeline: Sources 'gray', 'rgb' and 'image_2'; the output node is 'output'.
+
+    Raises:
+        ValueError: If an operation is unknown, or histogram is not the last.
+    """
+    params = params or {}
+    graph = build_image_graph()
+    chain = Pipeline()
+    for source in ('gray', 'rgb', 'image_2'):
+        chain.add_source(source)
+
+    previous = 'gray'
+    for index, op in enumerate(ops):
+        if op not in OPERATIONS:
+            raise ValueError(f"Invalid operation '{op}'. Use " + ", ".join(OPERATIONS) + ".")
+        if op == 'histogram' and index < len(ops) - 1:
+            raise ValueError("The histogram operation outputs plots, it can only be the last operation.")
+        node = graph.nodes[OPERATIONS[op]]
+        if op == 'histogram' and rgb and index == 0:
+            node, inputs = graph.nodes['rgb_histogram'], ('rgb',)
+        elif op == 'hybrid':
+            inputs = (previous, 'image_2')
+        else:
+            inputs = (previous,)
+        name = f"{index}:{op}"
+        chain.add_node(name, node.function, inputs, {**node.params, **params.get(op, {})})
+        # the next operation works on the first output of this one
+        previous = f"{name}:first"
+        chain.add_node(previous, lambda value: value[0] if isinstance(value, tuple) else value, (name,))
+    chain.add_node('output', lambda value: value, (name,))
+    return chain
+
+
+def read_image(path):
+    """
+    Read path as (RGB, gray) like the GUI does, or raise OSError.
+    """
+    image = cv2.imread(path)
+    if image is None:
+        raise OSError(f"Cannot read image '{path}'.")
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB), cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def write_image(path, image):
+    """
+    Write an RGB or grayscale image atomically, so an interrupted run never
+    leaves a truncated output that would later be taken as done.
+    """
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    root, extension = os.path.splitext(path)
+    partial = f"{root}.partial{extension}"
+    if not cv2.imwrite(partial, image):
+        raise OSError(f"Cannot write image '{path}'.")
+    os.replace(partial, path)
+
+
+def collect_inputs(patterns, output_dir):
+    """
+    Expand files, directories and glob patterns into a sorted list of image
+    files, leaving out the output directory.
+    """
+    output_dir = os.path.abspath(output_dir)
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            matches = glob.glob(pattern)
+        for path in matches:
+            if (os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS)
+                    and os.path.dirname(os.path.abspath(path)) != output_dir):
+                paths.add(path)
+    return sorted(paths)
+
+
+def output_stems(paths):
+    """
+    Map each input path to the name its outputs start with: the file name
+    without extension, or, for file names several inputs share, the path
+    relative to the directory those inputs have in common, with the
+    extension, e.g. 'day1_img_jpg'.
+
+    Raises:
+        ValueError: If two inputs still map to the same name.
+    """
+    stems = {path: os.path.splitext(os.path.basename(path))[0] for path in paths}
+    counts = Counter(stems.values())
+    colliding = [path for path in paths if counts[stems[path]] > 1]
+    if colliding:
+        common = os.path.commonpath([os.path.abspath(path) for path in colliding])
+        for path in colliding:
+            relative = os.path.relpath(os.path.abspath(path), common)
+            stems[path] = relative.replace(os.sep, '_').replace('.', '_')
+
+    counts = Counter(stems.values())
+    clashes = sorted(path for path in paths if counts[stems[path]] > 1)
+    if clashes:
+        raise ValueError("Inputs would write the same outputs: " + ", ".join(clashes) + ".")
+    return stems
+
+
+def output_paths(stem, output_dir, chain_name, count):
+    if count == 1:
+        return [os.path.join(output_dir, f"{stem}_{chain_name}.png")]
+    return [os.path.join(output_dir, f"{stem}_{chain_name}_{index}.png") for index in range(1, count + 1)]
+
+
+def file_seed(seed, stem):
+    """
+    Seed of the noise of one file: the same for every run with seed,
+    whichever worker processes the file and in what order.
+    """
+    return int(np.random.SeedSequence([seed, zlib.crc32(stem.encode())]).generate_state(1)[0])
+
+
+_worker = {}
+
+
+def _init_worker(ops, rgb, params, image_2_path, seed=None):
+    # one pipeline per process; OpenCV threads would only compete with the other workers
+    cv2.setNumThreads(1)
+    # forked workers inherit the parent's random state and would all draw the same noise
+    np.random.seed()
+    _worker['seed'] = seed
+    _worker['chain'] = build_chain(ops, params, rgb)
+    _worker['image_2'] = read_image(image_2_path)[1] if image_2_path else None
+
+
+def process_file(path, stem, output_dir, chain_name):
+    """
+    Run the chain on one file and write its outputs, named after stem. Runs
+    in a worker process and returns only the output paths, never the images.
+    """
+    rgb, gray = read_image(path)
+    if _worker.get('seed') is not None:
+        np.random.seed(file_seed(_worker['seed'], stem))
+    sources = {'gray': gray, 'rgb': rgb, 'image_2': _worker['image_2']}
+    result = _worker['chain'].evaluate('output', sources)
+    # nothing is shared between files, so do not keep their intermediates around
+    _worker['chain'].clear()
+    outputs = result if isinstance(result, tuple) else (result,)
+    paths = output_paths(stem, output_dir, chain_name, len(outputs))
+    for output_path, image in zip(paths, outputs):
+        write_image(output_path, image)
+    return paths
+
+
+def _settings_path(output_dir, chain_name):
+    return os.path.join(output_dir, SETTINGS_FILE.format(chain=chain_name))
+
+
+def _settings_match(output_dir, chain_name, settings):
+    path = _settings_path(output_dir, chain_name)
+    try:
+        with open(path) as file:
+            return json.load(file) == settings
+    except (OSError, ValueError):
+        return False
+
+
+def _is_done(path, stem, output_dir, chain_name):
+    # a file is done once its (first) output exists and is newer than the input;
+    # outputs are written atomically, so an existing one is complete
+    candidates = (output_paths(stem, output_dir, chain_name, 1)[0], output_paths(stem, output_dir, chain_name, 2)[0])
+    mtime = os.path.getmtime(path)
+    return any(os.path.exists(output) and os.path.getmtime(output) >= mtime for output in candidates)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    ops = [op.strip() for op in args.ops.split(',') if op.strip()]
+    try:
+        build_chain(ops, rgb=args.rgb)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    if 'hybrid' in ops and not args.image_2:
+        print("The hybrid operation needs --image-2.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    chain_name = "-".join(ops)
+    params = node_params(args)
+    settings = {'ops': ops, 'params': params, 'rgb': args.rgb, 'seed': args.seed,
+                'image_2': os.path.abspath(args.image_2) if args.image_2 else None}
+
+    paths = collect_inputs(args.inputs, args.output)
+    try:
+        stems = output_stems(paths)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    resume = not args.overwrite and _settings_match(args.output, chain_name, settings)
+    with open(_settings_path(args.output, chain_name), 'w') as file:
+        json.dump(settings, file)
+    todo = [path for path in paths if not (resume and _is_done(path, stems[path], args.output, chain_name))]
+    print(f"{len(paths)} images, {len(paths) - len(todo)} already done", file=sys.stderr)
+
+    failures = 0
+    total = len(todo)
+    workers = max(1, min(args.jobs, total or 1))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(ops, args.rgb, params, args.image_2, args.seed)) as pool:
+        # keep only a couple of files per worker in flight, so memory stays
+        # bounded however many files there are
+        pending = {}
+        queue = iter(todo)
+        done = 0
+        while True:
+            while len(pending) < 2 * workers:
+                path = next(queue, None)
+                if path is None:
+                    break
+                pending[pool.submit(process_file, path, stems[path], args.output, chain_name)] = path
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = pending.pop(future)
+                done += 1
+                try:
+                    outputs = future.result()
+                    status = ", ".join(os.path.basename(output) for output in outputs)
+                except Exception as error:
+                    failures += 1
+                    status = f"failed: {error}"
+                print(f"[{done}/{total}] {path} -> {status} ({time.perf_counter() - start:.1f}s)",
+                      file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Cold-start benchmark: time from interpreter start to the first painted
+MainWindow, in fresh processes.
+
+    python bench_startup.py                  # 5 runs, report the median
+    python bench_startup.py --runs 9 --max-seconds 1.5
+
+With --max-seconds the exit status is 1 when the median is slower, so a
+regression in time-to-first-window fails a CI step. Set
+QT_QPA_PLATFORM=offscreen to run without a display.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Runs in the child: build and show the window, then report once the event
+# loop has painted it
+CHILD = """
+import sys, time
+start = float(sys.argv[1])
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+app = QApplication(sys.argv[:1])
+import Main_Window
+window = Main_Window.MainWindow()
+window.show()
+def shown():
+    # PyQt5.uic is only loaded when the compiled UI module is stale
+    heavy = sorted(name for name in ('matplotlib', 'scipy', 'PIL', 'PyQt5.uic') if name in sys.modules)
+    print(time.time() - start, ','.join(heavy))
+    app.quit()
+QTimer.singleShot(0, shown)
+app.exec_()
+"""
+
+
+def measure(directory):
+    """
+    Return (seconds to the first window, heavy modules loaded by then) of
+    one fresh process.
+    """
+    start = time.time()
+    output = subprocess.run([sys.executable, '-c', CHILD, repr(start)], cwd=directory,
+                            capture_output=True, text=True, check=True).stdout
+    seconds, heavy = output.strip().splitlines()[-1].partition(' ')[::2]
+    return float(seconds), heavy.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the cold start time of the main window.")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh processes to time.")
+    parser.add_argument('--max-seconds', type=float, help="Fail if the median is slower.")
+    args = parser.parse_args(argv)
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    # a first run warms the OS file cache, as a user's second start would
+    measure(directory)
+    times = []
+    for run in range(args.runs):
+        seconds, heavy = measure(directory)
+        times.append(seconds)
+        print(f"run {run + 1}: {seconds:.3f}s" + (f" (loaded {heavy})" if heavy else ""))
+
+    median = statistics.median(times)
+    print(f"median {median:.3f}s, min {min(times):.3f}s, max {max(times):.3f}s")
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"slower than {args.max_seconds:.3f}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Compile Main_Window_UI_2color.ui into Main_Window_UI_2color.py, so the
+main window does not parse the XML at startup. Run it after editing the
+.ui file:
+
+    python build_ui.py            # regenerate the module
+    python build_ui.py --check    # exit status 1 if the module is stale
+
+The module records a hash of the .ui content it was generated from, which
+Main_Window compares on import: file modification times are not kept by
+git, so they can not tell a stale module from a fresh one.
+"""
+import argparse
+import hashlib
+import io
+import os
+import sys
+
+UI_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Main_Window_UI_2color.ui")
+UI_MODULE = os.path.splitext(UI_FILE)[0] + ".py"
+
+
+def ui_source_hash(path=UI_FILE):
+    """
+    Return the hex BLAKE2 digest of a .ui file's content, with line endings
+    normalized so a CRLF checkout hashes the same.
+    """
+    with open(path, 'rb') as file:
+        return hashlib.blake2b(file.read().replace(b'\r\n', b'\n'), digest_size=16).hexdigest()
+
+
+def build(ui_file=UI_FILE, module=UI_MODULE):
+    """
+    Generate module from ui_file with pyuic and append the source hash.
+    """
+    from PyQt5 import uic
+
+    code = io.StringIO()
+    with open(ui_file) as file:
+        uic.compileUi(file, code)
+    # the header names the .ui file; keep it free of the build machine's paths
+    source = code.getvalue().replace(f"'{ui_file}'", f"'{os.path.basename(ui_file)}'", 1)
+    with open(module, 'w') as file:
+        file.write(source)
+        file.write(f"\n\n# Hash of the .ui file this module was generated from, see build_ui.py\n"
+                   f"UI_SOURCE_HASH = \"{ui_source_hash(ui_file)}\"\n")
+
+
+def is_current(module_hash, ui_file=UI_FILE):
+    return module_hash == ui_source_hash(ui_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the main window .ui file.")
+    parser.add_argument('--check', action='store_true', help="Only check that the compiled module is current.")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        sys.path.insert(0, os.path.dirname(UI_MODULE))
+        try:
+            from Main_Window_UI_2color import UI_SOURCE_HASH
+        except ImportError:
+            UI_SOURCE_HASH = None
+        if not is_current(UI_SOURCE_HASH):
+            print(f"{os.path.basename(UI_MODULE)} is stale, run build_ui.py", file=sys.stderr)
+            return 1
+        return 0
+
+    build()
+    print(f"wrote {UI_MODULE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import os
+import numpy as np
+
+# scipy and pyFFTW are imported by their backend on first use, which keeps
+# them out of the startup of everything that imports this module
+scipy_fft = None
+pyfftw = None
+pyfftw_fft = None
+
+# Backends tried in order by set_fft_backend('auto')
+AUTO_ORDER = ('pyfftw', 'scipy', 'numpy')
+
+
+def _next_fast_len(n):
+    """
+    Return the smallest 5-smooth integer (2^a * 3^b * 5^c) not below n.
+    """
+    best = 1
+    while best < n:
+        best *= 2
+    power_5 = 1
+    while power_5 < best:
+        power_35 = power_5
+        while power_35 < best:
+            candidate = power_35
+            while candidate < n:
+                candidate *= 2
+            best = min(best, candidate)
+            power_35 *= 3
+        power_5 *= 5
+    return best
+
+
+class NumpyBackend:
+    """
+    Single-threaded numpy.fft. numpy keeps its own cache of twiddle
+    factors, so repeated sizes reuse their setup.
+    """
+    name = 'numpy'
+
+    def __init__(self, workers=None):
+        self.workers = 1
+
+    def fft2(self, a, s=None):
+        return np.fft.fft2(a, s=s)
+
+    def ifft2(self, a, s=None):
+        return np.fft.ifft2(a, s=s)
+
+    def rfft2(self, a, s=None):
+        return np.fft.rfft2(a, s=s)
+
+    def irfft2(self, a, s=None):
+        return np.fft.irfft2(a, s=s)
+
+    def next_fast_len(self, n):
+        return _next_fast_len(n)
+
+
+class ScipyBackend:
+    """
+    scipy.fft with a thread count. scipy keeps float32 input in single
+    precision and caches its plans internally.
+    """
+    name = 'scipy'
+
+    def __init__(self, workers=None):
+        global scipy_fft
+        if scipy_fft is None:
+            try:
+                import scipy.fft as scipy_fft
+            except ImportError:
+                raise ImportError("The 'scipy' FFT backend needs scipy.")
+        self.workers = workers or os.cpu_count() or 1
+
+    def fft2(self, a, s=None):
+        return scipy_fft.fft2(a, s=s, workers=self.workers)
+
+    def ifft2(self, a, s=None):
+        return scipy_fft.ifft2(a, s=s, workers=self.workers)
+
+    def rfft2(self, a, s=None):
+        return scipy_fft.rfft2(a, s=s, workers=self.workers)
+
+    def irfft2(self, a, s=None):
+        return scipy_fft.irfft2(a, s=s, workers=self.workers)
+
+    def next_fast_len(self, n):
+        return scipy_fft.next_fast_len(n, real=True)
+
+
+class PyFFTWBackend:
+    """
+    FFTW through pyFFTW's numpy interface, with its plan cache enabled so a
+    repeated shape and dtype reuses the plan built on the first call.
+    """
+    name = 'pyfftw'
+
+    # How long (seconds) an unused FFTW plan stays in the cache
+    PLAN_KEEPALIVE = 300
+
+    def __init__(self, workers=None, planner_effort='FFTW_MEASURE'):
+        global pyfftw, pyfftw_fft
+        if pyfftw is None:
+            try:
+                import pyfftw
+                import pyfftw.interfaces.numpy_fft as pyfftw_fft
+            except ImportError:
+                raise ImportError("The 'pyfftw' FFT backend needs pyFFTW.")
+        self.workers = workers or os.cpu_count() or 1
+        self.planner_effort = planner_effort
+        pyfftw.interfaces.cache.enable()
+        pyfftw.interfaces.cache.set_keepalive_time(self.PLAN_KEEPALIVE)
+
+    def _options(self):
+        return {'threads': self.workers, 'planner_effort': self.planner_effort}
+
+    def fft2(self, a, s=None):
+        return pyfftw_fft.fft2(a, s=s, **self._options())
+
+    def ifft2(self, a, s=None):
+        return pyfftw_fft.ifft2(a, s=s, **self._options())
+
+    def rfft2(self, a, s=None):
+        return pyfftw_fft.rfft2(a, s=s, **self._options())
+
+    def irfft2(self, a, s=None):
+        return pyfftw_fft.irfft2(a, s=s, **self._options())
+
+    def next_fast_len(self, n):
+        return pyfftw.next_fast_len(n)
+
+
+BACKENDS = {
+    'numpy': NumpyBackend,
+    'scipy': ScipyBackend,
+    'pyfftw': PyFFTWBackend,
+}
+
+_backend = None
+
+
+def set_fft_backend(name='auto', workers=None):
+    """
+    Select the FFT backend used by the frequency domain and convolution
+    code.
+
+    Args:
+        name (str): 'auto', 'numpy', 'scipy' or 'pyfftw'. 'auto' picks the
+            first installed backend of AUTO_ORDER.
+        workers (int): Number of threads for scipy and pyFFTW. Defaults to
+            every core.
+
+    Returns:
+        The backend object now in use.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    global _backend
+    if name == 'auto':
+        for candidate in AUTO_ORDER:
+            try:
+                _backend = BACKENDS[candidate](workers)
+                return _backend
+            except ImportError:
+                continue
+    if name not in BACKENDS:
+        raise ValueError("Invalid backend. Use 'auto', 'numpy', 'scipy' or 'pyfftw'.")
+    _backend = BACKENDS[name](workers)
+    return _backend
+
+
+def get_fft_backend():
+    """
+    Return the FFT backend in use, selecting 'auto' on first use.
+    """
+    if _backend is None:
+        set_fft_backend()
+    return _backend
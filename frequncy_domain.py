@@ -1,6 +1,175 @@
+import atexit
 import cv2
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
-from matplotlib import pyplot as plt
+from fft_backend import get_fft_backend
+
+# Number of shifted spectra kept by the spectrum cache
+SPECTRUM_CACHE_SIZE = 4
+
+# Memory budget (bytes) of the low and high pass results kept by one
+# FrequencyFilterBank; the least recently used radii are dropped beyond it
+FILTER_BANK_BYTES = 32 * 1024 * 1024
+
+# Floating point precision of the filtering path: 'double' keeps float64 /
+# complex128 like numpy.fft, 'single' keeps float32 / complex64 throughout
+FFT_PRECISION = 'double'
+
+_PRECISION_DTYPES = {
+    'double': (np.float64, np.complex128),
+    'single': (np.float32, np.complex64),
+}
+
+_spectrum_cache = OrderedDict()
+_spectrum_cache_lock = threading.Lock()
+
+
+def set_fft_precision(precision):
+    """
+    Set the default precision of the frequency domain filters.
+
+    Parameters:
+    precision (str): 'double' or 'single'.
+    """
+    global FFT_PRECISION
+    _precision_dtypes(precision)
+    FFT_PRECISION = precision
+
+
+def _precision_dtypes(precision):
+    """
+    Return the (real, complex) dtypes of a precision, defaulting to
+    FFT_PRECISION.
+    """
+    if precision is None:
+        precision = FFT_PRECISION
+    if precision not in _PRECISION_DTYPES:
+        raise ValueError("Invalid precision. Use 'double' or 'single'.")
+    return _PRECISION_DTYPES[precision]
+
+
+def _image_key(image):
+    """
+    Build a cache key from the shape, dtype and content hash of an image.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(image), digest_size=16).digest()
+    return image.shape, image.dtype.str, digest
+
+
+def _cached_spectrum(image, kind, compute):
+    """
+    Look up a spectrum of the given kind for an image, computing and storing
+    it on a miss. Cached arrays are read-only because they are shared.
+    """
+    key = _image_key(image) + (kind,)
+    with _spectrum_cache_lock:
+        spectrum = _spectrum_cache.get(key)
+        if spectrum is not None:
+            _spectrum_cache.move_to_end(key)
+            return spectrum
+
+    spectrum = compute()
+    spectrum.setflags(write=False)
+    with _spectrum_cache_lock:
+        _spectrum_cache[key] = spectrum
+        while len(_spectrum_cache) > SPECTRUM_CACHE_SIZE:
+            _spectrum_cache.popitem(last=False)
+    return spectrum
+
+
+def shifted_spectrum(image):
+    """
+    Return the full centred (fftshift-ed) spectrum of an image.
+
+    Spectra are cached by image content. The returned array is read-only
+    because it is shared between callers.
+
+    Parameters:
+    image (numpy.ndarray): Input image (grayscale).
+
+    Returns:
+    numpy.ndarray: The shifted frequency spectrum.
+    """
+    return _cached_spectrum(image, 'full', lambda: np.fft.fftshift(get_fft_backend().fft2(image)))
+
+
+def shifted_half_spectrum(image, precision=None):
+    """
+    Return the real-input (rfft2) spectrum of an image, shifted along the
+    rows so that the zero frequency sits at row rows // 2, column 0.
+
+    Only the non-negative column frequencies are stored, which halves the
+    memory of the full spectrum; 'single' precision halves it again.
+    Spectra are cached by image content and precision, and the returned
+    array is read-only.
+
+    Parameters:
+    image (numpy.ndarray): Input image (grayscale).
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
+
+    Returns:
+    numpy.ndarray: The shifted half spectrum.
+    """
+    real_dtype, complex_dtype = _precision_dtypes(precision)
+
+    def compute():
+        spectrum = get_fft_backend().rfft2(image.astype(real_dtype, copy=False))
+        # numpy < 2.0 returns complex128 even for float32 input
+        return np.fft.fftshift(spectrum.astype(complex_dtype, copy=False), axes=0)
+
+    return _cached_spectrum(image, np.dtype(complex_dtype).str, compute)
+
+
+def clear_spectrum_cache():
+    """
+    Drop every cached spectrum.
+    """
+    with _spectrum_cache_lock:
+        _spectrum_cache.clear()
+
+
+@lru_cache(maxsize=8)
+def _squared_distance_grid(shape):
+    """
+    Squared distance of every bin of a shifted half spectrum from the zero
+    frequency. Computed once per image shape; the result is read-only.
+    """
+    rows, cols = shape[:2]
+    x, y = np.ogrid[:rows, :cols // 2 + 1]
+    grid = (x - rows // 2) ** 2 + y ** 2
+    grid.setflags(write=False)
+    return grid
+
+
+def _low_pass_mask(shape, radius):
+    """
+    Boolean mask that is True inside the circle of the given radius around
+    the zero frequency of a shifted half spectrum.
+
+    The circle is symmetric under negating both frequencies, so masking the
+    half spectrum is equivalent to masking the full one.
+    """
+    return _squared_distance_grid(tuple(shape[:2])) <= radius ** 2
+
+
+def _half_spectrum_to_real(masked_spectrum, shape):
+    """
+    Inverse-transform a masked, shifted half spectrum to a real image.
+    """
+    return get_fft_backend().irfft2(np.fft.ifftshift(masked_spectrum, axes=0), s=shape[:2])
+
+
+def _to_uint8(filtered):
+    """
+    Magnitude of a filtered image as uint8, saturating instead of wrapping
+    around where ringing or rounding takes it past 255.
+    """
+    return np.clip(np.abs(filtered), 0, 255).astype(np.uint8)
+
 
 def image_to_frequency_domain(image):
     """
@@ -12,80 +181,263 @@ def image_to_frequency_domain(image):
     Returns:
     tuple: Contains the magnitude spectrum and the shifted frequency spectrum.
     """
-    # Perform FFT
-    frequncies = np.fft.fft2(image)
-    fshift = np.fft.fftshift(frequncies)
+    fshift = shifted_spectrum(image)
     magnitude_spectrum = 20 * np.log(np.abs(fshift))
     
     return magnitude_spectrum, fshift
 
-def low_pass_filter(image, radius):
+def low_pass_filter(image, radius, precision=None):
     """
     Apply a circular low pass filter to an image.
     
     Parameters:
     image (numpy.ndarray): Input image (grayscale).
     radius (int): Radius of the circular filter.
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
     
     Returns:
     numpy.ndarray: Low-pass filtered image.
     """
-    # Perform FFT
-    fft_image = np.fft.fft2(image)
-    fft_shifted = np.fft.fftshift(fft_image)
-    
-    # Get image dimensions
-    rows, cols = image.shape[:2]
-    center_row, center_col = rows // 2, cols // 2
-    
-    # Create circular mask
-    x, y = np.ogrid[:rows, :cols]
-    mask = np.zeros((rows, cols))
-    mask[(x - center_row) ** 2 + (y - center_col) ** 2 <= radius ** 2] = 1
-    
-    # Apply mask
-    masked_image = fft_shifted * mask
-    ifft_shifted_filtered = np.fft.ifftshift(masked_image)
-    ifft_filtered = np.fft.ifft2(ifft_shifted_filtered)
-    
-    # Convert back to uint8
-    filtered_image = np.abs(ifft_filtered).astype(np.uint8)
-    return filtered_image
+    fft_shifted = shifted_half_spectrum(image, precision)
+    mask = _low_pass_mask(image.shape, radius)
+    low_pass = _half_spectrum_to_real(fft_shifted * mask, image.shape)
+    return _to_uint8(low_pass)
 
-def high_pass_filter(image, radius):
+def high_pass_filter(image, radius, precision=None):
     """
     Apply a circular high pass filter to an image.
     
     Parameters:
     image (numpy.ndarray): Input image (grayscale).
     radius (int): Radius of the circular filter.
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
     
     Returns:
     numpy.ndarray: High-pass filtered image.
     """
-    # Perform FFT
-    fft_image = np.fft.fft2(image)
-    fft_shifted = np.fft.fftshift(fft_image)
+    fft_shifted = shifted_half_spectrum(image, precision)
+    mask = _low_pass_mask(image.shape, radius)
+    high_pass = _half_spectrum_to_real(fft_shifted * ~mask, image.shape)
+    return _to_uint8(high_pass)
+
+def low_and_high_pass_filter(image, radius, precision=None):
+    """
+    Apply complementary circular low and high pass filters to an image.
+
+    The two masks add up to one, so the high-pass result is the image minus
+    the low-pass result, and both come from one forward and one inverse
+    transform.
+
+    Parameters:
+    image (numpy.ndarray): Input image (grayscale).
+    radius (int): Radius of the circular filter.
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
+
+    Returns:
+    tuple: Low-pass and high-pass filtered images.
+    """
+    fft_shifted = shifted_half_spectrum(image, precision)
+    mask = _low_pass_mask(image.shape, radius)
+    low_pass = _half_spectrum_to_real(fft_shifted * mask, image.shape)
+    high_pass = image - low_pass
+    return _to_uint8(low_pass), _to_uint8(high_pass)
+
+# Banks with a background sweep, stopped at exit so no sweep thread is
+# killed in the middle of a transform
+_sweeping_banks = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_sweeps():
+    for bank in list(_sweeping_banks):
+        bank.cancel()
+
+
+class FrequencyFilterBank:
+    """
+    Low and high pass results of one image for a sweep of radii.
+
+    The bank holds the cached half spectrum of the image and fills in
+    results radius by radius, optionally on a background thread. Going from
+    one radius to the next only adds the annulus of bins between them to
+    the previous low-pass image. Thin annuli near the centre are summed
+    directly as a few complex exponentials; wider ones go through one
+    inverse transform of the annulus. High-pass images are the image minus
+    the low-pass image.
+
+    Results are kept up to max_bytes, dropping the least recently used
+    radii; a background sweep stops once the bank is full.
+
+    Parameters:
+    image (numpy.ndarray): Input image (grayscale).
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
+    max_bytes (int): Memory budget of the results. Defaults to FILTER_BANK_BYTES.
+    """
+
+    def __init__(self, image, precision=None, max_bytes=None):
+        self.image = image
+        self.shape = image.shape[:2]
+        self.real_dtype, self.complex_dtype = _precision_dtypes(precision)
+        self.spectrum = shifted_half_spectrum(image, precision)
+        self.distance = _squared_distance_grid(tuple(self.shape))
+
+        self.max_bytes = FILTER_BANK_BYTES if max_bytes is None else max_bytes
+        # one uint8 low and high pass pair per radius
+        self.result_bytes = 2 * self.shape[0] * self.shape[1]
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_radius = None
+        self._last_low_pass = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _annulus_low_pass(self, inner, outer):
+        """
+        Real low-pass contribution of the bins with inner^2 < d <= outer^2
+        (inner may be None for an empty inner circle).
+        """
+        if inner is None:
+            annulus = self.distance <= outer ** 2
+        else:
+            annulus = (self.distance > inner ** 2) & (self.distance <= outer ** 2)
+
+        rows, cols = self.shape
+        bin_rows, bin_cols = np.nonzero(annulus)
+        if len(bin_rows) > np.log2(rows * cols):
+            return _half_spectrum_to_real(self.spectrum * annulus, self.shape).astype(self.real_dtype)
+
+        # Few bins: sum their complex exponentials directly. Bins with a
+        # conjugate partner outside the half spectrum count twice.
+        weights = np.where((bin_cols == 0) | (2 * bin_cols == cols), 1, 2)
+        coefficients = self.spectrum[bin_rows, bin_cols] * weights / (rows * cols)
+        row_freqs = bin_rows - rows // 2
+        row_waves = np.exp(2j * np.pi * np.outer(np.arange(rows), row_freqs) / rows)
+        col_waves = np.exp(2j * np.pi * np.outer(bin_cols, np.arange(cols)) / cols)
+        row_waves = row_waves.astype(self.complex_dtype)
+        col_waves = (coefficients[:, None] * col_waves).astype(self.complex_dtype)
+        return (row_waves @ col_waves).real
+
+    def _compute(self, radius):
+        """
+        Low-pass the image at one radius, starting from the last radius
+        computed when that is cheaper, and store the uint8 results.
+        """
+        with self._lock:
+            last_radius, last_low_pass = self._last_radius, self._last_low_pass
+
+        if last_radius is None or last_radius == radius:
+            low_pass = self._annulus_low_pass(None, radius)
+        elif last_radius < radius:
+            low_pass = last_low_pass + self._annulus_low_pass(last_radius, radius)
+        else:
+            low_pass = last_low_pass - self._annulus_low_pass(radius, last_radius)
+
+        high_pass = self.image - low_pass
+        results = (_to_uint8(low_pass), _to_uint8(high_pass))
+        with self._lock:
+            self._last_radius, self._last_low_pass = radius, low_pass
+            self._results[radius] = results
+            self._results.move_to_end(radius)
+            while len(self._results) > 1 and len(self._results) * self.result_bytes > self.max_bytes:
+                self._results.popitem(last=False)
+        return results
+
+    def is_full(self):
+        """
+        Tell whether one more result would exceed the memory budget.
+        """
+        with self._lock:
+            return (len(self._results) + 1) * self.result_bytes > self.max_bytes
+
+    def low_and_high_pass(self, radius):
+        """
+        Return the low-pass and high-pass images for a radius, from the
+        bank if already computed.
+        """
+        with self._lock:
+            results = self._results.get(radius)
+            if results is not None:
+                self._results.move_to_end(radius)
+        if results is None:
+            results = self._compute(radius)
+        return results
+
+    def low_pass(self, radius):
+        """
+        Return the low-pass image for a radius.
+        """
+        return self.low_and_high_pass(radius)[0]
+
+    def high_pass(self, radius):
+        """
+        Return the high-pass image for a radius.
+        """
+        return self.low_and_high_pass(radius)[1]
+
+    def precompute(self, radii, background=True):
+        """
+        Fill in the results for a set of radii in increasing order, until
+        the bank is full.
+
+        Parameters:
+        radii (iterable): Radii to compute.
+        background (bool): Run on a daemon thread and return immediately.
+        """
+        self.cancel()
+        self._stop.clear()
+        radii = sorted(set(radii))
+
+        def sweep():
+            for radius in radii:
+                if self._stop.is_set():
+                    return
+                with self._lock:
+                    done = radius in self._results
+                if not done:
+                    # a full bank would only evict radii computed for the user
+                    if self.is_full():
+                        return
+                    self._compute(radius)
+
+        if background:
+            self._thread = threading.Thread(target=sweep, daemon=True)
+            _sweeping_banks.add(self)
+            self._thread.start()
+        else:
+            sweep()
+
+    def cancel(self):
+        """
+        Stop a background sweep started by precompute.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        _sweeping_banks.discard(self)
+
+
+def hybrid_from_banks(low_bank, high_bank, radius1, radius2):
+    """
+    Create a hybrid image from the filter banks of its two inputs.
+
+    Parameters:
+    low_bank (FrequencyFilterBank): Bank of the low-pass image.
+    high_bank (FrequencyFilterBank): Bank of the high-pass image, which must
+        have the same shape as the low-pass image.
+    radius1 (int): Radius for the low-pass filter.
+    radius2 (int): Radius for the high-pass filter.
+
+    Returns:
+    numpy.ndarray: Hybrid image.
+    """
+    low_pass = low_bank.low_pass(radius1)
+    high_pass = high_bank.high_pass(radius2)
+    hybrid_image = cv2.addWeighted(low_pass, 0.5, high_pass, 0.5, 0)
+    return np.clip(hybrid_image, 0, 255).astype(np.uint8)
 
-    # Get image dimensions
-    rows, cols = image.shape[:2]
-    center_row, center_col = rows // 2, cols // 2
-    
-    # Create circular mask
-    x, y = np.ogrid[:rows, :cols]
-    mask = np.ones((rows, cols))
-    mask[(x - center_row) ** 2 + (y - center_col) ** 2 <= radius ** 2] = 0
-    
-    # Apply mask
-    masked_image = fft_shifted * mask
-    ifft_shifted_filtered = np.fft.ifftshift(masked_image)
-    ifft_filtered = np.fft.ifft2(ifft_shifted_filtered)
-    
-    # Convert back to uint8
-    filtered_image = np.abs(ifft_filtered).astype(np.uint8)
-    return filtered_image
 
-def hybrid(image1, image2, radius1, radius2):
+def hybrid(image1, image2, radius1, radius2, precision=None):
     """
     Create a hybrid image by combining a low-pass filtered version of image1
     with a high-pass filtered version of image2.
@@ -95,6 +447,7 @@ def hybrid(image1, image2, radius1, radius2):
     image2 (numpy.ndarray): Input image 2 (grayscale).
     radius1 (int): Radius for the low-pass filter.
     radius2 (int): Radius for the high-pass filter.
+    precision (str): 'double' or 'single'. Defaults to FFT_PRECISION.
     
     Returns:
     numpy.ndarray: Hybrid image.
@@ -108,8 +461,8 @@ def hybrid(image1, image2, radius1, radius2):
     image2_fft = image2.astype(np.float32)
     
     # Apply filters
-    low_pass = low_pass_filter(image1_fft, radius1)
-    high_pass = high_pass_filter(image2_fft, radius2)
+    low_pass = low_pass_filter(image1_fft, radius1, precision)
+    high_pass = high_pass_filter(image2_fft, radius2, precision)
     
     # Combine filtered images
     hybrid_image = cv2.addWeighted(low_pass, 0.5, high_pass, 0.5, 0)
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job by CancelToken.check once a newer job has replaced it.
+    """
+
+
+class CancelToken:
+    """
+    Cooperative cancellation flag handed to every job. Long jobs call check()
+    between their stages to stop early once their result can no longer be shown.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class Job:
+    """
+    One submitted computation, with the generation it holds on each target.
+    """
+
+    def __init__(self, targets, generations, function, on_done, name=None, pixels=None):
+        self.targets = targets
+        self.generations = generations
+        self.function = function
+        self.on_done = on_done
+        self.name = name
+        self.pixels = pixels
+        self.elapsed = None
+        self.token = CancelToken()
+        self.future = None
+        self.delivered = False
+
+
+class JobScheduler(QObject):
+    """
+    Runs image operations on a thread pool and paints their results on the
+    GUI thread.
+
+    Every output widget (target) has a generation counter. Submitting a job
+    for a target bumps it, so a job only paints the targets it is still the
+    latest job for. A job replaced on all its targets is cancelled: dropped
+    if it has not started yet, otherwise told through its CancelToken.
+
+    NumPy and OpenCV release the GIL in their kernels, so threads run the
+    operations in parallel without copying images to other processes.
+
+    Named jobs also record how long they took per input pixel, which
+    estimate() uses to predict the latency of the next run.
+    """
+
+    # weight of the newest run in the running per-pixel cost
+    COST_SMOOTHING = 0.5
+
+    # emitted from the worker thread, delivered on the GUI thread
+    _finished = pyqtSignal(object)
+
+    def __init__(self, workers=None, parent=None):
+        super(JobScheduler, self).__init__(parent)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image-job")
+        self._generations = {}
+        self._latest = {}
+        self.costs = {}
+        self._finished.connect(self._deliver)
+
+    def submit(self, targets, function, on_done=None, name=None, pixels=None):
+        """
+        Run function(token) on the pool and paint its result on targets.
+
+        Args:
+            targets (tuple): Output widgets painted by the job.
+            function: Called on a worker thread with the job's CancelToken.
+                Returns one image per target (None leaves that target as is).
+            on_done: Called on the GUI thread with the result, after painting,
+                if the job is still the latest one for any of its targets.
+            name (str): Operation name the run time is recorded under.
+            pixels (int): Input size, to record the cost per pixel.
+
+        Returns:
+            The submitted Job.
+        """
+        job = self._claim(targets, function, on_done, name, pixels)
+        job.future = self._pool.submit(self._run, job)
+        job.future.add_done_callback(lambda future: self._finished.emit(job))
+        return job
+
+    def publish(self, targets, result, on_done=None):
+        """
+        Paint an already computed result (e.g. a cached one) on targets right
+        away, as the latest job for them.
+        """
+        job = self._claim(targets, None, on_done)
+        job.future = Future()
+        job.future.set_result(result)
+        self._deliver(job)
+        return job
+
+    def _claim(self, targets, function, on_done, name=None, pixels=None):
+        # make a new job the latest one of its targets, cancelling jobs it replaces everywhere
+        generations = []
+        replaced = set()
+        for target in targets:
+            generation = self._generations.get(target, 0) + 1
+            self._generations[target] = generation
+            generations.append(generation)
+            if target in self._latest:
+                replaced.add(self._latest[target])
+
+        job = Job(tuple(targets), tuple(generations), function, on_done, name, pixels)
+        for target in targets:
+            self._latest[target] = job
+        for old_job in replaced:
+            if not self._is_current(old_job):
+                old_job.token.cancel()
+                old_job.future.cancel()
+        return job
+
+    def estimate(self, name, pixels):
+        """
+        Return the predicted run time (seconds) of operation name on pixels
+        input pixels, or None before its first run.
+        """
+        cost = self.costs.get(name)
+        return None if cost is None else cost * pixels
+
+    def wait(self):
+        """
+        Block until the latest jobs have finished and paint their results.
+        """
+        for job in set(self._latest.values()):
+            try:
+                job.future.result()
+            except Exception:
+                pass
+            self._deliver(job)
+
+    @staticmethod
+    def _run(job):
+        start = time.perf_counter()
+        result = job.function(job.token)
+        job.elapsed = time.perf_counter() - start
+        return result
+
+    def _is_current(self, job):
+        return any(self._generations[target] == generation
+                   for target, generation in zip(job.targets, job.generations))
+
+    def _deliver(self, job):
+        if job.delivered:
+            return
+        job.delivered = True
+
+        try:
+            result = job.future.result()
+        except (CancelledError, JobCancelled):
+            return
+        except Exception:
+            traceback.print_exc()
+            return
+
+        if job.name is not None and job.pixels:
+            cost = job.elapsed / job.pixels
+            if job.name in self.costs:
+                cost = self.COST_SMOOTHING * cost + (1 - self.COST_SMOOTHING) * self.costs[job.name]
+            self.costs[job.name] = cost
+
+        current = False
+        for target, generation, image in zip(job.targets, job.generations, result):
+            if self._generations[target] != generation:
+                continue
+            current = True
+            if image is not None:
+                target.Set_Image(image)
+        if current and job.on_done is not None:
+            job.on_done(result)
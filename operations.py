@@ -0,0 +1,513 @@
+import argparse
+import importlib.util
+import os
+import sys
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from Noise_and_filter import (apply_gaussian_noise, apply_uniform_noise, apply_salt_and_pepper_noise,
+                              apply_gaussian_filter, apply_median_filter, apply_averaging_filter)
+from EdgeDetection import (Sobel_Filter, Prewitt_Filter, Robert_Filter, Canny_Filter,
+                           SOBEL_KERNELS, PREWITT_KERNELS, ROBERTS_KERNELS, GRADIENT_PADDING)
+
+# Backends an operation can be implemented with: the manual per-pixel loops
+# every other backend is checked against, vectorized NumPy, OpenCV, and the
+# manual loops compiled with numba
+BACKENDS = ('reference', 'numpy', 'opencv', 'jit')
+
+# Optional module each backend needs
+BACKEND_MODULES = {'jit': 'numba'}
+
+# Backends tried, in order, after the selected one is missing or fails
+FALLBACK_ORDER = ('numpy', 'opencv', 'reference')
+
+# Backend selected at startup, e.g. OPERATION_BACKEND=opencv
+DEFAULT_BACKEND = os.environ.get('OPERATION_BACKEND', 'numpy')
+
+
+class BackendUnsupported(Exception):
+    """
+    Raised by a backend for an input it does not handle, e.g. an even kernel
+    for OpenCV's median filter; the next backend is tried instead.
+    """
+
+
+# Errors a backend raises when it cannot run an input or is not installed;
+# the next backend is tried instead
+FALLBACK_ERRORS = (ImportError, BackendUnsupported)
+
+
+class Param:
+    """
+    A parameter of an operation, with the range and scale of its GUI slider:
+    the operation receives the slider value times scale.
+    """
+
+    def __init__(self, name, label, default, minimum=0, maximum=100, scale=1):
+        self.name = name
+        self.label = label
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.scale = scale
+
+    def from_slider(self, value):
+        return value * self.scale if self.scale != 1 else value
+
+
+class Operation:
+    """
+    An image operation: its parameters, the labels of its outputs and its
+    implementations per backend.
+
+    Calling it runs the selected backend, falling back through
+    FALLBACK_ORDER when that backend is not registered, not installed or
+    cannot handle the input (FALLBACK_ERRORS). The backend that actually ran
+    is kept in last_backend.
+    """
+
+    def __init__(self, category, name, params=(), labels=(), deterministic=True, tolerance=0):
+        self.category = category
+        self.name = name
+        self.params = tuple(params)
+        self.labels = tuple(labels)
+        # random operations can not be compared across backends
+        self.deterministic = deterministic
+        # largest pixel difference allowed against the reference backend
+        self.tolerance = tolerance
+        self.backends = OrderedDict()
+        self.last_backend = None
+
+    def backend(self, name):
+        """
+        Decorator registering function as the implementation of backend name.
+
+        Raises:
+            ValueError: If the backend is unknown or already registered.
+        """
+        if name not in BACKENDS:
+            raise ValueError(f"Invalid backend '{name}'. Use " + ", ".join(BACKENDS) + ".")
+        if name in self.backends:
+            raise ValueError(f"Backend '{name}' of '{self.name}' already exists.")
+
+        def register_backend(function):
+            self.backends[name] = function
+            return function
+        return register_backend
+
+    def candidates(self, backend=None):
+        """
+        Return the registered and installed backends to try, in order.
+        """
+        order = (backend or _state['backend'],) + FALLBACK_ORDER + BACKENDS
+        return [name for name in OrderedDict.fromkeys(order)
+                if name in self.backends and backend_available(name)]
+
+    def __call__(self, image, *args, backend=None, **kwargs):
+        """
+        Run the operation on image with the first backend that can.
+
+        Args:
+            image (numpy.ndarray): Input image.
+            backend (str): Backend to try first, instead of the selected one.
+
+        Raises:
+            ValueError: If no backend can run it.
+        """
+        for name in self.candidates(backend):
+            try:
+                result = self.backends[name](image, *args, **kwargs)
+            except ImportError:
+                _state['missing'].add(name)
+                continue
+            except BackendUnsupported:
+                continue
+            self.last_backend = name
+            return result
+        raise ValueError(f"No backend can run '{self.name}'.")
+
+    def defaults(self):
+        return {param.name: param.default for param in self.params}
+
+
+REGISTRY = OrderedDict()
+
+_state = {'backend': None, 'missing': set()}
+
+
+def register(category, name, params=(), labels=(), **options):
+    """
+    Declare an operation shown as name in the combo box of category.
+
+    Returns:
+        Operation: The operation, to register its backends on.
+
+    Raises:
+        ValueError: If the operation already exists.
+    """
+    operations = REGISTRY.setdefault(category, OrderedDict())
+    if name in operations:
+        raise ValueError(f"Operation '{name}' of '{category}' already exists.")
+    operation = Operation(category, name, params, labels, **options)
+    operations[name] = operation
+    return operation
+
+
+def get_operation(category, name):
+    """
+    Return the operation name of category.
+
+    Raises:
+        ValueError: If there is no such operation.
+    """
+    operations = REGISTRY.get(category, {})
+    if name not in operations:
+        raise ValueError(f"Invalid {category} '{name}'. Use " + ", ".join(operations) + ".")
+    return operations[name]
+
+
+def operation_names(category):
+    return tuple(REGISTRY.get(category, ()))
+
+
+def backend_available(name):
+    """
+    Tell whether the optional module backend name needs is installed,
+    without importing it.
+    """
+    if name in _state['missing']:
+        return False
+    module = BACKEND_MODULES.get(name)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def available_backends():
+    return tuple(name for name in BACKENDS if backend_available(name))
+
+
+def get_backend():
+    return _state['backend']
+
+
+def set_backend(name):
+    """
+    Select the backend operations run with, when they have it.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Invalid backend '{name}'. Use " + ", ".join(BACKENDS) + ".")
+    _state['backend'] = name
+
+
+# ---------------------------------------------------------------------------
+# Shared kernels of the backends
+
+def _reference_gradients(image, kernel_x, kernel_y, padding):
+    # the per-pixel loop the gradient filters were first written as
+    height, width = image.shape
+    kernel_size = kernel_x.shape[0]
+    image = image.astype(np.float32)
+    x_filtered = np.zeros((height, width), dtype=np.float32)
+    y_filtered = np.zeros((height, width), dtype=np.float32)
+    image_padded = cv2.copyMakeBorder(image, padding, padding, padding, padding, borderType=cv2.BORDER_DEFAULT)
+    kernel_x = np.flip(kernel_x)
+    kernel_y = np.flip(kernel_y)
+
+    for i in range(height):
+        for j in range(width):
+            region = image_padded[i:i+kernel_size, j:j+kernel_size]
+            x_filtered[i, j] = np.multiply(region, kernel_x).sum()
+            y_filtered[i, j] = np.multiply(region, kernel_y).sum()
+    return cv2.convertScaleAbs(x_filtered), cv2.convertScaleAbs(y_filtered)
+
+
+def _opencv_gradients(image, kernel_x, kernel_y, padding):
+    # filter2D correlates, so it takes the flipped kernels; the anchor is the
+    # kernel element over the output pixel, padding in from the top left
+    image = image.astype(np.float32)
+    anchor = (padding, padding)
+    return tuple(cv2.convertScaleAbs(cv2.filter2D(image, cv2.CV_32F, np.flip(kernel), anchor=anchor,
+                                                  borderType=cv2.BORDER_DEFAULT))
+                 for kernel in (kernel_x, kernel_y))
+
+
+def _correlate_loop(image_padded, kernel, output):
+    rows, cols = output.shape
+    kernel_rows, kernel_cols = kernel.shape
+    for y in range(rows):
+        for x in range(cols):
+            total = 0.0
+            for i in range(kernel_rows):
+                for j in range(kernel_cols):
+                    total += image_padded[y + i, x + j] * kernel[i, j]
+            output[y, x] = total
+    return output
+
+
+_jit_kernels = {}
+
+
+def _jit_correlate(image_padded, kernel, output):
+    # numba is imported, and the loop compiled, on first use only
+    if 'correlate' not in _jit_kernels:
+        import numba
+        _jit_kernels['correlate'] = numba.njit(cache=True, nogil=True)(_correlate_loop)
+    return _jit_kernels['correlate'](image_padded, kernel, output)
+
+
+def _jit_gradients(image, kernel_x, kernel_y, padding):
+    image = image.astype(np.float32)
+    image_padded = cv2.copyMakeBorder(image, padding, padding, padding, padding, borderType=cv2.BORDER_DEFAULT)
+    return tuple(cv2.convertScaleAbs(_jit_correlate(image_padded, np.ascontiguousarray(np.flip(kernel)),
+                                                    np.zeros(image.shape, dtype=np.float32)))
+                 for kernel in (kernel_x, kernel_y))
+
+
+def _zero_padded(image, ksize):
+    # the padding of the manual filters: ksize // 2 zeros on every side
+    return np.pad(image, ksize // 2, mode='constant')
+
+
+def _reference_convolve(image, kernel):
+    kernel = np.flipud(np.fliplr(kernel))
+    output = np.zeros_like(image)
+    image_padded = np.pad(image, ((kernel.shape[0] // 2, kernel.shape[0] // 2),
+                                  (kernel.shape[1] // 2, kernel.shape[1] // 2)), mode='constant')
+    for x in range(image.shape[1]):
+        for y in range(image.shape[0]):
+            output[y, x] = (kernel * image_padded[y: y + kernel.shape[0], x: x + kernel.shape[1]]).sum()
+    return output
+
+
+def _jit_convolve(image, kernel):
+    image_padded = _zero_padded(image.astype(np.float64), kernel.shape[0])
+    output = np.zeros(image.shape, dtype=np.float64)
+    kernel = np.ascontiguousarray(np.flipud(np.fliplr(kernel)), dtype=np.float64)
+    return _jit_correlate(image_padded, kernel, output).astype(image.dtype)
+
+
+def _gaussian_1d(ksize, sigma=1):
+    ax = np.linspace(-(ksize - 1) / 2., (ksize - 1) / 2., ksize)
+    gauss = np.exp(-0.5 * np.square(ax) / np.square(sigma))
+    return gauss / np.sum(gauss)
+
+
+def _gaussian_2d(ksize, sigma=1):
+    gauss = _gaussian_1d(ksize, sigma)
+    kernel = np.outer(gauss, gauss)
+    return kernel / np.sum(kernel)
+
+
+def _average_kernel(ksize):
+    return np.ones((ksize, ksize), np.float32) / (ksize * ksize)
+
+
+# ---------------------------------------------------------------------------
+# Noise
+
+gaussian_noise = register("noise", "Gaussian", (Param('mean', "Mean", 0),
+                                                Param('var', "Variance", 10, minimum=1)),
+                          labels=("Noisy Image ",), deterministic=False)
+gaussian_noise.backend('numpy')(apply_gaussian_noise)
+
+uniform_noise = register("noise", "Uniform", (Param('low', "Min Value", 0),
+                                              Param('high', "Max Value", 50)),
+                         labels=("Noisy Image ",), deterministic=False)
+uniform_noise.backend('numpy')(apply_uniform_noise)
+
+salt_and_pepper_noise = register("noise", "Salt and Pepper",
+                                 (Param('salt_prob', "Salt Probability", 0.05, scale=0.01),
+                                  Param('pepper_prob', "Pepper Probability", 0.05, scale=0.01)),
+                                 labels=("Noisy Image ",), deterministic=False)
+salt_and_pepper_noise.backend('numpy')(apply_salt_and_pepper_noise)
+
+
+# ---------------------------------------------------------------------------
+# Smoothing filters; the manual filters pad with zeros and truncate to uint8
+
+KSIZE = Param('ksize', "Kernel Size", 5, minimum=1, maximum=31)
+
+gaussian_filter = register("filter", "Gaussian", (KSIZE,), labels=("Filtered Image",), tolerance=1)
+gaussian_filter.backend('numpy')(apply_gaussian_filter)
+
+
+@gaussian_filter.backend('reference')
+def _reference_gaussian_filter(image, ksize=5, sigma=1):
+    return _reference_convolve(image, _gaussian_2d(ksize, sigma))
+
+
+@gaussian_filter.backend('opencv')
+def _opencv_gaussian_filter(image, ksize=5, sigma=1):
+    gauss = _gaussian_1d(ksize, sigma)
+    filtered = cv2.sepFilter2D(image.astype(np.float64), cv2.CV_64F, gauss, gauss, borderType=cv2.BORDER_CONSTANT)
+    return filtered.astype(image.dtype)
+
+
+@gaussian_filter.backend('jit')
+def _jit_gaussian_filter(image, ksize=5, sigma=1):
+    return _jit_convolve(image, _gaussian_2d(ksize, sigma))
+
+
+median_filter = register("filter", "Median", (KSIZE,), labels=("Filtered Image",))
+median_filter.backend('numpy')(apply_median_filter)
+
+
+@median_filter.backend('reference')
+def _reference_median_filter(image, ksize=5):
+    output = np.zeros_like(image)
+    image_padded = _zero_padded(image, ksize)
+    for x in range(image.shape[1]):
+        for y in range(image.shape[0]):
+            output[y, x] = np.median(image_padded[y: y + ksize, x: x + ksize])
+    return output
+
+
+@median_filter.backend('opencv')
+def _opencv_median_filter(image, ksize=5):
+    # medianBlur replicates the border and only takes odd kernels (above 5,
+    # only on uint8), so pad with zeros here and crop
+    if ksize % 2 == 0 or image.dtype != np.uint8:
+        raise BackendUnsupported("OpenCV median filters odd kernels of uint8 images only.")
+    pad = ksize // 2
+    filtered = cv2.medianBlur(_zero_padded(image, ksize), ksize)
+    return filtered[pad:pad + image.shape[0], pad:pad + image.shape[1]]
+
+
+# the float32 reference loop rounds some whole means one level down, see
+# apply_averaging_filter
+average_filter = register("filter", "Average", (KSIZE,), labels=("Filtered Image",), tolerance=1)
+average_filter.backend('numpy')(apply_averaging_filter)
+
+
+@average_filter.backend('reference')
+def _reference_average_filter(image, ksize=5):
+    return _reference_convolve(image, _average_kernel(ksize))
+
+
+@average_filter.backend('opencv')
+def _opencv_average_filter(image, ksize=5):
+    # anchored like the zero-padded manual filter, also for even kernels
+    anchor = (ksize // 2, ksize // 2)
+    filtered = cv2.boxFilter(image.astype(np.float64), -1, (ksize, ksize), anchor=anchor,
+                             normalize=True, borderType=cv2.BORDER_CONSTANT)
+    return filtered.astype(image.dtype)
+
+
+@average_filter.backend('jit')
+def _jit_average_filter(image, ksize=5):
+    return _jit_convolve(image, _average_kernel(ksize))
+
+
+# ---------------------------------------------------------------------------
+# Edge detection
+
+def _register_gradient(name, function, kernels):
+    operation = register("edges", name, labels=("Gradient X", "Gradient Y"))
+    operation.backend('numpy')(function)
+    for backend, gradients in (('reference', _reference_gradients), ('opencv', _opencv_gradients),
+                               ('jit', _jit_gradients)):
+        operation.backend(backend)(lambda image, gradients=gradients: gradients(image, *kernels, GRADIENT_PADDING))
+    return operation
+
+
+sobel = _register_gradient("Sobel", Sobel_Filter, SOBEL_KERNELS)
+roberts = _register_gradient("Roberts", Robert_Filter, ROBERTS_KERNELS)
+prewitt = _register_gradient("Prewitt", Prewitt_Filter, PREWITT_KERNELS)
+
+canny = register("edges", "Canny", labels=("Gradient ", "Output_2"))
+canny.backend('opencv')(Canny_Filter)
+
+try:
+    set_backend(DEFAULT_BACKEND)
+except ValueError as error:
+    # a typo in the environment should not stop the program from starting
+    print(f"OPERATION_BACKEND: {error} Falling back to numpy.", file=sys.stderr)
+    set_backend('numpy')
+
+
+# ---------------------------------------------------------------------------
+# Cross-backend equivalence
+
+def _max_difference(result, expected):
+    if isinstance(result, tuple):
+        return max(_max_difference(item, other) for item, other in zip(result, expected))
+    if result.shape != expected.shape:
+        return float('inf')
+    return float(np.abs(result.astype(np.float64) - expected.astype(np.float64)).max(initial=0))
+
+
+def check_equivalence(image, categories=None, params=None):
+    """
+    Compare every installed backend of the deterministic operations with
+    their reference backend on image.
+
+    Args:
+        image (numpy.ndarray): Grayscale test image; keep it small, the
+            reference backends are per-pixel Python loops.
+        categories (tuple): Categories to check, all by default.
+        params (dict): Keyword arguments per category, e.g. {'filter': {'ksize': 3}}.
+
+    Returns:
+        list: (operation, backend, largest difference or None if the backend
+        could not run, within tolerance) per compared backend.
+    """
+    params = params or {}
+    report = []
+    for category, operations in REGISTRY.items():
+        if categories is not None and category not in categories:
+            continue
+        for operation in operations.values():
+            if not operation.deterministic or 'reference' not in operation.backends:
+                continue
+            kwargs = params.get(category, {})
+            expected = operation.backends['reference'](image, **kwargs)
+            for backend, function in operation.backends.items():
+                if backend == 'reference' or not backend_available(backend):
+                    continue
+                try:
+                    difference = _max_difference(function(image, **kwargs), expected)
+                except FALLBACK_ERRORS:
+                    report.append((operation, backend, None, True))
+                    continue
+                report.append((operation, backend, difference, difference <= operation.tolerance))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that every backend matches the reference backend.")
+    parser.add_argument('image', nargs='?', help="Test image, random noise by default.")
+    parser.add_argument('--size', type=int, default=64, help="Side the test image is resized to.")
+    parser.add_argument('--ksize', type=int, nargs='+', default=[3, 4, 5], help="Filter kernel sizes.")
+    args = parser.parse_args(argv)
+
+    if args.image:
+        image = cv2.imread(args.image, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            parser.error(f"Cannot read image '{args.image}'.")
+        image = cv2.resize(image, (args.size, args.size), interpolation=cv2.INTER_AREA)
+    else:
+        image = np.random.default_rng(0).integers(0, 256, (args.size, args.size), dtype=np.uint8)
+
+    # only the filters take parameters, so only they are checked per kernel size
+    runs = [("", check_equivalence(image, categories=[category for category in REGISTRY if category != 'filter']))]
+    runs += [(f" k={ksize}", check_equivalence(image, ('filter',), {'filter': {'ksize': ksize}}))
+             for ksize in args.ksize]
+    failures = 0
+    for suffix, report in runs:
+        for operation, backend, difference, ok in report:
+            label = f"{operation.category}/{operation.name}{suffix}"
+            status = "skipped" if difference is None else f"max diff {difference:g}"
+            print(f"{label:24} {backend:8} {status}" + ("" if ok else " MISMATCH"))
+            failures += not ok
+    missing = [backend for backend in BACKENDS if not backend_available(backend)]
+    if missing:
+        print("not installed: " + ", ".join(missing))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
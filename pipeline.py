@@ -0,0 +1,291 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import cv2
+
+from operations import get_operation
+from frequncy_domain import FrequencyFilterBank, low_and_high_pass_filter, hybrid_from_banks, hybrid
+from EnhanceImg_Display import (process_image, normalize_image, equalize_image,
+                                manual_global_threshold, manual_local_threshold)
+from result_cache import content_key
+
+# Results kept per node, e.g. for a coarse preview and its refined proxy
+MEMO_SIZE = 2
+
+
+class Node:
+    """
+    A step of a Pipeline: function(*input values, **params), where inputs
+    are the names of sources or earlier nodes and params the declared
+    parameters with their defaults.
+    """
+
+    def __init__(self, name, function, inputs=(), params=None, discard=None):
+        self.name = name
+        self.function = function
+        self.inputs = tuple(inputs)
+        self.params = dict(params or {})
+        # called with a memoized value once it is dropped
+        self.discard = discard
+        self.computations = 0
+        self._memo = OrderedDict()
+        # key -> Future of a computation in progress, which other evaluations wait on
+        self._pending = {}
+
+
+class Pipeline:
+    """
+    DAG of image processing steps with memoized nodes.
+
+    A node's memo key is built from the content keys of the sources upstream
+    of it and the parameters of itself and every node upstream of it. After
+    a source or parameter change, only the nodes downstream of it get a new
+    key; every other node is answered from its memo. For example, changing
+    the filter kernel reuses the memoized noise.
+
+    One pipeline can be evaluated from several worker threads at once:
+    sources and parameters are passed per evaluation, not stored, and a lock
+    is held only to look up and insert memoized values, never while a node
+    computes. An evaluation needing a value another one is computing waits
+    for it instead of computing it again.
+    """
+
+    def __init__(self):
+        self.sources = []
+        self.nodes = OrderedDict()
+        self._upstream = {}
+        self._lock = threading.Lock()
+
+    def add_source(self, name):
+        """
+        Declare an input image of the pipeline.
+        """
+        self.sources.append(name)
+        self._upstream[name] = frozenset([name])
+
+    def add_node(self, name, function, inputs=(), params=None, discard=None):
+        """
+        Declare a step. Its inputs must already be declared, which keeps the
+        graph acyclic.
+
+        Returns:
+            Node: The new node.
+
+        Raises:
+            ValueError: If the name is taken or an input is unknown.
+        """
+        if name in self._upstream:
+            raise ValueError(f"Node '{name}' already exists.")
+        for input_name in inputs:
+            if input_name not in self._upstream:
+                raise ValueError(f"Unknown input '{input_name}' of node '{name}'.")
+        node = Node(name, function, inputs, params, discard)
+        self.nodes[name] = node
+        self._upstream[name] = frozenset([name]).union(*(self._upstream[input_name] for input_name in inputs))
+        return node
+
+    def upstream(self, name):
+        """
+        Return the names of the sources and nodes name depends on, itself included.
+        """
+        return self._upstream[name]
+
+    def _node_params(self, name, params):
+        node = self.nodes[name]
+        overrides = params.get(name, {})
+        unknown = set(overrides) - set(node.params)
+        if unknown:
+            raise ValueError(f"Unknown parameters {sorted(unknown)} of node '{name}'.")
+        return {**node.params, **overrides}
+
+    def key(self, names, sources, params=None):
+        """
+        Build the key of the outputs names as (source content keys, names,
+        parameters). It has the layout of ResultCache.key, so it can be used
+        as a result cache key too.
+        """
+        params = params or {}
+        if isinstance(names, str):
+            names = (names,)
+        upstream = frozenset().union(*(self._upstream[name] for name in names))
+        source_keys = tuple(content_key(sources[name]) for name in self.sources if name in upstream)
+        node_params = tuple((name, tuple(sorted(self._node_params(name, params).items())))
+                            for name in self.nodes if name in upstream)
+        return source_keys, tuple(names), node_params
+
+    def evaluate(self, names, sources, params=None, token=None):
+        """
+        Return the value of node names (a tuple of values for a tuple of
+        names), computing only the nodes whose key is not memoized.
+
+        Args:
+            names (str or tuple): Output node(s).
+            sources (dict): Image of every source upstream of the outputs.
+            params (dict): Parameter overrides per node name.
+            token (CancelToken): Checked before every computed node.
+        """
+        params = params or {}
+        if isinstance(names, str):
+            return self._evaluate(names, sources, params, token, {})
+        values = {}
+        return tuple(self._evaluate(name, sources, params, token, values) for name in names)
+
+    def _evaluate(self, name, sources, params, token, values):
+        if name in values:
+            return values[name]
+        if name not in self.nodes:
+            value = sources[name]
+            if value is None:
+                raise ValueError(f"Source '{name}' is not set.")
+            values[name] = value
+            return value
+
+        node = self.nodes[name]
+        key = self.key(name, sources, params)
+        while True:
+            with self._lock:
+                if key in node._memo:
+                    node._memo.move_to_end(key)
+                    values[name] = node._memo[key]
+                    return values[name]
+                pending = node._pending.get(key)
+                if pending is None:
+                    pending = node._pending[key] = Future()
+                    break
+            # another evaluation is computing this value; if it fails or is
+            # cancelled before finishing, claim the computation again
+            try:
+                values[name] = pending.result()
+                return values[name]
+            except Exception:
+                if token is not None:
+                    token.check()
+
+        try:
+            inputs = [self._evaluate(input_name, sources, params, token, values) for input_name in node.inputs]
+            if token is not None:
+                token.check()
+            value = node.function(*inputs, **self._node_params(name, params))
+        except BaseException as error:
+            with self._lock:
+                del node._pending[key]
+            pending.set_exception(error)
+            raise
+
+        # evaluations waiting on the value get it even if this one was
+        # cancelled meanwhile, but a cancelled evaluation does not memoize it
+        # (a discarded value, e.g. a filter bank, stays usable by the waiters)
+        cancelled = token is not None and token.cancelled
+        dropped = []
+        with self._lock:
+            del node._pending[key]
+            node.computations += 1
+            if cancelled:
+                dropped.append(value)
+            else:
+                node._memo[key] = value
+                while len(node._memo) > MEMO_SIZE:
+                    dropped.append(node._memo.popitem(last=False)[1])
+        pending.set_result(value)
+        if node.discard is not None:
+            for old_value in dropped:
+                node.discard(old_value)
+        if cancelled:
+            token.check()
+        values[name] = value
+        return value
+
+    def clear(self):
+        """
+        Drop every memoized value.
+        """
+        with self._lock:
+            for node in self.nodes.values():
+                for value in node._memo.values():
+                    if node.discard is not None:
+                        node.discard(value)
+                node._memo.clear()
+
+
+def add_noise(image, kind="Gaussian", param_1=0, param_2=10):
+    """
+    Apply the noise named kind. param_1 and param_2 are the mean and variance,
+    the low and high values, or the salt and pepper probabilities.
+    """
+    return get_operation("noise", kind)(image, param_1, param_2)
+
+
+def apply_filter(image, kind="Gaussian", ksize=5, backend=None):
+    """
+    Apply the smoothing filter named kind with a ksize x ksize kernel, with
+    backend or else the selected one.
+    """
+    return get_operation("filter", kind)(image, ksize, backend=backend)
+
+
+def detect_edges(image, kind="Sobel", backend=None):
+    """
+    Return the two output images of the edge detector named kind, with
+    backend or else the selected one.
+    """
+    return get_operation("edges", kind)(image, backend=backend)
+
+
+def filter_bank(image, radii=()):
+    """
+    Return a FrequencyFilterBank of image, sweeping radii in the background.
+    """
+    bank = FrequencyFilterBank(image)
+    if radii:
+        bank.precompute(radii)
+    return bank
+
+
+def resize_like(image, reference):
+    """
+    Resize image to the shape of reference, if it differs.
+    """
+    if image.shape[:2] == reference.shape[:2]:
+        return image
+    return cv2.resize(image, (reference.shape[1], reference.shape[0]))
+
+
+def build_image_graph():
+    """
+    Build the pipeline of the application's operations.
+
+    Sources: 'gray' and 'rgb' (the input image), 'image_2' (second hybrid image).
+    Outputs: 'noise', 'filter', 'edges', 'histogram', 'normalized',
+    'equalized', 'global_threshold', 'local_threshold', 'frequency' and
+    'hybrid' (through filter banks) and 'frequency_direct' and
+    'hybrid_direct' (one-off computations, for full-resolution renders).
+    """
+    graph = Pipeline()
+    for source in ('gray', 'rgb', 'image_2'):
+        graph.add_source(source)
+
+    graph.add_node('noise', add_noise, ('gray',), {'kind': "Gaussian", 'param_1': 0, 'param_2': 10})
+    graph.add_node('filter', apply_filter, ('noise',), {'kind': "Gaussian", 'ksize': 5, 'backend': None})
+    graph.add_node('edges', detect_edges, ('gray',), {'kind': "Sobel", 'backend': None})
+
+    graph.add_node('histogram', lambda image: process_image(image, mode="gray"), ('gray',))
+    graph.add_node('rgb_histogram', lambda image: process_image(image, mode="rgb"), ('rgb',))
+    graph.add_node('normalized', normalize_image, ('gray',))
+    graph.add_node('equalized', equalize_image, ('gray',),
+                   {'method': "global", 'clip_limit': 2.0, 'tile_grid_size': (8, 8)})
+    graph.add_node('global_threshold', manual_global_threshold, ('gray',),
+                   {'thresh': 128, 'method': "fixed", 'percentile': 50, 'max_value': 255})
+    graph.add_node('local_threshold', manual_local_threshold, ('gray',),
+                   {'block_size': 11, 'c': 2, 'method': "mean", 'k': None, 'r': 128})
+
+    graph.add_node('frequency_bank', filter_bank, ('gray',), {'radii': ()}, discard=FrequencyFilterBank.cancel)
+    graph.add_node('frequency', lambda bank, radius: bank.low_and_high_pass(radius), ('frequency_bank',), {'radius': 1})
+    graph.add_node('frequency_direct', low_and_high_pass_filter, ('gray',), {'radius': 1})
+
+    graph.add_node('image_2_resized', resize_like, ('image_2', 'gray'))
+    graph.add_node('hybrid_low_bank', filter_bank, ('gray',), {'radii': ()}, discard=FrequencyFilterBank.cancel)
+    graph.add_node('hybrid_high_bank', filter_bank, ('image_2_resized',), {'radii': ()}, discard=FrequencyFilterBank.cancel)
+    graph.add_node('hybrid', hybrid_from_banks, ('hybrid_low_bank', 'hybrid_high_bank'), {'radius1': 1, 'radius2': 1})
+    graph.add_node('hybrid_direct', hybrid, ('gray', 'image_2'), {'radius1': 1, 'radius2': 1})
+    return graph
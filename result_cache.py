@@ -0,0 +1,142 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+# Default memory budget of the result cache (bytes)
+RESULT_CACHE_BYTES = 256 * 1024 * 1024
+
+_content_keys = {}
+
+
+def content_key(image):
+    """
+    Return a key built from the shape, dtype and BLAKE2 content hash of an
+    image. The hash is remembered for as long as the array is alive, so an
+    image that is not modified in place is hashed once.
+
+    Args:
+        image (numpy.ndarray): Any array.
+
+    Returns:
+        tuple: (shape, dtype string, digest).
+    """
+    key = id(image)
+    entry = _content_keys.get(key)
+    if entry is not None and entry[0]() is image:
+        return entry[1]
+
+    digest = hashlib.blake2b(np.ascontiguousarray(image), digest_size=16).digest()
+    content = (image.shape, image.dtype.str, digest)
+    ref = weakref.ref(image, lambda _, key=key: _content_keys.pop(key, None))
+    _content_keys[key] = (ref, content)
+    return content
+
+
+def _result_bytes(result):
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sum(_result_bytes(item) for item in result)
+    return 0
+
+
+def _freeze(result):
+    # cached arrays are shared between callers, so make them read-only
+    if isinstance(result, np.ndarray):
+        result.setflags(write=False)
+    elif isinstance(result, (tuple, list)):
+        for item in result:
+            _freeze(item)
+
+
+class ResultCache:
+    """
+    LRU cache of operation results keyed by (input content keys, operation,
+    parameters), limited by the total size of the cached arrays.
+
+    Results are stored read-only because every hit returns the same arrays.
+    The cache is safe to use from worker threads.
+    """
+
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(images, operation, params=()):
+        """
+        Build the cache key of operation with params on the given input images.
+        """
+        return tuple(content_key(image) for image in images), operation, tuple(params)
+
+    def get(self, key):
+        """
+        Return the cached result of key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        """
+        Store result under key and evict the least recently used results
+        beyond the byte budget. A result larger than the budget is not stored.
+        """
+        size = _result_bytes(result)
+        if size > self.max_bytes:
+            return
+        _freeze(result)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (result, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+                self.evicted_bytes += evicted
+
+    def invalidate(self, content):
+        """
+        Drop every result computed from an input with the given content key,
+        e.g. once a new image replaces it.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if content in key[0]]:
+                self.bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        Return the hit, miss and eviction counters and the memory in use.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'evicted_bytes': self.evicted_bytes,
+            }
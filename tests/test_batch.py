@@ -0,0 +1,48 @@
+import cv2
+import numpy as np
+import pytest
+
+import batch
+from batch import build_chain
+
+
+@pytest.fixture
+def sources():
+    rng = np.random.default_rng(0)
+    gray = rng.integers(0, 256, (24, 32), dtype=np.uint8)
+    return {'gray': gray, 'rgb': np.dstack([gray] * 3), 'image_2': None}
+
+
+def test_chain_feeds_first_output(sources):
+    edges = build_chain(['noise', 'filter', 'edges']).evaluate('output', sources)
+    assert isinstance(edges, tuple) and all(output.shape == sources['gray'].shape for output in edges)
+
+
+def test_histogram_ends_the_chain(sources):
+    plots = build_chain(['edges', 'histogram']).evaluate('output', sources)
+    assert all(plot.ndim == 3 for plot in plots)
+
+
+def test_histogram_before_another_operation_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        build_chain(['histogram', 'edges'])
+    assert batch.main([str(tmp_path), '-o', str(tmp_path / 'out'), '--ops', 'histogram,edges']) == 2
+
+
+def run_noise(tmp_path, output, *options):
+    image = np.random.default_rng(1).integers(0, 256, (24, 32), dtype=np.uint8)
+    for name in ('a.png', 'b.png'):
+        cv2.imwrite(str(tmp_path / name), image)
+    assert batch.main([str(tmp_path / '*.png'), '-o', str(tmp_path / output), '--ops', 'noise', '-j', '2',
+                       *options]) == 0
+    return [cv2.imread(str(tmp_path / output / f"{name}_noise.png")) for name in ('a', 'b')]
+
+
+def test_workers_draw_different_noise(tmp_path):
+    first, second = run_noise(tmp_path, 'out')
+    assert not np.array_equal(first, second)
+
+
+def test_seed_makes_noise_reproducible(tmp_path):
+    assert all(np.array_equal(*pair)
+               for pair in zip(run_noise(tmp_path, 'out_1', '--seed', '3'), run_noise(tmp_path, 'out_2', '--seed', '3')))
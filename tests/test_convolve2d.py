@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import Noise_and_filter
+from Noise_and_filter import convolve2d, CONVOLVE_METHODS, _convolution_costs, _fft_blocks
+
+
+def loop_convolve(image, kernel):
+    # per-pixel convolution with zero padding, in float64
+    kernel = np.flipud(np.fliplr(kernel))
+    kernel_h, kernel_w = kernel.shape
+    image_padded = np.pad(image.astype(np.float64), ((kernel_h // 2, kernel_h // 2), (kernel_w // 2, kernel_w // 2)))
+    output = np.zeros(image.shape, dtype=np.float64)
+    for y in range(image.shape[0]):
+        for x in range(image.shape[1]):
+            output[y, x] = (kernel * image_padded[y:y + kernel_h, x:x + kernel_w]).sum()
+    return output
+
+
+def gaussian_kernel(ksize, sigma=1):
+    ax = np.linspace(-(ksize - 1) / 2., (ksize - 1) / 2., ksize)
+    gauss = np.exp(-0.5 * np.square(ax) / np.square(sigma))
+    return np.outer(gauss, gauss) / np.sum(gauss) ** 2
+
+
+rng = np.random.default_rng(0)
+
+KERNELS = {
+    'gaussian_5': gaussian_kernel(5),
+    'gaussian_4': gaussian_kernel(4),
+    'box_3x7': np.ones((3, 7)) / 21,
+    'random_5': rng.normal(size=(5, 5)),
+    'random_6x3': rng.normal(size=(6, 3)),
+}
+
+
+def is_separable(kernel):
+    return np.linalg.matrix_rank(kernel) == 1
+
+
+@pytest.mark.parametrize("method", CONVOLVE_METHODS)
+@pytest.mark.parametrize("name", KERNELS)
+def test_methods_match_loop_within_documented_tolerance(method, name):
+    kernel = KERNELS[name]
+    image = np.random.default_rng(1).uniform(0, 255, (37, 52))
+    if method == 'separable' and not is_separable(kernel):
+        with pytest.raises(ValueError):
+            convolve2d(image, kernel, method=method)
+        return
+
+    result, used = convolve2d(image, kernel, method=method, return_method=True)
+    assert used == method
+    # the tolerance documented by convolve2d
+    tolerance = 1e-9 * np.abs(kernel).sum() * np.abs(image).max()
+    assert np.abs(result - loop_convolve(image, kernel)).max() <= tolerance
+
+
+@pytest.mark.parametrize("name", KERNELS)
+def test_integer_images_differ_by_at_most_one_level(name):
+    kernel = np.abs(KERNELS[name])
+    kernel /= kernel.sum()
+    image = np.random.default_rng(2).integers(0, 256, (37, 52), dtype=np.uint8)
+    methods = [method for method in CONVOLVE_METHODS if method != 'separable' or is_separable(kernel)]
+    results = [convolve2d(image, kernel, method=method).astype(np.int16) for method in methods]
+    for result in results[1:]:
+        assert np.abs(result - results[0]).max() <= 1
+
+
+@pytest.mark.parametrize("name", KERNELS)
+def test_fft_blocks_overlap_add(name, monkeypatch):
+    # smaller blocks, so the image spans several of them and the last row
+    # and column of blocks are partial
+    monkeypatch.setattr(Noise_and_filter, 'FFT_MIN_BLOCK', 8)
+    monkeypatch.setattr(Noise_and_filter, 'FFT_BLOCK_KERNELS', 2)
+    kernel = KERNELS[name]
+    image = np.random.default_rng(3).uniform(0, 255, (37, 52))
+    (block_h, block_w), _ = _fft_blocks(image.shape, kernel.shape)
+    assert block_h < image.shape[0] and block_w < image.shape[1]
+
+    result = convolve2d(image, kernel, method='fft')
+    tolerance = 1e-9 * np.abs(kernel).sum() * np.abs(image).max()
+    assert np.abs(result - loop_convolve(image, kernel)).max() <= tolerance
+
+
+@pytest.mark.parametrize("shape, kernel, expected", [
+    ((64, 80), rng.normal(size=(3, 3)), 'direct'),
+    ((64, 80), gaussian_kernel(3), 'separable'),
+    ((96, 120), rng.normal(size=(25, 25)), 'fft'),
+], ids=["small", "small_separable", "large"])
+def test_auto_picks_cheapest_method(shape, kernel, expected):
+    image = np.random.default_rng(4).uniform(0, 255, shape)
+    result, used = convolve2d(image, kernel, return_method=True)
+    costs = _convolution_costs(shape, kernel.shape, is_separable(kernel))
+    assert used == expected == min(costs, key=costs.get)
+    tolerance = 1e-9 * np.abs(kernel).sum() * np.abs(image).max()
+    assert np.abs(result - loop_convolve(image, kernel)).max() <= tolerance
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        convolve2d(np.zeros((4, 4)), np.ones((3, 3)), method='winograd')
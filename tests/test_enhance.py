@@ -0,0 +1,174 @@
+import gc
+import glob
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+import EnhanceImg_Display
+from EnhanceImg_Display import (ImageStatistics, image_statistics, _local_mean_and_std, equalize_image, global_threshold_value, manual_global_threshold,
+                                manual_local_threshold, multilevel_threshold)
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Images")
+
+# CLAHE against cv2.createCLAHE, in grey levels. When the grid divides the
+# image the two differ only where OpenCV's float32 LUT scale rounds the
+# other way. Otherwise both pad the image, but OpenCV's tiles of the padded
+# image do not line up with ours: over the images in Images/ this measured
+# up to 15 levels, and a mean of up to 1.6.
+CLAHE_MAX_DIFFERENCE = 1
+CLAHE_PADDED_MAX_DIFFERENCE = 16
+CLAHE_PADDED_MEAN_DIFFERENCE = 2
+
+
+@pytest.fixture
+def small_image():
+    return np.random.default_rng(0).integers(0, 256, (13, 17), dtype=np.uint8)
+
+
+def windowed_mean_and_std(image, block_size):
+    # every window summed pixel by pixel, with the border replicated
+    pad = block_size // 2
+    padded = np.pad(image.astype(np.float64), pad, mode='edge')
+    mean = np.zeros(image.shape)
+    std = np.zeros(image.shape)
+    for y in range(image.shape[0]):
+        for x in range(image.shape[1]):
+            window = padded[y:y + block_size, x:x + block_size]
+            mean[y, x] = window.mean()
+            std[y, x] = window.std()
+    return mean, std
+
+
+# block sizes smaller than the image, even (rounded up), and larger than
+# the image so every window reaches past the border
+BLOCK_SIZES = [3, 4, 7, 21]
+
+
+@pytest.mark.parametrize("block_size", [3, 7, 21])
+def test_local_mean_and_std_match_windows(small_image, block_size):
+    mean, std = _local_mean_and_std(small_image, block_size)
+    expected_mean, expected_std = windowed_mean_and_std(small_image, block_size)
+    assert np.allclose(mean, expected_mean, rtol=0, atol=1e-9)
+    assert np.allclose(std, expected_std, rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("method, k", [("mean", None), ("niblack", -0.2), ("niblack", 0.3), ("sauvola", 0.5)])
+@pytest.mark.parametrize("block_size", BLOCK_SIZES)
+def test_local_threshold_matches_windows(small_image, method, k, block_size):
+    c, r = 2, 128
+    mean, std = windowed_mean_and_std(small_image, block_size | 1)
+    thresh = {"mean": mean,
+              "niblack": mean + (k or 0) * std,
+              "sauvola": mean * (1 + (k or 0) * (std / r - 1))}[method] - c
+    expected = np.where(small_image > thresh, 255, 0)
+
+    result = manual_local_threshold(small_image, block_size, c, method, k, r)
+    # pixels sitting on their threshold may go either way with rounding
+    ties = np.abs(small_image - thresh) < 1e-6
+    assert result.dtype == np.uint8
+    assert np.array_equal(result[~ties], expected[~ties])
+
+
+def threshold_images():
+    rng = np.random.default_rng(5)
+    bimodal = np.clip(np.concatenate([rng.normal(60, 15, 600), rng.normal(180, 25, 900)]), 0, 255)
+    yield pytest.param(bimodal.astype(np.uint8).reshape(30, 50), id="bimodal")
+    # a long tail on either side, so triangle runs both unflipped and flipped
+    yield pytest.param(np.clip(rng.exponential(30, (40, 40)), 0, 255).astype(np.uint8), id="dark")
+    yield pytest.param((255 - np.clip(rng.exponential(30, (40, 40)), 0, 255)).astype(np.uint8), id="bright")
+    for path in sorted(glob.glob(os.path.join(IMAGES_DIR, "*.jp*g")))[:3]:
+        yield pytest.param(cv2.imread(path, cv2.IMREAD_GRAYSCALE), id=os.path.basename(path))
+
+
+@pytest.mark.parametrize("method, flag", [("otsu", cv2.THRESH_OTSU), ("triangle", cv2.THRESH_TRIANGLE)])
+@pytest.mark.parametrize("image", list(threshold_images()))
+def test_automatic_thresholds_match_opencv(image, method, flag):
+    opencv_thresh, opencv_result = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY | flag)
+    # OpenCV's bright class is above its threshold, ours starts at it
+    assert global_threshold_value(image, method) == int(opencv_thresh) + 1
+    assert np.array_equal(manual_global_threshold(image, method=method), opencv_result)
+
+
+def test_multilevel_threshold_classes():
+    image = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    thresholds = [200, 50, 128]
+    labels = multilevel_threshold(image, thresholds)
+    # one class per interval, increasing with the pixel value
+    assert np.array_equal(np.unique(labels), np.arange(len(thresholds) + 1))
+    assert np.all(np.diff(labels.ravel().astype(int)) >= 0)
+    for label, (low, high) in enumerate(zip([0, 50, 128, 200], [50, 128, 200, 256])):
+        assert np.all(labels[(image >= low) & (image < high)] == label)
+
+
+def clahe_cases():
+    for name in ("1.jpg", "images (6).jpg", "tiger2.jpg"):
+        image = cv2.imread(os.path.join(IMAGES_DIR, name), cv2.IMREAD_GRAYSCALE)
+        for clip_limit, tile_grid_size in ((1.0, (8, 8)), (2.0, (8, 8)), (4.0, (4, 6))):
+            yield pytest.param(image, clip_limit, tile_grid_size, id=f"{name}-{clip_limit}-{tile_grid_size}")
+
+
+def opencv_clahe(image, clip_limit, tile_grid_size):
+    rows, cols = tile_grid_size
+    return cv2.createCLAHE(clip_limit, (cols, rows)).apply(image).astype(np.int16)
+
+
+@pytest.mark.parametrize("image, clip_limit, tile_grid_size", list(clahe_cases()))
+def test_clahe_matches_opencv(image, clip_limit, tile_grid_size):
+    rows, cols = tile_grid_size
+    divisible = np.ascontiguousarray(image[:image.shape[0] // rows * rows, :image.shape[1] // cols * cols])
+    result = equalize_image(divisible, "clahe", clip_limit, tile_grid_size)
+    assert np.abs(result - opencv_clahe(divisible, clip_limit, tile_grid_size)).max() <= CLAHE_MAX_DIFFERENCE
+
+    difference = np.abs(equalize_image(image, "clahe", clip_limit, tile_grid_size)
+                        - opencv_clahe(image, clip_limit, tile_grid_size))
+    assert difference.max() <= CLAHE_PADDED_MAX_DIFFERENCE
+    assert difference.mean() <= CLAHE_PADDED_MEAN_DIFFERENCE
+
+
+@pytest.mark.parametrize("shape", [(23, 31), (23, 31, 3)], ids=["gray", "rgb"])
+def test_statistics_match_numpy(shape):
+    image = np.random.default_rng(6).integers(20, 230, shape, dtype=np.uint8)
+    stats = ImageStatistics(image)
+    assert (stats.min, stats.max, stats.pixel_count) == (image.min(), image.max(), image.size)
+    assert stats.mean == pytest.approx(image.mean())
+    assert stats.variance == pytest.approx(image.var())
+    for q in (0, 1, 25, 50, 99.5, 100):
+        assert stats.percentile(q) == np.percentile(image, q, method='inverted_cdf')
+
+
+def test_statistics_are_computed_once(monkeypatch):
+    calls = []
+    histogram = EnhanceImg_Display.calculate_histogram
+    monkeypatch.setattr(EnhanceImg_Display, "calculate_histogram",
+                        lambda *args: calls.append(args) or histogram(*args))
+    image = np.random.default_rng(7).integers(0, 256, (9, 9), dtype=np.uint8)
+    stats = ImageStatistics(image)
+    for name in ("histogram", "cdf", "min", "max", "mean", "variance", "otsu_threshold", "triangle_threshold"):
+        assert getattr(stats, name) is getattr(stats, name)
+    stats.percentile(50)
+    assert len(calls) == 1
+
+
+def test_statistics_of_an_empty_image():
+    image = np.zeros((0, 5), dtype=np.uint8)
+    stats = ImageStatistics(image)
+    assert stats.pixel_count == 0
+    for statistic in (lambda: stats.min, lambda: stats.max, lambda: stats.percentile(50),
+                      lambda: stats.triangle_threshold):
+        with pytest.raises(ValueError):
+            statistic()
+
+
+def test_shared_statistics_are_dropped_with_the_image():
+    image = np.random.default_rng(8).integers(0, 256, (9, 9), dtype=np.uint8)
+    stats = image_statistics(image)
+    assert image_statistics(image) is stats
+    assert image_statistics(image.copy()) is not stats
+
+    key = id(image)
+    assert key in EnhanceImg_Display._statistics_cache
+    del image
+    gc.collect()
+    assert key not in EnhanceImg_Display._statistics_cache
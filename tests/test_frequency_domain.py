@@ -0,0 +1,98 @@
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from frequncy_domain import FrequencyFilterBank, shifted_half_spectrum, low_and_high_pass_filter
+
+IMAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Images", "tiger2.jpg")
+
+# Largest error of the shifted half spectrum relative to the largest bin of
+# the complex128 fft2 spectrum
+SPECTRUM_RTOL = {'double': 1e-12, 'single': 1e-6}
+
+# The filtered uint8 images may differ from the float64 fft2 path by one
+# grey level where a value sits next to an integer, on at most this
+# fraction of the pixels
+FILTER_MISMATCH_FRACTION = {'double': 1e-4, 'single': 1e-3}
+
+
+@pytest.fixture(scope="module", params=[(257, 190), (256, 320)], ids=["odd", "even"])
+def image(request):
+    # odd and even sizes take different paths through the half spectrum
+    rows, cols = request.param
+    return cv2.resize(cv2.imread(IMAGE_PATH, cv2.IMREAD_GRAYSCALE), (cols, rows))
+
+
+def fft2_low_and_high_pass(image, radius):
+    # the original float64 path: full spectrum, circular masks, two inverse transforms
+    rows, cols = image.shape
+    spectrum = np.fft.fftshift(np.fft.fft2(image.astype(np.float64)))
+    x, y = np.ogrid[:rows, :cols]
+    mask = (x - rows // 2) ** 2 + (y - cols // 2) ** 2 <= radius ** 2
+    low_pass = np.fft.ifft2(np.fft.ifftshift(spectrum * mask))
+    high_pass = np.fft.ifft2(np.fft.ifftshift(spectrum * ~mask))
+    # saturated like the filters, rather than wrapped around past 255
+    return tuple(np.clip(np.abs(result), 0, 255).astype(np.uint8) for result in (low_pass, high_pass))
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_shifted_half_spectrum_matches_fft2(image, precision):
+    cols = image.shape[1]
+    expected = np.fft.fftshift(np.fft.fft2(image.astype(np.float64)), axes=0)[:, :cols // 2 + 1]
+    spectrum = shifted_half_spectrum(image, precision)
+
+    assert spectrum.dtype == (np.complex128 if precision == "double" else np.complex64)
+    error = np.abs(spectrum - expected).max() / np.abs(expected).max()
+    assert error <= SPECTRUM_RTOL[precision]
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+@pytest.mark.parametrize("radius", [5, 20, 60])
+def test_low_and_high_pass_matches_fft2(image, precision, radius):
+    for result, expected in zip(low_and_high_pass_filter(image, radius, precision),
+                                fft2_low_and_high_pass(image, radius)):
+        difference = np.abs(result.astype(np.int16) - expected)
+        assert difference.max() <= 1
+        assert (difference > 0).mean() <= FILTER_MISMATCH_FRACTION[precision]
+
+
+def assert_matches_direct(results, image, radius, precision):
+    for result, expected in zip(results, low_and_high_pass_filter(image, radius, precision)):
+        difference = np.abs(result.astype(np.int16) - expected)
+        assert difference.max() <= 1
+        assert (difference > 0).mean() <= FILTER_MISMATCH_FRACTION[precision]
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_filter_bank_sweeps_match_direct_filter(image, precision):
+    # every radius starts from the previous one, up and then down, so
+    # rounding errors of the running low-pass image add up over the sweep.
+    # Radii stay inside the spectrum: past its corner both paths give back
+    # the image itself, whose integer values truncate either way.
+    radii = np.random.default_rng(0).choice(np.arange(1, min(image.shape) // 2), 30, replace=False)
+    bank = FrequencyFilterBank(image, precision)
+    for radius in [*sorted(radii), *sorted(radii, reverse=True)[1:]]:
+        assert_matches_direct(bank._compute(radius), image, radius, precision)
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_filter_bank_precompute(image, precision):
+    bank = FrequencyFilterBank(image, precision)
+    bank.precompute(range(0, 120, 7), background=False)
+    for radius in (112, 7, 56):
+        assert_matches_direct(bank.low_and_high_pass(radius), image, radius, precision)
+
+
+@pytest.mark.parametrize("precision", ["double", "single"])
+def test_ringing_past_255_saturates(precision):
+    # the ringing at the edges of a white bar overshoots 255
+    step = np.zeros((64, 80), dtype=np.uint8)
+    step[:, 20:60] = 255
+    bank = FrequencyFilterBank(step, precision)
+    for radius in (6, 14, 10):
+        expected = fft2_low_and_high_pass(step, radius)
+        for results in (bank.low_and_high_pass(radius), low_and_high_pass_filter(step, radius, precision)):
+            for result, expected_result in zip(results, expected):
+                assert np.abs(result.astype(np.int16) - expected_result).max() <= 1
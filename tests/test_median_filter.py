@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from Noise_and_filter import apply_median_filter
+
+
+@pytest.mark.parametrize("ksize", [3, 4, 5, 9])
+@pytest.mark.parametrize("rows", [40, 7, 2], ids=["tall", "short", "fewer_rows_than_workers"])
+def test_bands_match_one_worker(rows, ksize):
+    # every band reads ksize - 1 rows of its neighbours, so the rows next to
+    # a seam are where a split can go wrong
+    image = np.random.default_rng(0).integers(0, 256, (rows, 23), dtype=np.uint8)
+    expected = apply_median_filter(image, ksize, workers=1)
+    for workers in (2, 3, 5):
+        assert np.array_equal(apply_median_filter(image, ksize, workers=workers), expected)
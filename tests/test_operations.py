@@ -0,0 +1,167 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import operations
+from operations import (REGISTRY, BackendUnsupported, backend_available, get_backend, get_operation,
+                        register, set_backend)
+
+CASES = [(operation, backend)
+         for operations_of_category in REGISTRY.values()
+         for operation in operations_of_category.values()
+         if operation.deterministic and 'reference' in operation.backends
+         for backend in operation.backends if backend != 'reference']
+
+
+@pytest.fixture
+def image():
+    # small, since the reference backends loop over every pixel in Python
+    return np.random.default_rng(0).integers(0, 256, (31, 40), dtype=np.uint8)
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = get_backend()
+    yield
+    set_backend(backend)
+
+
+@pytest.fixture
+def register_test():
+    # operations registered by a test are dropped after it
+    yield lambda name, **options: register("test", name, **options)
+    REGISTRY.pop("test", None)
+
+
+def run_backend(operation, backend, image, **params):
+    if not backend_available(backend):
+        pytest.skip(f"backend '{backend}' is not installed")
+    return operation.backends[backend](image, **params)
+
+
+def assert_equivalent(operation, result, expected):
+    if not isinstance(result, tuple):
+        result, expected = (result,), (expected,)
+    assert len(result) == len(expected)
+    for item, expected_item in zip(result, expected):
+        assert item.shape == expected_item.shape
+        assert item.dtype == expected_item.dtype
+        assert np.abs(item.astype(np.int16) - expected_item).max() <= operation.tolerance
+
+
+@pytest.mark.parametrize("operation, backend", [case for case in CASES if case[0].category != 'filter'],
+                         ids=lambda value: getattr(value, 'name', value))
+def test_backend_matches_reference(image, operation, backend):
+    result = run_backend(operation, backend, image)
+    assert_equivalent(operation, result, operation.backends['reference'](image))
+
+
+@pytest.mark.parametrize("ksize", [3, 4, 5, 9])
+@pytest.mark.parametrize("operation, backend", [case for case in CASES if case[0].category == 'filter'],
+                         ids=lambda value: getattr(value, 'name', value))
+def test_filter_backend_matches_reference(image, operation, backend, ksize):
+    try:
+        result = run_backend(operation, backend, image, ksize=ksize)
+    except BackendUnsupported:
+        pytest.skip(f"'{backend}' does not handle ksize={ksize}")
+    assert_equivalent(operation, result, operation.backends['reference'](image, ksize=ksize))
+
+
+def test_selected_backend_runs(image):
+    sobel = get_operation("edges", "Sobel")
+    for backend in ('reference', 'numpy', 'opencv'):
+        set_backend(backend)
+        sobel(image)
+        assert sobel.last_backend == backend
+
+
+def test_unsupported_input_falls_back(image):
+    median = get_operation("filter", "Median")
+    set_backend('opencv')
+    median(image, 5)
+    assert median.last_backend == 'opencv'
+    result = median(image, 4)
+    assert median.last_backend == 'numpy'
+    assert np.array_equal(result, median.backends['reference'](image, ksize=4))
+
+
+def test_unregistered_backend_falls_back(image):
+    canny = get_operation("edges", "Canny")
+    set_backend('numpy')
+    canny(image)
+    assert canny.last_backend == 'opencv'
+
+
+@pytest.mark.skipif(backend_available('jit'), reason="numba is installed")
+def test_missing_jit_falls_back(image):
+    average = get_operation("filter", "Average")
+    set_backend('jit')
+    average(image, 3)
+    assert average.last_backend == 'numpy'
+
+
+def test_missing_module_falls_back_and_is_remembered(image, register_test, monkeypatch):
+    def missing(image):
+        raise ImportError("no such module")
+
+    operation = register_test("Missing")
+    operation.backend('jit')(missing)
+    operation.backend('numpy')(lambda image: image)
+    # pretend the jit module is installed until the backend fails to import it
+    monkeypatch.setitem(operations.BACKEND_MODULES, 'jit', None)
+    monkeypatch.setattr(operations, '_state', {'backend': 'jit', 'missing': set()})
+
+    assert operation(image) is image
+    assert operation.last_backend == 'numpy'
+    assert not backend_available('jit')
+
+
+def test_no_backend_can_run(image, register_test):
+    def unsupported(image):
+        raise BackendUnsupported()
+
+    operation = register_test("Unsupported")
+    operation.backend('numpy')(unsupported)
+    with pytest.raises(ValueError):
+        operation(image)
+
+
+def test_real_errors_are_not_swallowed(image, register_test):
+    def broken(image):
+        raise NotImplementedError()
+
+    operation = register_test("Broken")
+    operation.backend('numpy')(broken)
+    operation.backend('reference')(lambda image: image)
+    with pytest.raises(NotImplementedError):
+        operation(image)
+
+
+def test_invalid_names():
+    with pytest.raises(ValueError):
+        get_operation("filter", "Bilateral")
+    with pytest.raises(ValueError):
+        set_backend("cuda")
+    with pytest.raises(ValueError):
+        register("filter", "Median")
+
+
+def test_invalid_environment_backend_falls_back():
+    # a fresh interpreter, since the environment is read when the module is imported
+    result = subprocess.run([sys.executable, "-c", "import operations; print(operations.get_backend())"],
+                            cwd=os.path.dirname(operations.__file__), capture_output=True, text=True,
+                            env=dict(os.environ, OPERATION_BACKEND="cuda"))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "numpy"
+    assert "Invalid backend 'cuda'" in result.stderr
+
+
+def test_declared_params_and_labels():
+    salt_and_pepper = get_operation("noise", "Salt and Pepper")
+    assert [param.from_slider(5) for param in salt_and_pepper.params] == [0.05, 0.05]
+    assert get_operation("noise", "Gaussian").params[1].minimum == 1
+    assert get_operation("edges", "Canny").labels == ("Gradient ", "Output_2")
+    assert all(len(operation.labels) == 2 for operation in REGISTRY["edges"].values())